@@ -3,43 +3,82 @@ SignalScan Enhanced - Full US Market Scanner
 Version 12.0 - No Volume Filter + Auto-Enrich + News-Trigger
 """
 
-from kivy.app import App
-from kivy.uix.boxlayout import BoxLayout
-from kivy.uix.button import Button
-from kivy.uix.label import Label
-from kivy.uix.scrollview import ScrollView
-from kivy.uix.popup import Popup
-from kivy.uix.image import Image
-from kivy.graphics import Color, Rectangle
-from kivy.clock import Clock
-from kivy.config import Config
-from kivy.core.window import Window
-import pygame.mixer
+import time
+_STARTUP_T0 = time.perf_counter()
+import os
+import sys
+import multiprocessing
+# Tier 1 worker processes (spawn) re-import this module - keep window/log side effects in the main process
+IS_MAIN_PROCESS = multiprocessing.parent_process() is None
+# Headless engine (python 193.py --headless, or SIGNALSCAN_HEADLESS=1): no Kivy, pygame or tkinter import
+HEADLESS = '--headless' in sys.argv or os.getenv('SIGNALSCAN_HEADLESS') == '1'
+GUI_ENABLED = IS_MAIN_PROCESS and not HEADLESS
+if GUI_ENABLED:
+    from kivy.app import App
+    from kivy.uix.boxlayout import BoxLayout
+    from kivy.uix.button import Button
+    from kivy.uix.label import Label
+    from kivy.uix.scrollview import ScrollView
+    from kivy.uix.recycleview import RecycleView
+    from kivy.uix.recycleview.views import RecycleDataViewBehavior
+    from kivy.uix.recycleboxlayout import RecycleBoxLayout
+    from kivy.factory import Factory
+    from kivy.uix.popup import Popup
+    from kivy.uix.image import Image
+    from kivy.graphics import Color, Rectangle
+    from kivy.clock import Clock
+    from kivy.config import Config
+    from kivy.core.window import Window
+    import pygame.mixer
+    import webbrowser
+    import tkinter as tk
+    from tkinter import Toplevel
+else:
+    class _GuiBase:
+        """Base for the GUI classes when Kivy is not imported; they are defined but never instantiated"""
+
+    class RecycleDataViewBehavior:
+        """See _GuiBase"""
+
+    App = BoxLayout = _GuiBase
 import datetime
 import pytz
-import os
 import json
-import webbrowser
+import sqlite3
+import hashlib
 from urllib.parse import urlparse
 from dotenv import load_dotenv
 import threading
-import time
+import heapq
+import bisect
+from collections import deque
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import numpy as np
 import pandas as pd
 import yfinance as yf
 import xml.etree.ElementTree as ET
 from email.utils import parsedate_to_datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
 import websocket
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+try:
+    import ahocorasick  # pyahocorasick (C); KeywordMatcher falls back to pure Python without it
+except ImportError:
+    ahocorasick = None
 import ssl
 import queue
 import random
 import logging
-import tkinter as tk
-from tkinter import Toplevel
 # Silence yfinance debug spam
 logging.getLogger('yfinance').setLevel(logging.WARNING)
 logging.getLogger('peewee').setLevel(logging.WARNING)  # Also silence yfinance's database
+IMPORT_SECONDS = time.perf_counter() - _STARTUP_T0
 
 
 load_dotenv()
@@ -47,44 +86,49 @@ ALPACA_API_KEY = os.getenv("ALPACA_API_KEY")
 ALPACA_SECRET_KEY = os.getenv("ALPACA_SECRET_KEY")
 TRADIER_ACCESS_TOKEN = os.getenv("TRADIER_ACCESS_TOKEN")
 
-# Setup news debug logger
+# Debug loggers (file handlers are added by setup_logging())
 news_logger = logging.getLogger('news_debug')
 news_logger.setLevel(logging.DEBUG)
-log_filename = f"news_debug_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-file_handler = logging.FileHandler(log_filename)
-file_handler.setLevel(logging.DEBUG)
-formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-file_handler.setFormatter(formatter)
-news_logger.addHandler(file_handler)
-print(f"[NEWS DEBUG] Logging to: {log_filename}")
-# HALT DEBUG Logger
 halt_logger = logging.getLogger("halt_debug")
 halt_logger.setLevel(logging.DEBUG)
-halt_log_filename = f"halt_debug_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-halt_filehandler = logging.FileHandler(halt_log_filename)
-halt_filehandler.setLevel(logging.DEBUG)
-halt_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-halt_filehandler.setFormatter(halt_formatter)
-halt_logger.addHandler(halt_filehandler)
-print(f"[HALT DEBUG] Logging to {halt_log_filename}")
-
-# SCANNER DEBUG Logger
 scanner_logger = logging.getLogger("scanner_debug")
 scanner_logger.setLevel(logging.DEBUG)
-scanner_log_filename = f"scanner_debug_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-scanner_filehandler = logging.FileHandler(scanner_log_filename)
-scanner_filehandler.setLevel(logging.DEBUG)
-scanner_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-scanner_filehandler.setFormatter(scanner_formatter)
-scanner_logger.addHandler(scanner_filehandler)
-print(f"[SCANNER DEBUG] Logging to {scanner_log_filename}")
-
-Config.set('graphics', 'fullscreen', '0')
-Config.set('graphics', 'borderless', '0')
-Config.set('graphics', 'resizable', '1')
-Config.set('graphics', 'width', '1400')
-Config.set('graphics', 'height', '900')
-Config.write()
+
+# Debug log files are opened by the entry point (GUI or headless), not on import
+def setup_logging():
+    # Setup news debug logger
+    log_filename = f"news_debug_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+    file_handler = logging.FileHandler(log_filename)
+    file_handler.setLevel(logging.DEBUG)
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    file_handler.setFormatter(formatter)
+    news_logger.addHandler(file_handler)
+    print(f"[NEWS DEBUG] Logging to: {log_filename}")
+    # HALT DEBUG Logger
+    halt_log_filename = f"halt_debug_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+    halt_filehandler = logging.FileHandler(halt_log_filename)
+    halt_filehandler.setLevel(logging.DEBUG)
+    halt_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    halt_filehandler.setFormatter(halt_formatter)
+    halt_logger.addHandler(halt_filehandler)
+    print(f"[HALT DEBUG] Logging to {halt_log_filename}")
+
+    # SCANNER DEBUG Logger
+    scanner_log_filename = f"scanner_debug_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+    scanner_filehandler = logging.FileHandler(scanner_log_filename)
+    scanner_filehandler.setLevel(logging.DEBUG)
+    scanner_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    scanner_filehandler.setFormatter(scanner_formatter)
+    scanner_logger.addHandler(scanner_filehandler)
+    print(f"[SCANNER DEBUG] Logging to {scanner_log_filename}")
+
+def configure_window():
+    Config.set('graphics', 'fullscreen', '0')
+    Config.set('graphics', 'borderless', '0')
+    Config.set('graphics', 'resizable', '1')
+    Config.set('graphics', 'width', '1400')
+    Config.set('graphics', 'height', '900')
+    Config.write()
 
 NY_TZ = pytz.timezone('America/New_York')
 
@@ -96,7 +140,65 @@ PRICE_CACHE_FILE = os.path.join(CACHE_DIR, "yesterday_prices.json")
 PRICE_HISTORY_FILE = os.path.join(CACHE_DIR, "price_history.json")
 TICKER_METADATA_FILE = os.path.join(CACHE_DIR, "ticker_metadata.json")
 MAINTENANCE_LOG_FILE = os.path.join(CACHE_DIR, "maintenance_log.json")
-NEWS_VAULT_FILE = os.path.join(CACHE_DIR, 'news_vault.json')
+NEWS_VAULT_FILE = os.path.join(CACHE_DIR, 'news_vault.json')  # legacy JSON vault, migrated once into NEWS_VAULT_DB
+NEWS_VAULT_DB = os.path.join(CACHE_DIR, 'news_vault.db')
+ELIGIBILITY_INDEX_FILE = os.path.join(CACHE_DIR, "eligibility_index.json")
+
+# Fundamentals TTLs (seconds) - each field in ticker_metadata.json ages out on its own schedule
+FUNDAMENTALS_TTL = {
+    'avg_volume': 24 * 3600,
+    'week52_high': 24 * 3600,
+    'week52_low': 24 * 3600,
+    'float_shares': 7 * 24 * 3600,
+    'shares_outstanding': 7 * 24 * 3600,
+}
+FUNDAMENTALS_CHUNK_SIZE = 500
+FUNDAMENTALS_INFO_WORKERS = 8
+
+# Tier 1 prefilter gates
+TIER1_PRICE_MIN = 1.0
+TIER1_PRICE_MAX = 10.0
+TIER1_MIN_AVG_VOLUME = 2_000_000
+TIER1_MIN_GAP_PCT = 0.0  # abs gap vs previous close; 0 disables the gate
+
+# Eligibility index (built nightly) - slack widens the Tier 1 gates so intraday band crossers stay in
+ELIGIBILITY_PRICE_SLACK = 0.5    # prev close within [min*(1-slack), max*(1+slack)]
+ELIGIBILITY_VOLUME_SLACK = 0.5   # avg volume >= TIER1_MIN_AVG_VOLUME * slack
+TIER1_ROTATION_SIZE = 500        # non-eligible tickers swept per pass
+
+# Tier 1 chunk pipeline
+TIER1_CHUNK_SIZE = 500
+TIER1_MAX_IN_FLIGHT = 4          # worker processes = chunk downloads in flight
+TIER1_CHUNK_RATE = 0.5           # chunk requests/sec across all workers (global limiter)
+TIER1_CHUNK_BURST = 4
+TIER1_ERROR_BACKOFF = 10         # seconds the limiter holds all workers after a failed chunk
+TIER2_MAX_SYMBOLS = 500          # live Alpaca subscription cap
+MINUTE_BARS_OVERLAP = 120        # seconds re-requested before the last fetch (late/forming bars)
+
+# Priority scan scheduler - per-class (symbols/sec, burst) budgets and how long dispatched symbols stay pinned in Tier 2
+SCAN_CLASS_BUDGETS = {'news': (2.0, 20), 'enriched': (5.0, 200)}
+SCAN_PIN_SECONDS = {'news': 3600, 'enriched': 1800}
+ENRICHED_REFRESH_INTERVAL = 60
+TIER2_PRIORITY_MAX_SYMBOLS = 150  # pinned priority symbols Tier 2 will hold (admitted past TIER2_MAX_SYMBOLS)
+
+# Tier 2 validation: a wave of newly subscribed symbols completes when this fraction has quoted
+# or its deadline passes; quoted symbols are forwarded to Tier 3 as they arrive
+TIER2_VALIDATION_COVERAGE = 0.8
+TIER2_VALIDATION_DEADLINE = 30
+TIER2_PRIORITY_VALIDATION_DEADLINE = 3
+TIER2_FORWARD_INTERVAL = 0.5     # seconds between rolling Tier 3 batches
+TIER3_MAX_SYMBOLS = 375
+QUICK_MOVE_WINDOWS = (300, 600)  # seconds - 5% in 5min / 10% in 10min
+QUICK_MOVE_COOLDOWN = 120        # seconds a fired quick-move alert stays quiet
+QUICK_MOVE_REARM_PCT = 2.0       # after cooldown, a new high this far beyond the fired price re-arms
+CATEGORIZER_QUEUE_SIZE = 2000    # tick snapshots buffered for the categorizer; oldest dropped when full
+CATEGORY_CHANNELS = ["PreGap", "HOD", "RunUp", "P-HOD", "P-RunUp", "Rvsl", "BKG-News"]
+
+# Alpaca streams
+ALPACA_DATA_STREAM_URL = "wss://stream.data.alpaca.markets/v2/iex"
+ALPACA_NEWS_STREAM_URL = "wss://stream.data.alpaca.markets/v1beta1/news"
+ALPACA_STREAM_RECONNECT = 5      # seconds between reconnect attempts
+ALPACA_STREAM_FORMAT = os.getenv("ALPACA_STREAM_FORMAT", "msgpack")  # "msgpack" or "json"
 
 if not os.path.exists(CACHE_DIR):
     os.makedirs(CACHE_DIR)
@@ -106,7 +208,392 @@ if not os.path.exists(BACKUP_DIR):
     os.makedirs(BACKUP_DIR)
     print(f"[CACHE] Created backup directory: {BACKUP_DIR}")
 
+UI_BUS_REPORT_INTERVAL = 60  # seconds between UI bus metric log lines
+
+class UIUpdateBus:
+    """
+    Coalescing mailbox between producer threads and the Kivy main loop.
+    post(key, callback, *args) keeps only the newest (callback, args) per key;
+    one per-frame Clock callback drains the mailbox and applies them, so a symbol
+    ticking 50 times between frames costs one GUI update instead of 50 closures.
+    Metrics: mailbox depth, drain time and coalesced (dropped-as-stale) updates.
+    """
+    def __init__(self):
+        self.mailbox = {}
+        self.lock = threading.Lock()
+        self.event = None
+        self.last_report = time.time()
+        self.metrics = {'posted': 0, 'coalesced': 0, 'applied': 0, 'errors': 0, 'frames': 0,
+                        'depth': 0, 'max_depth': 0, 'last_drain_ms': 0.0, 'max_drain_ms': 0.0}
+
+    def start(self):
+        if self.event is None:
+            self.event = Clock.schedule_interval(self.drain, 0)  # every frame
+
+    def post(self, key, callback, *args):
+        with self.lock:
+            if key in self.mailbox:
+                self.metrics['coalesced'] += 1
+            self.mailbox[key] = (callback, args)
+            self.metrics['posted'] += 1
+            self.metrics['depth'] = len(self.mailbox)
+
+    def drain(self, dt=None):
+        with self.lock:
+            pending, self.mailbox = self.mailbox, {}
+            self.metrics['depth'] = 0
+        if pending:
+            start = time.perf_counter()
+            for callback, args in pending.values():
+                try:
+                    callback(*args)
+                except Exception as e:
+                    self.metrics['errors'] += 1
+                    print(f"[UI-BUS] Update error: {e}")
+            drain_ms = (time.perf_counter() - start) * 1000
+            self.metrics['frames'] += 1
+            self.metrics['applied'] += len(pending)
+            self.metrics['last_drain_ms'] = drain_ms
+            self.metrics['max_drain_ms'] = max(self.metrics['max_drain_ms'], drain_ms)
+            self.metrics['max_depth'] = max(self.metrics['max_depth'], len(pending))
+        if time.time() - self.last_report >= UI_BUS_REPORT_INTERVAL:
+            self.last_report = time.time()
+            m = self.metrics
+            scanner_logger.info(f"[UI-BUS] posted={m['posted']} applied={m['applied']} coalesced={m['coalesced']} "
+                                f"max_depth={m['max_depth']} max_drain={m['max_drain_ms']:.1f}ms frames={m['frames']}")
+            m['max_depth'] = 0
+            m['max_drain_ms'] = 0.0
+
+ui_bus = UIUpdateBus()
+
+HTTP_POOL_MAXSIZE = 8           # keep-alive connections kept per host
+HTTP_DEFAULT_TIMEOUT = (3.05, 10)  # (connect, read) seconds
+HTTP_HOST_TIMEOUTS = {
+    'api.perplexity.ai': (3.05, 30),  # LLM answers take longer than quote/news APIs
+}
+HTTP_RETRIES = 2                 # retries on connect errors / 5xx for idempotent methods, with backoff
+HTTP_RETRY_BACKOFF = 0.5
+HTTP_LATENCY_WINDOW = 512        # recent requests per provider kept for p50/p99
+HTTP_REPORT_INTERVAL = 300       # seconds between HTTP metric log lines
+
+class HttpClient:
+    """
+    Shared HTTP layer for provider REST calls: one requests.Session per host, so
+    DNS/TCP/TLS setup is paid once and later calls reuse keep-alive connections.
+    Each session has a bounded pool, a Retry policy (connect errors and 5xx on
+    GET only - 429s are left to the callers' provider caps) and a per-host default
+    timeout. Tracks per-provider p50/p99 latency and per-host connection reuse.
+    """
+    def __init__(self):
+        self.sessions = {}
+        self.lock = threading.Lock()
+        self.latency = {}  # provider -> deque of recent latencies (ms)
+        self.counts = {}   # provider -> {'requests', 'errors'}
+        self.last_report = time.time()
+
+    def session(self, host):
+        with self.lock:
+            sess = self.sessions.get(host)
+            if sess is None:
+                retry = Retry(total=HTTP_RETRIES, backoff_factor=HTTP_RETRY_BACKOFF,
+                              status_forcelist=(500, 502, 503, 504), allowed_methods=frozenset(['GET']),
+                              raise_on_status=False)
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=retry)
+                sess = requests.Session()
+                sess.mount('https://', adapter)
+                sess.mount('http://', adapter)
+                self.sessions[host] = sess
+            return sess
+
+    def request(self, method, url, provider=None, **kwargs):
+        host = urlparse(url).netloc
+        provider = provider or host
+        kwargs.setdefault('timeout', HTTP_HOST_TIMEOUTS.get(host, HTTP_DEFAULT_TIMEOUT))
+        start = time.perf_counter()
+        ok = False
+        try:
+            response = self.session(host).request(method, url, **kwargs)
+            ok = True
+            return response
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            with self.lock:
+                if provider not in self.latency:
+                    self.latency[provider] = deque(maxlen=HTTP_LATENCY_WINDOW)
+                    self.counts[provider] = {'requests': 0, 'errors': 0}
+                self.latency[provider].append(elapsed_ms)
+                self.counts[provider]['requests'] += 1
+                self.counts[provider]['errors'] += not ok
+                due = time.time() - self.last_report >= HTTP_REPORT_INTERVAL
+                if due:
+                    self.last_report = time.time()
+            if due:
+                for line in self.report():
+                    news_logger.info(line)
+
+    def get(self, url, provider=None, **kwargs):
+        return self.request('GET', url, provider, **kwargs)
+
+    def post(self, url, provider=None, **kwargs):
+        return self.request('POST', url, provider, **kwargs)
+
+    def connection_stats(self, host):
+        """(connections opened, requests sent) across the host's urllib3 pools"""
+        sess = self.sessions.get(host)
+        if sess is None:
+            return 0, 0
+        pools = sess.get_adapter(f"https://{host}").poolmanager.pools
+        opened = sent = 0
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is not None:
+                opened += pool.num_connections
+                sent += pool.num_requests
+        return opened, sent
+
+    def report(self):
+        lines = []
+        with self.lock:
+            providers = {p: (sorted(lat), dict(self.counts[p])) for p, lat in self.latency.items()}
+            hosts = list(self.sessions)
+        for provider, (lat, counts) in sorted(providers.items()):
+            p50 = lat[len(lat) // 2]
+            p99 = lat[min(len(lat) - 1, int(len(lat) * 0.99))]
+            lines.append(f"[HTTP] {provider}: {counts['requests']} requests, {counts['errors']} errors, "
+                         f"p50={p50:.0f}ms p99={p99:.0f}ms")
+        for host in sorted(hosts):
+            opened, sent = self.connection_stats(host)
+            reuse = 1 - opened / sent if sent else 0.0
+            lines.append(f"[HTTP] {host}: {opened} connections for {sent} requests ({reuse:.0%} reused)")
+        return lines
+
+http_client = HttpClient()
+
+HEADLESS_DISPATCH_INTERVAL = 0.05  # seconds between headless ui_bus drains / delayed-call checks
+
+class EventSink:
+    """
+    How engine threads reach the front end in place of direct Kivy Clock/App calls:
+    start() begins draining ui_bus, call_later() runs a delayed callback on the front
+    end's thread and live_channels() returns the displayed channel rows (or None).
+    This default is the Kivy GUI; run_headless() installs HeadlessEventSink.
+    """
+    def start(self):
+        ui_bus.start()
+
+    def stop(self):
+        pass
+
+    def call_later(self, delay, callback, *args):
+        Clock.schedule_once(lambda dt: callback(*args), delay)
+
+    def live_channels(self):
+        app = App.get_running_app()
+        return getattr(getattr(app, 'root', None), 'live_data', None)
+
+class HeadlessEventSink(EventSink):
+    """A dispatcher thread drains ui_bus and runs delayed calls; channel rows come from the HeadlessEngine"""
+    def __init__(self, engine, interval=HEADLESS_DISPATCH_INTERVAL):
+        self.engine = engine
+        self.interval = interval
+        self.timers = []
+        self.timer_seq = 0
+        self.lock = threading.Lock()
+        self.running = False
+
+    def start(self):
+        self.running = True
+        threading.Thread(target=self._dispatch_loop, daemon=True).start()
+
+    def stop(self):
+        self.running = False
+
+    def call_later(self, delay, callback, *args):
+        with self.lock:
+            self.timer_seq += 1
+            heapq.heappush(self.timers, (time.time() + delay, self.timer_seq, callback, args))
+
+    def live_channels(self):
+        return self.engine.live_data
+
+    def _dispatch_loop(self):
+        while self.running:
+            ui_bus.drain()
+            due = []
+            with self.lock:
+                while self.timers and self.timers[0][0] <= time.time():
+                    due.append(heapq.heappop(self.timers))
+            for _, _, callback, args in due:
+                try:
+                    callback(*args)
+                except Exception as e:
+                    print(f"[HEADLESS] Delayed call error: {e}")
+            time.sleep(self.interval)
+
+event_sink = EventSink()
+
+def set_event_sink(sink):
+    global event_sink
+    event_sink = sink
+
+RENDER_INTERVAL = 0.25          # seconds between render scheduler flushes
+RENDER_REPORT_INTERVAL = 60     # seconds between render metric log lines
+
+class RenderScheduler:
+    """
+    Change-driven redraws for the channel table and tabs.
+    Producers mark what changed - a whole channel (membership or order), single rows
+    (values, news button) or breaking-news flashes - and flush() redraws only those
+    parts of the current channel, rows whose age-color bucket just turned
+    (advance_timestamp_buckets()), and tabs whose breaking-news count changed.
+    Per-channel breaking counts are recounted only for channels touched by a change,
+    so a quiet market costs one empty flush per interval. Flashing rows/tabs blink
+    while any exist. flash_changed() and mark_symbol() may be called from any thread.
+    """
+    def __init__(self):
+        self.app = None
+        self.event = None
+        self.dirty_channels = set()
+        self.dirty_rows = {}
+        self.dirty_tabs = set()
+        self.dirty_counts = set()
+        self.breaking = {}           # channel -> symbols in it with an active breaking flash
+        self.flash_pending = set()
+        self.symbol_pending = set()  # mark_symbol() calls, expanded to rows in flush()
+        self.lock = threading.Lock()
+        self.phase = None
+        self.last_report = time.time()
+        self.stats = {'redraws': 0, 'row_redraws': 0, 'tab_redraws': 0, 'skipped': 0}
+
+    def start(self, app):
+        self.app = app
+        self.mark_all()
+        if self.event is None:
+            self.event = Clock.schedule_interval(self.flush, RENDER_INTERVAL)
+
+    def mark_channel(self, channel):
+        """Membership or ordering of channel changed"""
+        self.dirty_channels.add(channel)
+        self.dirty_counts.add(channel)
+
+    def mark_row(self, channel, symbol):
+        self.dirty_rows.setdefault(channel, set()).add(symbol)
+
+    def mark_symbol(self, symbol):
+        """symbol's row changed wherever it is listed (e.g. its news button)"""
+        with self.lock:
+            self.symbol_pending.add(symbol)
+
+    def _mark_symbol_rows(self, symbol):
+        for channel, rows in self.app.live_data.items():
+            if self._contains(rows, symbol):
+                self.mark_row(channel, symbol)
+
+    def mark_tabs(self):
+        self.dirty_tabs.update(self.app.live_data.keys())
+
+    def mark_all(self):
+        if self.app:
+            for channel in self.app.live_data:
+                self.mark_channel(channel)
+            self.mark_tabs()
+
+    def flash_changed(self, symbol):
+        with self.lock:
+            self.flash_pending.add(symbol)
+
+    @staticmethod
+    def _contains(rows, symbol):
+        if isinstance(rows, ChannelIndex):
+            return symbol in rows
+        return any(r[0] == symbol for r in rows)
+
+    def _recount(self, channel):
+        rows = self.app.live_data.get(channel, [])
+        symbols = rows.rows.keys() if isinstance(rows, ChannelIndex) else {r[0] for r in rows}
+        flashing = {s for s in symbols if has_breaking_news_flash(s)}
+        if bool(flashing) != bool(self.breaking.get(channel)):
+            self.dirty_tabs.add(channel)
+        self.breaking[channel] = flashing
+
+    def breaking_count(self, channel):
+        return len(self.breaking.get(channel, ()))
+
+    def flush(self, dt=None):
+        app = self.app
+        if app is None:
+            return
+        with self.lock:
+            flashes, self.flash_pending = self.flash_pending, set()
+            symbols, self.symbol_pending = self.symbol_pending, set()
+        for symbol in symbols:
+            self._mark_symbol_rows(symbol)
+        for symbol in flashes:
+            for channel, rows in app.live_data.items():
+                if symbol in self.breaking.get(channel, ()) or self._contains(rows, symbol):
+                    self.dirty_counts.add(channel)
+                    self.mark_row(channel, symbol)
+        for channel in self.dirty_counts:
+            self._recount(channel)
+        self.dirty_counts = set()
+        # Rows whose age color bucket changed since the last flush
+        for symbol in advance_timestamp_buckets():
+            self._mark_symbol_rows(symbol)
+
+        # Blink phase: only flashing rows of the current channel and flashing tabs redraw
+        phase = int(time.time() * 2) % 2 == 0
+        if phase != self.phase:
+            self.phase = phase
+            for channel, flashing in self.breaking.items():
+                if not flashing:
+                    continue
+                if channel == app.current_channel:
+                    for symbol in flashing:
+                        self.mark_row(channel, symbol)
+                else:
+                    self.dirty_tabs.add(channel)
+
+        current = app.current_channel
+        rows = self.dirty_rows.get(current)
+        redrew = False
+        if current in self.dirty_channels:
+            app.refresh_data_table()
+            self.stats['redraws'] += 1
+            redrew = True
+        elif rows:
+            app.refresh_table_rows(rows)
+            self.stats['row_redraws'] += len(rows)
+            redrew = True
+        for channel in self.dirty_tabs:
+            app.style_channel_tab(channel, phase)
+            self.stats['tab_redraws'] += 1
+        if not redrew and not self.dirty_tabs:
+            self.stats['skipped'] += 1
+        # Other channels redraw in full when selected
+        self.dirty_channels = set()
+        self.dirty_rows = {}
+        self.dirty_tabs = set()
+
+        if time.time() - self.last_report >= RENDER_REPORT_INTERVAL:
+            self.last_report = time.time()
+            s = self.stats
+            scanner_logger.info(f"[RENDER] redraws={s['redraws']} row_redraws={s['row_redraws']} "
+                                f"tab_redraws={s['tab_redraws']} skipped={s['skipped']}")
+
+render_scheduler = RenderScheduler()
+
 ticker_timestamp_registry = {}
+# Row age colors: (minutes since first seen, color until then); past the last boundary -> TIMESTAMP_COLOR_EXPIRED
+TIMESTAMP_COLOR_BUCKETS = [
+    (30, (0, 0, 1, 0.3)),    # Blue - Less than 30 minutes
+    (60, (1, 0, 1, 0.3)),    # Magenta - 30 to 60 minutes
+    (120, (0, 1, 1, 0.3)),   # Cyan - 1 to 2 hours
+    (180, (0, 0, 0, 0.3)),   # Black - 2 to 3 hours
+]
+TIMESTAMP_COLOR_EXPIRED = (0.5, 0.5, 0.5, 0.3)  # Mid-grey - 3+ hours
+# Upcoming bucket transitions: (due epoch, symbol, registration datetime, next bucket)
+timestamp_transitions = []
+timestamp_lock = threading.Lock()
 # Track halt resumption alerts
 halt_resumption_alerts = {}  # {symbol_halttime: {'symbol': '...', 'halt_time': '...', 'alerted': False}}
 
@@ -118,9 +605,32 @@ def register_ticker_timestamp(symbol):
             hour = 12
         ampm = "AM" if ts.hour < 12 else "PM"
         display_str = f"{hour}:{ts.strftime('%M:%S')} {ampm}"
-        ticker_timestamp_registry[symbol] = {'datetime': ts, 'display': display_str}
+        with timestamp_lock:
+            ticker_timestamp_registry[symbol] = {'datetime': ts, 'display': display_str, 'bucket': 0}
+            _push_timestamp_transition(symbol, ts, 0)
     return ticker_timestamp_registry[symbol]
 
+def _push_timestamp_transition(symbol, ts, bucket):
+    """Schedule the move out of bucket (caller holds timestamp_lock)"""
+    if bucket < len(TIMESTAMP_COLOR_BUCKETS):
+        due = ts.timestamp() + TIMESTAMP_COLOR_BUCKETS[bucket][0] * 60
+        heapq.heappush(timestamp_transitions, (due, symbol, ts, bucket + 1))
+
+def advance_timestamp_buckets(now=None):
+    """Apply every bucket transition that is due; returns the symbols whose row color changed"""
+    now = now or time.time()
+    changed = []
+    with timestamp_lock:
+        while timestamp_transitions and timestamp_transitions[0][0] <= now:
+            _, symbol, ts, bucket = heapq.heappop(timestamp_transitions)
+            entry = ticker_timestamp_registry.get(symbol)
+            if entry is None or entry['datetime'] != ts:
+                continue  # registry was reset since this was scheduled
+            entry['bucket'] = bucket
+            _push_timestamp_transition(symbol, ts, bucket)
+            changed.append(symbol)
+    return changed
+
 def get_timestamp_display(symbol):
     if symbol in ticker_timestamp_registry:
         return ticker_timestamp_registry[symbol]['display']
@@ -128,32 +638,136 @@ def get_timestamp_display(symbol):
     return ticker_timestamp_registry[symbol]['display']
 
 def get_timestamp_color(symbol):
-    if symbol not in ticker_timestamp_registry:
+    entry = ticker_timestamp_registry.get(symbol)
+    if entry is None:
         return (0, 0.8, 0, 0.3)
-    timestamp = ticker_timestamp_registry[symbol]['datetime']
-    now = datetime.datetime.now()
-    elapsed_minutes = (now - timestamp).total_seconds() / 60
-    if elapsed_minutes < 30:  # Blue - Less than 30 minutes
-        return (0, 0, 1, 0.3)
-    elif elapsed_minutes < 60:  # Magenta - 30 to 60 minutes
-        return (1, 0, 1, 0.3)
-    elif elapsed_minutes < 120:  # Cyan - 1 to 2 hours
-        return (0, 1, 1, 0.3)
-    elif elapsed_minutes < 180:  # Black - 2 to 3 hours
-        return (0, 0, 0, 0.3)
-    else:
-        return (0.5, 0.5, 0.5, 0.3)  # Mid-grey - 3+ hours
+    bucket = entry['bucket']  # kept current by advance_timestamp_buckets()
+    return TIMESTAMP_COLOR_BUCKETS[bucket][1] if bucket < len(TIMESTAMP_COLOR_BUCKETS) else TIMESTAMP_COLOR_EXPIRED
+
+# Dedup window for article IDs / breaking-news sounds - matches the 72h news vault
+NEWS_DEDUP_TTL_HOURS = 72
+NEWS_DEDUP_GENERATIONS = 6  # 12h per generation
+
+class TTLDedup:
+    """
+    Time-bounded "seen before?" set. Keys are hashed to 64-bit ints (blake2b) so long
+    URLs cost a fixed few bytes, and are kept in a ring of generation sets that each
+    cover ttl/generations seconds; the oldest generation is dropped whole when a new
+    one opens, so memory tracks the ingest rate over the window instead of uptime.
+    A key is remembered for between ttl*(generations-1)/generations and ttl seconds.
+    bloom_bits > 0 puts a per-generation Bloom filter in front of each set so misses
+    skip the set probe. Thread-safe.
+    """
+    BLOOM_HASHES = 4
+
+    def __init__(self, ttl_seconds, generations=NEWS_DEDUP_GENERATIONS, bloom_bits=0, name='dedup'):
+        self.name = name
+        self.ttl = ttl_seconds
+        self.span = ttl_seconds / generations
+        self.generations = generations
+        self.bloom_bits = bloom_bits
+        self.lock = threading.Lock()
+        self.ring = deque()  # (start_time, keys, bloom) - newest last
+        self.stats = {'lookups': 0, 'hits': 0, 'adds': 0, 'expired': 0, 'bloom_skips': 0}
+        self._open_generation(time.time())
+
+    @staticmethod
+    def _hash(key):
+        return int.from_bytes(hashlib.blake2b(str(key).encode('utf-8', 'replace'), digest_size=8).digest(), 'little')
+
+    def _bloom_positions(self, h):
+        h1, h2 = h & 0xFFFFFFFF, (h >> 32) | 1
+        return [(h1 + i * h2) % self.bloom_bits for i in range(self.BLOOM_HASHES)]
+
+    def _open_generation(self, now):
+        bloom = bytearray((self.bloom_bits + 7) // 8) if self.bloom_bits else None
+        self.ring.append((now, set(), bloom))
+        while len(self.ring) > self.generations:
+            self.stats['expired'] += len(self.ring.popleft()[1])
+
+    def _rotate(self, now):
+        # Drop generations by age too, so keys do not outlive the TTL after an idle gap
+        cutoff = now - self.ttl
+        while self.ring and self.ring[0][0] < cutoff:
+            self.stats['expired'] += len(self.ring.popleft()[1])
+        if not self.ring or now - self.ring[-1][0] >= self.span:
+            self._open_generation(now)
+
+    def _contains(self, h):
+        positions = self._bloom_positions(h) if self.bloom_bits else None
+        for _, keys, bloom in reversed(self.ring):
+            if bloom is not None and not all(bloom[p >> 3] & (1 << (p & 7)) for p in positions):
+                self.stats['bloom_skips'] += 1
+                continue
+            if h in keys:
+                return True
+        return False
+
+    def _insert(self, h):
+        _, keys, bloom = self.ring[-1]
+        keys.add(h)
+        if bloom is not None:
+            for p in self._bloom_positions(h):
+                bloom[p >> 3] |= 1 << (p & 7)
+        self.stats['adds'] += 1
+
+    def __contains__(self, key):
+        h = self._hash(key)
+        with self.lock:
+            self._rotate(time.time())
+            self.stats['lookups'] += 1
+            hit = self._contains(h)
+            self.stats['hits'] += hit
+            return hit
+
+    def add(self, key):
+        h = self._hash(key)
+        with self.lock:
+            self._rotate(time.time())
+            if not self._contains(h):
+                self._insert(h)
+
+    def check_and_add(self, key):
+        """True if key was already seen inside the window; otherwise records it and returns False"""
+        h = self._hash(key)
+        with self.lock:
+            self._rotate(time.time())
+            self.stats['lookups'] += 1
+            if self._contains(h):
+                self.stats['hits'] += 1
+                return True
+            self._insert(h)
+            return False
+
+    def clear(self):
+        with self.lock:
+            self.ring.clear()
+            self._open_generation(time.time())
+
+    def __len__(self):
+        with self.lock:
+            return sum(len(keys) for _, keys, _ in self.ring)
+
+    def hit_rate(self):
+        return self.stats['hits'] / self.stats['lookups'] if self.stats['lookups'] else 0.0
+
+    def report(self):
+        return (f"{self.name}: {len(self)} keys in {len(self.ring)} gens, "
+                f"hit rate {self.hit_rate():.1%} of {self.stats['lookups']}, expired {self.stats['expired']}")
 
 breaking_news_flash_registry = {}
-breaking_news_sound_played = set()
+# Symbols whose breaking-news sound already played within the dedup window
+breaking_news_sound_played = TTLDedup(NEWS_DEDUP_TTL_HOURS * 3600, name='breaking-sounds')
 
 def register_breaking_news(symbol):
     if symbol not in breaking_news_flash_registry:
         breaking_news_flash_registry[symbol] = True
+        render_scheduler.flash_changed(symbol)
 
 def clear_breaking_news_flash(symbol):
     if symbol in breaking_news_flash_registry:
         del breaking_news_flash_registry[symbol]
+        render_scheduler.flash_changed(symbol)
 
 def has_breaking_news_flash(symbol):
     return symbol in breaking_news_flash_registry
@@ -269,7 +883,7 @@ class HaltManager:
             self._fetch_nyse_halts()
 
             if self.callback:
-                Clock.schedule_once(lambda dt: self.callback(self.halt_data), 0)
+                ui_bus.post(('halts',), self.callback, self.halt_data)
             
             total_halts = sum(len(halt_list) for halt_list in self.halt_data.values())
             if total_halts > 0:
@@ -286,7 +900,7 @@ class HaltManager:
         from html.parser import HTMLParser
         
         try:
-            r = requests.get(self.rss_url, timeout=10)
+            r = http_client.get(self.rss_url, provider='nasdaq-halts')
             r.raise_for_status()
             halt_logger.info(f"Nasdaq RSS fetch: {r.status_code}, {len(r.content)} bytes")
             
@@ -443,7 +1057,7 @@ class HaltManager:
             today = datetime.datetime.now(NY_TZ).strftime('%Y-%m-%d')
             url = self.nyse_url.format(date=today)
             
-            r = requests.get(url, timeout=10)
+            r = http_client.get(url, provider='nyse-halts')
             r.raise_for_status()
             
             lines = r.text.strip().split('\n')
@@ -482,9 +1096,299 @@ class HaltManager:
     def stop(self):
         self.running = False
 
+# Providers whose news endpoint takes a comma-separated ticker list: tickers per request
+# and article page size per request (Alpaca caps limit at 50). FMP's page holds 10 per
+# ticker like the old per-symbol calls; Alpaca and Marketaux page until every ticker
+# in the batch has been seen, up to NEWS_BATCH_MAX_PAGES requests per batch.
+NEWS_BATCH_SYMBOLS = {'alpaca': 50, 'fmp': 50, 'marketaux': 20}
+NEWS_BATCH_ARTICLES = {'alpaca': 50, 'fmp': 500, 'marketaux': 50}
+NEWS_BATCH_MAX_PAGES = 5
+NEWS_BATCH_PAUSE = 0.3  # seconds between batch requests to the same provider
+
+def chunked(items, size):
+    items = list(items)
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+# Lower number wins when the same article arrives from several providers
+NEWS_SOURCE_PRIORITY = {'polygon': 1, 'marketaux': 2, 'newsapi': 3, 'alphavantage': 4}
+
+class NewsVault:
+    """
+    Persistent 72h news store in SQLite (WAL mode). Articles are keyed by article ID
+    (URL or symbol:title) and indexed on (symbol, ts) for the news popup and on ts so
+    expiry is a single range delete. Every insert commits on its own, so nothing has
+    to be rewritten in bulk and startup cost does not grow with the vault.
+    Timestamps are stored as epoch seconds.
+    """
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS articles ("
+        " id TEXT PRIMARY KEY, symbol TEXT NOT NULL, title TEXT, url TEXT,"
+        " ts REAL NOT NULL, source TEXT, added_at REAL NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS idx_articles_symbol_ts ON articles (symbol, ts)",
+        "CREATE INDEX IF NOT EXISTS idx_articles_ts ON articles (ts)",
+    )
+
+    def __init__(self, path=NEWS_VAULT_DB, legacy_file=NEWS_VAULT_FILE):
+        self.path = path
+        self.lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        # Shared by the news threads; self.lock serialises access
+        self.db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        for statement in self.SCHEMA:
+            self.db.execute(statement)
+        if legacy_file and os.path.exists(legacy_file):
+            self.migrate_json(legacy_file)
+
+    def migrate_json(self, legacy_file):
+        """One-time import of the old news_vault.json; the file is renamed afterwards"""
+        try:
+            with open(legacy_file, 'r') as f:
+                legacy = json.load(f)
+            now = time.time()
+            rows = []
+            for article_id, data in legacy.items():
+                ts = self._epoch(data.get('timestamp'))
+                added_at = self._epoch(data.get('added_at')) or now
+                rows.append((article_id, data.get('symbol') or '', data.get('title'), data.get('url'),
+                             ts or added_at, data.get('source'), added_at))
+            with self.lock:
+                self.db.execute("BEGIN")
+                self.db.executemany("INSERT OR IGNORE INTO articles VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+                self.db.execute("COMMIT")
+            os.replace(legacy_file, legacy_file + '.migrated')
+            print(f"[VAULT] Migrated {len(rows)} articles from {legacy_file}")
+        except Exception as e:
+            print(f"[VAULT] Migration error: {e}")
+
+    @staticmethod
+    def _epoch(value):
+        if isinstance(value, datetime.datetime):
+            return value.timestamp()
+        if isinstance(value, str):
+            try:
+                return datetime.datetime.fromisoformat(value).timestamp()
+            except ValueError:
+                return None
+        return None
+
+    def add(self, article_id, symbol, title, url, timestamp, source):
+        """Insert an article; returns False if the ID was already stored.
+        A duplicate from a higher-priority source takes over the source field."""
+        now = time.time()
+        ts = self._epoch(timestamp) or now
+        with self.lock:
+            cur = self.db.execute(
+                "INSERT OR IGNORE INTO articles VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (article_id, symbol, title, url, ts, source, now))
+            if cur.rowcount:
+                return True
+            row = self.db.execute("SELECT source FROM articles WHERE id = ?", (article_id,)).fetchone()
+            existing = row[0] if row and row[0] else 'unknown'
+            if NEWS_SOURCE_PRIORITY.get(source, 99) < NEWS_SOURCE_PRIORITY.get(existing, 99):
+                self.db.execute("UPDATE articles SET source = ? WHERE id = ?", (source, article_id))
+                print(f"[VAULT] Updated {symbol} source to {source}")
+        return False
+
+    def __contains__(self, article_id):
+        with self.lock:
+            return self.db.execute("SELECT 1 FROM articles WHERE id = ?", (article_id,)).fetchone() is not None
+
+    def __len__(self):
+        with self.lock:
+            return self.db.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+    def for_symbol(self, symbol, limit=20, since=None):
+        """Newest-first articles for a symbol (index range scan on symbol, ts)"""
+        since = since if since is not None else 0
+        with self.lock:
+            rows = self.db.execute(
+                "SELECT id, symbol, title, url, ts, source FROM articles"
+                " WHERE symbol = ? AND ts >= ? ORDER BY ts DESC LIMIT ?",
+                (symbol, since, limit)).fetchall()
+        return [{'id': r[0], 'symbol': r[1], 'title': r[2], 'url': r[3],
+                 'timestamp': datetime.datetime.fromtimestamp(r[4], tz=NY_TZ), 'source': r[5]}
+                for r in rows]
+
+    def expire(self, max_age_hours):
+        """Delete everything older than max_age_hours; returns the number of rows removed"""
+        cutoff = time.time() - max_age_hours * 3600
+        with self.lock:
+            return self.db.execute("DELETE FROM articles WHERE ts < ?", (cutoff,)).rowcount
+
+    def close(self):
+        with self.lock:
+            try:
+                self.db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            except sqlite3.Error:
+                pass
+            self.db.close()
+
+# Breaking-news phrases (lowercase); matched as substrings of the lowercased headline/summary
+BREAKING_KEYWORDS = [
+        'files chapter 11', 'files chapter 7', 'files for bankruptcy', 'bankruptcy protection', 'receivership filed',
+        'material cybersecurity incident', 'major data breach', 'ransomware attack',
+        'notice of delisting', 'delisting determination', 'trading suspended', 'listing standards deficiency',
+        'restates financials', 'accounting restatement', 'material weakness disclosed', 'non-reliance on financials',
+        'ceo resigns', 'cfo resigns', 'ceo terminated', 'cfo terminated', 'ceo steps down', 'interim ceo appointed', 'ceo ousted',
+        'terminates merger agreement', 'terminates acquisition agreement', 'merger terminated', 'deal terminated', 'breaks merger',
+        'withdraws guidance', 'guidance withdrawn', 'suspends guidance', 'slashes outlook', 'cuts outlook',
+        'covenant breach', 'loan default', 'debt default', 'missed payment',
+        'auditor resigns', 'dismisses auditor', 'auditor terminated',
+        'suspends dividend', 'cuts dividend', 'dividend suspended', 'eliminates dividend',
+        'trading halted', 'halt pending news', 'volatility halt',
+        'sec charges', 'sec investigation', 'fda rejection', 'doj investigation', 'subpoena received',
+        'fda approves', 'fda approval for', 'receives fda approval', 'breakthrough therapy designation', 'fast track designation',
+        'beats earnings estimates', 'crushes earnings', 'blows past earnings', 'raises full year guidance',
+        'wins contract worth', 'awarded contract valued', 'secures major contract', 'receives purchase order',
+        'upgrades to buy', 'raises price target', 'strong buy rating',
+        'receives buyout offer', 'takeover bid at', 'acquisition offer of', 'agrees to be acquired', 'to be acquired for', 'buyout valued at', 'acquisition at premium',
+        'merger agreement signed', 'definitive merger agreement', 'announces acquisition of',
+        'special dividend of', 'initiates dividend', 'announces buyback program', 'authorizes buyback of',
+        'strategic partnership with', 'joint venture with',
+        'successful trial results', 'positive phase',
+        'record revenue', 'record quarterly revenue',
+        'warren buffett buys',
+        'credit rating upgraded', 'rating upgrade by',
+        'wins patent lawsuit', 'patent granted for',
+        'debt free',
+        'bitcoin surges', 'bitcoin rallies', 'bitcoin hits new high', 'bitcoin crashes',
+        'expands mining operations', 'increases hash rate', 'purchases mining equipment',
+        'purchases bitcoin', 'adds bitcoin to balance sheet', 'acquires bitcoin', 'buys bitcoin worth',
+        'bitcoin etf approval', 'spot bitcoin etf', 'sec approves bitcoin', 'bitcoin legal tender',
+        'private placement', 'private placement financing', 'announces private placement',
+        'executes loi', 'signs loi', 'letter of intent', 'strategic partnership', 'crispr', 'molecule ai', 'ai breakthrough', 'clinical trial', 'orphan drug designation', 'phase 1 trial', 'research collaboration', 'technology licensing'
+]
+
+class KeywordMatcher:
+    """
+    Multi-pattern substring matcher (Aho-Corasick) compiled once for a keyword list.
+    One pass over the text finds every keyword, instead of one `kw in text` scan per
+    keyword. Uses pyahocorasick when installed, else a pure-Python automaton whose
+    transitions are fully resolved at build time (one dict lookup per character).
+    Matching is case-insensitive: text is lowercased, keywords must be lowercase.
+    """
+    def __init__(self, keywords, native=True):
+        self.keywords = list(dict.fromkeys(keywords))
+        if native and ahocorasick is not None:
+            self.automaton = ahocorasick.Automaton()
+            for kw in self.keywords:
+                self.automaton.add_word(kw, kw)
+            self.automaton.make_automaton()
+        else:
+            self.automaton = None
+            self._build()
+
+    def _build(self):
+        goto = [{}]
+        out = [()]
+        for kw in self.keywords:
+            state = 0
+            for ch in kw:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    goto.append({})
+                    out.append(())
+                    nxt = goto[state][ch] = len(goto) - 1
+                state = nxt
+            out[state] = out[state] + (kw,)
+        # BFS: failure links, inherited outputs, and the full transition table
+        fail = [0] * len(goto)
+        delta = [dict(goto[0])]
+        delta.extend({} for _ in range(len(goto) - 1))
+        order = list(goto[0].values())
+        for state in order:
+            delta[state] = dict(delta[fail[state]])
+        i = 0
+        while i < len(order):
+            state = order[i]
+            i += 1
+            for ch, nxt in goto[state].items():
+                fail[nxt] = delta[fail[state]].get(ch, 0) if state else 0
+                out[nxt] = out[nxt] + out[fail[nxt]]
+                order.append(nxt)
+            if state:
+                delta[state] = dict(delta[fail[state]])
+                delta[state].update(goto[state])
+        self.delta = delta
+        self.out = out
+
+    def find(self, text):
+        """Keywords found in text, in order of first occurrence"""
+        text = text.lower()
+        found = {}
+        if self.automaton is not None:
+            for _, kw in self.automaton.iter(text):
+                found[kw] = True
+            return list(found)
+        delta, out, state = self.delta, self.out, 0
+        for ch in text:
+            state = delta[state].get(ch, 0)
+            if out[state]:
+                for kw in out[state]:
+                    found[kw] = True
+        return list(found)
+
+    def search(self, text):
+        """True if any keyword occurs in text (stops at the first hit)"""
+        text = text.lower()
+        if self.automaton is not None:
+            for _ in self.automaton.iter(text):
+                return True
+            return False
+        delta, out, state = self.delta, self.out, 0
+        for ch in text:
+            state = delta[state].get(ch, 0)
+            if out[state]:
+                return True
+        return False
+
+breaking_keyword_matcher = KeywordMatcher(BREAKING_KEYWORDS)
+
+def bench_keyword_matcher(headlines=100_000, hit_rate=0.05, seed=7):
+    """
+    Micro-benchmark: breaking-keyword classification of `headlines` synthetic headlines,
+    the per-keyword `any(kw in text ...)` loop vs KeywordMatcher (both backends when
+    pyahocorasick is installed). Run with: python 193.py -- --bench
+    """
+    rng = random.Random(seed)
+    words = ("shares stock company reports quarterly update market investors trading analyst "
+             "revenue growth announces new product launch outlook session premarket gains falls "
+             "board meeting annual results ceo says plans expansion second third data").split()
+    corpus = []
+    for _ in range(headlines):
+        title = " ".join(rng.choice(words) for _ in range(rng.randint(8, 16)))
+        if rng.random() < hit_rate:
+            title += " " + rng.choice(BREAKING_KEYWORDS)
+        corpus.append(title.title())
+
+    start = time.perf_counter()
+    expected = [any(kw in t.lower() for kw in BREAKING_KEYWORDS) for t in corpus]
+    loop_s = time.perf_counter() - start
+    print(f"[BENCH] keywords any() loop   {loop_s / headlines * 1e6:7.2f} us/headline  ({sum(expected)} hits)")
+
+    matchers = [('pure-python', KeywordMatcher(BREAKING_KEYWORDS, native=False))]
+    if ahocorasick is not None:
+        matchers.append(('pyahocorasick', KeywordMatcher(BREAKING_KEYWORDS)))
+    results = {'loop': loop_s}
+    for name, matcher in matchers:
+        start = time.perf_counter()
+        got = [matcher.search(t) for t in corpus]
+        search_s = time.perf_counter() - start
+        start = time.perf_counter()
+        for t in corpus:
+            matcher.find(t)
+        find_s = time.perf_counter() - start
+        assert got == expected, f"{name} disagrees with the any() loop"
+        results[name] = search_s
+        print(f"[BENCH] keywords {name:14s} {search_s / headlines * 1e6:7.2f} us/headline search, "
+              f"{find_s / headlines * 1e6:7.2f} us find  ({loop_s / search_s:.1f}x loop)")
+    return results
+
 class NewsManager:
     def __init__(self, callback, sound_manager_ref, watchlist=None, news_trigger_callback=None):
-        self.seen_article_ids = set()
+        self.seen_article_ids = TTLDedup(NEWS_DEDUP_TTL_HOURS * 3600, name='seen-articles')
         self.callback = callback
         self.sound_manager_ref = sound_manager_ref
         self.news_trigger_callback = news_trigger_callback
@@ -526,12 +1430,12 @@ class NewsManager:
         # Last reset time
         self.last_reset_time = datetime.datetime.now(NY_TZ).replace(hour=4, minute=0, second=0, microsecond=0)
         # ================= ALPACA NEWS WEBSOCKET VARIABLES =================
-        self.news_ws = None
+        self.news_stream = None
         self.current_news_symbols = []
         # ====================================================================
         self.running = False
         self.news_cache = {}
-        self.news_vault = {}  # Persistent storage
+        self.news_vault = None  # Persistent storage (NewsVault), opened in load_news_vault
         self.company_news_fetched = set()
         self.VAULT_EXPIRATION_HOURS = 72  # 72-hour rule
         self.BREAKING_NEWS_WINDOW_HOURS = 2
@@ -539,40 +1443,8 @@ class NewsManager:
         self.RECENT_NEWS_WINDOW_HOURS = 12
         self.load_news_vault()
         self.last_vault_cleanup = datetime.datetime.now(NY_TZ)
-        self.breaking_keywords = [
-            'files chapter 11', 'files chapter 7', 'files for bankruptcy', 'bankruptcy protection', 'receivership filed',
-            'material cybersecurity incident', 'major data breach', 'ransomware attack',
-            'notice of delisting', 'delisting determination', 'trading suspended', 'listing standards deficiency',
-            'restates financials', 'accounting restatement', 'material weakness disclosed', 'non-reliance on financials',
-            'ceo resigns', 'cfo resigns', 'ceo terminated', 'cfo terminated', 'ceo steps down', 'interim ceo appointed', 'ceo ousted',
-            'terminates merger agreement', 'terminates acquisition agreement', 'merger terminated', 'deal terminated', 'breaks merger',
-            'withdraws guidance', 'guidance withdrawn', 'suspends guidance', 'slashes outlook', 'cuts outlook',
-            'covenant breach', 'loan default', 'debt default', 'missed payment',
-            'auditor resigns', 'dismisses auditor', 'auditor terminated',
-            'suspends dividend', 'cuts dividend', 'dividend suspended', 'eliminates dividend',
-            'trading halted', 'halt pending news', 'volatility halt',
-            'sec charges', 'sec investigation', 'fda rejection', 'doj investigation', 'subpoena received',
-            'fda approves', 'fda approval for', 'receives fda approval', 'breakthrough therapy designation', 'fast track designation',
-            'beats earnings estimates', 'crushes earnings', 'blows past earnings', 'raises full year guidance',
-            'wins contract worth', 'awarded contract valued', 'secures major contract', 'receives purchase order',
-            'upgrades to buy', 'raises price target', 'strong buy rating',
-            'receives buyout offer', 'takeover bid at', 'acquisition offer of', 'agrees to be acquired', 'to be acquired for', 'buyout valued at', 'acquisition at premium',
-            'merger agreement signed', 'definitive merger agreement', 'announces acquisition of',
-            'special dividend of', 'initiates dividend', 'announces buyback program', 'authorizes buyback of',
-            'strategic partnership with', 'joint venture with',
-            'successful trial results', 'positive phase',
-            'record revenue', 'record quarterly revenue',
-            'warren buffett buys',
-            'credit rating upgraded', 'rating upgrade by',
-            'wins patent lawsuit', 'patent granted for',
-            'debt free',
-            'bitcoin surges', 'bitcoin rallies', 'bitcoin hits new high', 'bitcoin crashes',
-            'expands mining operations', 'increases hash rate', 'purchases mining equipment',
-            'purchases bitcoin', 'adds bitcoin to balance sheet', 'acquires bitcoin', 'buys bitcoin worth',
-            'bitcoin etf approval', 'spot bitcoin etf', 'sec approves bitcoin', 'bitcoin legal tender',
-            'private placement', 'private placement financing', 'announces private placement',
-            'executes loi', 'signs loi', 'letter of intent', 'strategic partnership', 'crispr', 'molecule ai', 'ai breakthrough', 'clinical trial', 'orphan drug designation', 'phase 1 trial', 'research collaboration', 'technology licensing'
-        ]
+        self.breaking_keywords = BREAKING_KEYWORDS
+        self.keyword_matcher = breaking_keyword_matcher
         
         # ================= CONTINUOUS NEWS SYSTEM VARIABLES =================
         self.primary_loop_active = False
@@ -634,14 +1506,14 @@ class NewsManager:
         """GDELT special daily run - fetches news for all active tickers including Halts"""
         print("[GDELT-SPECIAL] Starting daily GDELT fetch...")
         try:
-            app = App.get_running_app()
-            if not hasattr(app.root, 'live_data'):
+            live_data = event_sink.live_channels()
+            if live_data is None:
                 print("[GDELT-SPECIAL] live_data not ready")
                 return
             
             # Collect ALL active tickers including Halts channel
             active_tickers = set()
-            for channel_name, channel_stocks in app.root.live_data.items():
+            for channel_name, channel_stocks in live_data.items():
                 for stock in channel_stocks:
                     active_tickers.add(stock[0])
             
@@ -704,9 +1576,9 @@ class NewsManager:
         news_logger.info(f"[POLYGON] Fetching for {symbol}")
         try:
             url = f"https://api.polygon.io/v2/reference/news?ticker={symbol}&limit=10&apiKey={self.polygon_key}"
-            response = requests.get(url, timeout=10)
+            response = http_client.get(url, provider='polygon')
             news_logger.info(f"[POLYGON] Response {response.status_code} for {symbol}")
-            # After response = requests.get(url, timeout=10)
+            # After response = http_client.get(url)
             if response.status_code != 200:
                 news_logger.error(f"[POLYGON] Failed with code {response.status_code} for {symbol}")
                 if response.status_code in [401, 402, 403, 429, 500, 502, 503, 504]:
@@ -726,7 +1598,7 @@ class NewsManager:
                         if age_hours > self.KEYWORD_NEWS_WINDOW_HOURS:
                             news_logger.debug(f"[POLYGON] Skipping old article {age_hours:.1f}h")
                             continue
-                        is_breaking = age_hours <= self.BREAKING_NEWS_WINDOW_HOURS and any(kw in title.lower() for kw in self.breaking_keywords)
+                        is_breaking = age_hours <= self.BREAKING_NEWS_WINDOW_HOURS and self.keyword_matcher.search(title)
                         # Check and add to persistent vault
                         if not self.add_to_vault(symbol, title, article_url, pub_datetime, 'polygon'):
                             continue                        
@@ -743,8 +1615,8 @@ class NewsManager:
                         if is_breaking:
                             register_breaking_news(symbol)
                         if self.callback:
-                            news_logger.info(f"[POLYGON] Calling callback for {symbol}")
-                            self.callback(self.news_cache[symbol])
+                            news_logger.info(f"[POLYGON] Posting news update for {symbol}")
+                            ui_bus.post(('news', symbol, article_url or title), self.callback, self.news_cache[symbol])
                         else:
                             news_logger.error(f"[POLYGON] NO CALLBACK for {symbol}")
                         print(f"[POLYGON] Fetched news for {symbol}")
@@ -761,9 +1633,9 @@ class NewsManager:
         news_logger.info(f"[ALPHAVANTAGE] Fetching for {symbol}")
         try:
             url = f"https://www.alphavantage.co/query?function=NEWS_SENTIMENT&tickers={symbol}&apikey={self.alphavantage_key}"
-            response = requests.get(url, timeout=10)
+            response = http_client.get(url, provider='alphavantage')
             news_logger.info(f"[ALPHAVANTAGE] Response {response.status_code} for {symbol}")
-            # After response = requests.get(url, timeout=10)
+            # After response = http_client.get(url)
             if response.status_code != 200:
                 news_logger.error(f"[ALPHAVANTAGE] Failed with code {response.status_code} for {symbol}")
                 if response.status_code in [401, 402, 403, 429, 500, 502, 503, 504]:
@@ -783,7 +1655,7 @@ class NewsManager:
                         if age_hours > self.KEYWORD_NEWS_WINDOW_HOURS:
                             news_logger.debug(f"[ALPHAVANTAGE] Skipping old article {age_hours:.1f}h")
                             continue
-                        is_breaking = age_hours <= self.BREAKING_NEWS_WINDOW_HOURS and any(kw in title.lower() for kw in self.breaking_keywords)
+                        is_breaking = age_hours <= self.BREAKING_NEWS_WINDOW_HOURS and self.keyword_matcher.search(title)
                         # Check and add to persistent vault
                         if not self.add_to_vault(symbol, title, article_url, pub_datetime, 'alphavantage'):
                             continue                        
@@ -800,8 +1672,8 @@ class NewsManager:
                         if is_breaking:
                             register_breaking_news(symbol)
                         if self.callback:
-                            news_logger.info(f"[ALPHAVANTAGE] Calling callback for {symbol}")
-                            self.callback(self.news_cache[symbol])
+                            news_logger.info(f"[ALPHAVANTAGE] Posting news update for {symbol}")
+                            ui_bus.post(('news', symbol, article_url or title), self.callback, self.news_cache[symbol])
                         else:
                             news_logger.error(f"[ALPHAVANTAGE] NO CALLBACK for {symbol}")
                         print(f"[ALPHAVANTAGE] Fetched news for {symbol}")
@@ -816,26 +1688,35 @@ class NewsManager:
 
     def fetch_fmp_news(self, symbol):
         """Fetch news from Financial Modeling Prep (FMP)"""
-        try:
-            fmp_key = os.getenv('FMP_API_KEY')
-            if not fmp_key:
-                print("[FMP] API key not found")
-                return
-            
-            url = f"https://financialmodelingprep.com/api/v3/stock_news?tickers={symbol}&limit=10&apikey={fmp_key}"
-            response = requests.get(url, timeout=10)
-            
-            if response.status_code != 200:
-                news_logger.error(f"[FMP] Failed with code {response.status_code}")
-                return
-            
-            data = response.json()
-            if data:
-                for article in data[:10]:
+        self.fetch_fmp_news_batch([symbol])
+
+    def fetch_fmp_news_batch(self, symbols):
+        """FMP news for many tickers, NEWS_BATCH_SYMBOLS['fmp'] per request; returns requests sent"""
+        fmp_key = os.getenv('FMP_API_KEY')
+        if not fmp_key:
+            print("[FMP] API key not found")
+            return 0
+        sent = 0
+        for batch in chunked(symbols, NEWS_BATCH_SYMBOLS['fmp']):
+            if sent:
+                time.sleep(NEWS_BATCH_PAUSE)
+            wanted = set(batch)
+            try:
+                url = (f"https://financialmodelingprep.com/api/v3/stock_news?tickers={','.join(batch)}"
+                       f"&limit={NEWS_BATCH_ARTICLES['fmp']}&apikey={fmp_key}")
+                response = http_client.get(url, provider='fmp')
+                sent += 1
+                
+                if response.status_code != 200:
+                    news_logger.error(f"[FMP] Failed with code {response.status_code}")
+                    continue
+                
+                for article in response.json() or []:
+                    symbol = (article.get('symbol') or '').upper()
+                    if symbol not in wanted:
+                        continue
                     title = article.get('title', '')
                     published_at = article.get('publishedDate', '')
-                    article_url = article.get('url', '')
-                    
                     try:
                         pub_datetime = datetime.datetime.fromisoformat(published_at.replace('Z', '+00:00'))
                         pub_datetime = pub_datetime.astimezone(NY_TZ)
@@ -843,7 +1724,7 @@ class NewsManager:
                         formatted_article = {
                             'headline': title,
                             'summary': article.get('text', title),
-                            'url': article_url,
+                            'url': article.get('url', ''),
                             'datetime': int(pub_datetime.timestamp()),
                             'related': symbol,
                             'id': f"fmp_{symbol}_{int(pub_datetime.timestamp())}",
@@ -855,8 +1736,9 @@ class NewsManager:
                     except Exception as e:
                         continue
                         
-        except Exception as e:
-            print(f"[FMP] Error fetching news for {symbol}: {e}")
+            except Exception as e:
+                print(f"[FMP] Error fetching news for {len(batch)} symbols: {e}")
+        return sent
 
     def fetch_yfinance_news(self, symbol):
         try:
@@ -886,47 +1768,80 @@ class NewsManager:
 
     def fetch_alpaca_news(self, symbol):
         """Fetch news from Alpaca (Benzinga)"""
-        try:
-            url = f"https://data.alpaca.markets/v1beta1/news?symbols={symbol}&limit=10"
-            headers = {
-                "APCA-API-KEY-ID": ALPACA_API_KEY,
-                "APCA-API-SECRET-KEY": ALPACA_SECRET_KEY
-            }
-            
-            response = requests.get(url, headers=headers, timeout=10)
-            
-            if response.status_code != 200:
-                news_logger.error(f"[ALPACA] Failed with code {response.status_code}")
-                return
-            
-            data = response.json()
-            if data.get('news'):
-                for article in data['news'][:10]:
-                    title = article.get('headline', '')
-                    published_at = article.get('created_at', '')
-                    article_url = article.get('url', '')
+        self.fetch_alpaca_news_batch([symbol])
+
+    def fetch_alpaca_news_batch(self, symbols):
+        """Alpaca (Benzinga) news for many tickers, NEWS_BATCH_SYMBOLS['alpaca'] per request.
+        Follows next_page_token until every ticker in the batch has an article in the
+        KEYWORD_NEWS_WINDOW_HOURS window (or NEWS_BATCH_MAX_PAGES); each article is fanned
+        out once per requested symbol it mentions. Returns requests sent"""
+        headers = {
+            "APCA-API-KEY-ID": ALPACA_API_KEY,
+            "APCA-API-SECRET-KEY": ALPACA_SECRET_KEY
+        }
+        window_start = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(hours=self.KEYWORD_NEWS_WINDOW_HOURS)
+        sent = 0
+        for batch in chunked(symbols, NEWS_BATCH_SYMBOLS['alpaca']):
+            wanted = set(batch)
+            covered = set()
+            page_token = None
+            pages = 0
+            try:
+                while pages < NEWS_BATCH_MAX_PAGES:
+                    if sent:
+                        time.sleep(NEWS_BATCH_PAUSE)
+                    url = (f"https://data.alpaca.markets/v1beta1/news?symbols={','.join(batch)}"
+                           f"&limit={NEWS_BATCH_ARTICLES['alpaca']}&start={window_start.strftime('%Y-%m-%dT%H:%M:%SZ')}")
+                    if page_token:
+                        url += f"&page_token={page_token}"
+                    response = http_client.get(url, provider='alpaca-news', headers=headers)
+                    sent += 1
+                    pages += 1
                     
-                    try:
-                        pub_datetime = datetime.datetime.fromisoformat(published_at.replace('Z', '+00:00'))
-                        pub_datetime = pub_datetime.astimezone(NY_TZ)
-                        
-                        formatted_article = {
-                            'headline': title,
-                            'summary': title,
-                            'url': article_url,
-                            'datetime': int(pub_datetime.timestamp()),
-                            'related': symbol,
-                            'id': f"alpaca_{symbol}_{int(pub_datetime.timestamp())}",
-                            'source': 'alpaca'
-                        }
-                        
-                        self.process_news_article(formatted_article, source='alpaca')
-                        
-                    except Exception as e:
-                        continue
+                    if response.status_code != 200:
+                        news_logger.error(f"[ALPACA] Failed with code {response.status_code}")
+                        page_token = None
+                        break
+                    
+                    data = response.json()
+                    for article in data.get('news') or []:
+                        title = article.get('headline', '')
+                        published_at = article.get('created_at', '')
+                        try:
+                            pub_datetime = datetime.datetime.fromisoformat(published_at.replace('Z', '+00:00'))
+                            pub_datetime = pub_datetime.astimezone(NY_TZ)
+                        except Exception:
+                            continue
+                        for symbol in article.get('symbols') or []:
+                            if symbol not in wanted:
+                                continue
+                            covered.add(symbol)
+                            formatted_article = {
+                                'headline': title,
+                                'summary': title,
+                                'url': article.get('url', ''),
+                                'datetime': int(pub_datetime.timestamp()),
+                                'related': symbol,
+                                'id': f"alpaca_{symbol}_{int(pub_datetime.timestamp())}",
+                                'source': 'alpaca'
+                            }
+                            self.process_news_article(formatted_article, source='alpaca')
+                    page_token = data.get('next_page_token')
+                    if not page_token or covered >= wanted:
+                        break
                         
-        except Exception as e:
-            print(f"[ALPACA] Error fetching news for {symbol}: {e}")
+            except Exception as e:
+                print(f"[ALPACA] Error fetching news for {len(batch)} symbols: {e}")
+            self._log_uncovered('ALPACA', wanted - covered, pages, capped=bool(page_token) and not covered >= wanted)
+        return sent
+
+    def _log_uncovered(self, provider, missing, pages, capped):
+        """Report batch symbols that got no article (quiet tickers, or the page cap was hit)"""
+        if not missing:
+            return
+        reason = f"page cap ({NEWS_BATCH_MAX_PAGES}) reached" if capped else f"no news in {self.KEYWORD_NEWS_WINDOW_HOURS}h"
+        news_logger.info(f"[{provider}] {len(missing)} symbols without articles after {pages} pages ({reason}): "
+                         f"{','.join(sorted(missing))}")
     
     def start_alpaca_news_websocket(self):
         """
@@ -938,93 +1853,33 @@ class NewsManager:
         print("[NEWS-WS] Alpaca News WebSocket starting...")
         news_logger.info("NEWS-WS: Alpaca News WebSocket starting...")
 
-        def on_open(ws):
-            print("[NEWS-WS] Alpaca News WebSocket connected, authenticating...")
-            news_logger.info("NEWS-WS: Alpaca News WebSocket connected, authenticating...")
-            auth_msg = {
-                "action": "auth",
-                "key": ALPACA_API_KEY,
-                "secret": ALPACA_SECRET_KEY
-            }
-            ws.send(json.dumps(auth_msg))
-        
-        def on_message(ws, message):
-            try:
-                data = json.loads(message)
-                
-                if isinstance(data, list):
-                    for msg in data:
-                        msg_type = msg.get("T")
-                        
-                        # Authentication successful
-                        if msg_type == "success" and msg.get("msg") == "authenticated":
-                            print("[NEWS-WS] ✓ Authenticated with Alpaca News")
-                            news_logger.info("NEWS-WS: Authenticated with Alpaca News")
-
-                            # Subscribe to news
-                            if self.current_news_symbols:
-                                self._subscribe_news(ws, self.current_news_symbols)
-                        
-                        # News article received
-                        elif msg_type == "n":
-                            self._process_news_message(msg)
-                
-            except Exception as e:
-                print(f"[NEWS-WS] Message processing error: {e}")
-                news_logger.error(f"NEWS-WS: Message processing error: {e}")
-        
-        def on_error(ws, error):
-            print(f"[NEWS-WS] WebSocket error: {error}")
-            news_logger.error(f"NEWS-WS: WebSocket error: {error}")
+        def on_news(msg):
+            if msg.get("T") == "n":
+                self._process_news_message(msg)
         
-        def on_close(ws, *args):
-            print("[NEWS-WS] Alpaca News WebSocket closed")
+        self.news_stream = AlpacaStreamManager(ALPACA_NEWS_STREAM_URL, ('news',), on_news, 'NEWS-WS', news_logger)
         
         while self.running:
             try:
                 # Get active tickers from app
-                app = App.get_running_app()
-                if not hasattr(app.root, 'livedata'):
+                live_data = event_sink.live_channels()
+                if live_data is None:
                     time.sleep(10)
                     continue
                 
                 active_tickers = set()
-                for channel_name, channel_stocks in app.root.livedata.items():
+                for channel_name, channel_stocks in live_data.items():
                     for stock in channel_stocks:
                         active_tickers.add(stock[0])
                 
                 symbols = list(active_tickers)[:500]  # Max 500
                 
-                # Only reconnect if symbol list changed significantly
+                # Symbol changes become subscribe/unsubscribe deltas on the same connection
                 if set(symbols) != set(self.current_news_symbols):
-                    print(f"[NEWS-WS] Symbol list changed, reconnecting with {len(symbols)} tickers")
-                    news_logger.info(f"NEWS-WS: Symbol list changed, reconnecting with {len(symbols)} tickers") 
+                    news_logger.info(f"NEWS-WS: Symbol list changed, streaming news for {len(symbols)} tickers")
                     self.current_news_symbols = symbols
-                    
-                    # Close existing WebSocket
-                    if self.news_ws:
-                        self.news_ws.close()
-                        time.sleep(1)
-                    
-                    # Create new WebSocket connection
-                    ws_url = "wss://stream.data.alpaca.markets/v1beta1/news"
-                    self.news_ws = websocket.WebSocketApp(
-                        ws_url,
-                        on_open=on_open,
-                        on_message=on_message,
-                        on_error=on_error,
-                        on_close=on_close
-                    )
-                    
-                    # Run WebSocket in separate thread
-                    ws_thread = threading.Thread(
-                        target=self.news_ws.run_forever,
-                        kwargs={"sslopt": {"cert_reqs": ssl.CERT_NONE}},
-                        daemon=True
-                    )
-                    ws_thread.start()
-                    print(f"[NEWS-WS] ✓ Streaming news for {len(symbols)} symbols")
-                    news_logger.info(f"NEWS-WS: Streaming news for {len(symbols)} symbols")
+                    self.news_stream.set_symbols(symbols)
+                    self.news_stream.start()
                 
                 # Check for symbol updates every 30 seconds
                 time.sleep(30)
@@ -1035,20 +1890,6 @@ class NewsManager:
                 traceback.print_exc()
                 time.sleep(30)
     
-    def _subscribe_news(self, ws, symbols):
-        """Helper method to subscribe to Alpaca news"""
-        try:
-            subscribe_msg = {
-                "action": "subscribe",
-                "news": symbols
-            }
-            ws.send(json.dumps(subscribe_msg))
-            print(f"[NEWS-WS] Subscribed to news for {len(symbols)} symbols")
-            news_logger.info(f"NEWS-WS: Subscribed to {len(self.current_news_symbols)} symbols")
-        except Exception as e:
-            print(f"[NEWS-WS] Subscribe error: {e}")
-            news_logger.error(f"NEWS-WS: Subscribe error: {e}")
-    
     def _process_news_message(self, msg):
         """Process incoming news message from Alpaca WebSocket"""
         try:
@@ -1062,9 +1903,12 @@ class NewsManager:
             if not headline or not symbols:
                 return
             
-            # Parse timestamp
-            pub_datetime = datetime.datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-            pub_datetime = pub_datetime.astimezone(NY_TZ)
+            # Parse timestamp (string over JSON, datetime over msgpack)
+            if isinstance(created_at, datetime.datetime):
+                pub_datetime = created_at.astimezone(NY_TZ)
+            else:
+                pub_datetime = datetime.datetime.fromisoformat(created_at.replace("Z", "+00:00"))
+                pub_datetime = pub_datetime.astimezone(NY_TZ)
             
             age_hours = (datetime.datetime.now(NY_TZ) - pub_datetime).total_seconds() / 3600
             
@@ -1075,7 +1919,7 @@ class NewsManager:
             # Check if breaking news
             text = (headline + " " + summary).lower()
             is_breaking = (age_hours <= self.BREAKING_NEWS_WINDOW_HOURS and 
-                          any(kw in text for kw in self.breaking_keywords))
+                          self.keyword_matcher.search(text))
             
             # Process for each symbol
             for symbol in symbols:
@@ -1101,14 +1945,13 @@ class NewsManager:
                 
                 # Trigger callback
                 if self.callback:
-                    Clock.schedule_once(lambda dt, s=symbol: self.callback(self.news_cache[s]), 0)
+                    ui_bus.post(('news', symbol, url or headline), self.callback, self.news_cache[symbol])
                 
                 # Breaking news alerts
                 if is_breaking:
                     print(f"[NEWS-WS] 🚨 BREAKING: {symbol} - {headline[:60]}... (Age: {age_hours:.1f}h)")
-                    if symbol not in breaking_news_sound_played:
-                        breaking_news_sound_played.add(symbol)
-                        Clock.schedule_once(lambda dt, s=symbol, t=headline: self.check_and_play_sound(s, t), 0.2)
+                    if not breaking_news_sound_played.check_and_add(symbol):
+                        event_sink.call_later(0.2, self.check_and_play_sound, symbol, headline)
                 else:
                     print(f"[NEWS-WS] 📰 NEWS: {symbol} - {headline[:60]}... (Age: {age_hours:.1f}h)")
                     
@@ -1122,7 +1965,7 @@ class NewsManager:
             today = datetime.datetime.now().strftime('%Y-%m-%d')
             url = f"https://finnhub.io/api/v1/company-news?symbol={symbol}&from={today}&to={today}&token={self.finnhub_key}"
             
-            response = requests.get(url, timeout=10)
+            response = http_client.get(url, provider='finnhub')
             
             if response.status_code != 200:
                 news_logger.error(f"[FINNHUB] Failed with code {response.status_code}")
@@ -1158,68 +2001,105 @@ class NewsManager:
 
     def fetch_marketaux_news(self, symbol):
         """Fetch news from Marketaux API"""
-        news_logger.info(f"[MARKETAUX] Fetching for {symbol}")
-        try:
-            url = f"https://api.marketaux.com/v1/news/all?symbols={symbol}&filter_entities=true&limit=10&api_token={self.marketaux_key}"
-            response = requests.get(url, timeout=10)
-            news_logger.info(f"[MARKETAUX] Response {response.status_code} for {symbol}")
-            # After response = requests.get(url, timeout=10)
-            if response.status_code != 200:
-                news_logger.error(f"[MARKETAUX] Failed with code {response.status_code} for {symbol}")
-                if response.status_code in [401, 402, 403, 429, 500, 502, 503, 504]:
-                    news_logger.error(f"[MARKETAUX] Marking as capped due to error {response.status_code}")
-                return
-            data = response.json()
-            if data.get('data') and len(data['data']) > 0:
-                news_logger.info(f"[MARKETAUX] Found {len(data['data'])} articles for {symbol}")
-                for article in data['data']:
-                    title = article.get('title', '')
-                    published_at = article.get('published_at', '')
-                    article_url = article.get('url', '')
-                    try:
-                        pub_datetime = datetime.datetime.strptime(published_at, '%Y-%m-%dT%H:%M:%S.%fZ')
-                        pub_datetime = pub_datetime.replace(tzinfo=pytz.UTC).astimezone(NY_TZ)
-                        age_hours = (datetime.datetime.now(NY_TZ) - pub_datetime).total_seconds() / 3600
-                        if age_hours > self.KEYWORD_NEWS_WINDOW_HOURS:
-                            news_logger.debug(f"[MARKETAUX] Skipping old article {age_hours:.1f}h")
-                            continue
-                        is_breaking = age_hours <= self.BREAKING_NEWS_WINDOW_HOURS and any(kw in title.lower() for kw in self.breaking_keywords)
-                        # Check and add to persistent vault
-                        if not self.add_to_vault(symbol, title, article_url, pub_datetime, 'marketaux'):
-                            continue                     
-                        self.news_cache[symbol] = {
-                            'symbol': symbol,
-                            'title': title,
-                            'timestamp': pub_datetime,
-                            'age_hours': age_hours,
-                            'age_display': self.format_age(age_hours),
-                            'url': article_url,
-                            'is_breaking': is_breaking,
-                            'tier': 2 if is_breaking else 3
-                        }
-                        if is_breaking:
-                            register_breaking_news(symbol)
-                        if self.callback:
-                            news_logger.info(f"[MARKETAUX] Calling callback for {symbol}")
-                            self.callback(self.news_cache[symbol])
-                        print(f"[MARKETAUX] Fetched news for {symbol}")
+        self.fetch_marketaux_news_batch([symbol])
+
+    def fetch_marketaux_news_batch(self, symbols):
+        """Marketaux news for many tickers, NEWS_BATCH_SYMBOLS['marketaux'] per request.
+        Pages through the KEYWORD_NEWS_WINDOW_HOURS window until every ticker in the batch
+        has been seen (or NEWS_BATCH_MAX_PAGES). Like the single-symbol fetch, delivers
+        the newest new article per symbol; returns requests sent"""
+        window_start = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(hours=self.KEYWORD_NEWS_WINDOW_HOURS)
+        sent = 0
+        for batch in chunked(symbols, NEWS_BATCH_SYMBOLS['marketaux']):
+            label = ','.join(batch)
+            news_logger.info(f"[MARKETAUX] Fetching for {label}")
+            wanted = set(batch)
+            seen = set()
+            pending = set(batch)
+            more = False
+            page = 0
+            try:
+                while page < NEWS_BATCH_MAX_PAGES:
+                    if sent:
+                        time.sleep(NEWS_BATCH_PAUSE)
+                    page += 1
+                    url = (f"https://api.marketaux.com/v1/news/all?symbols={label}&filter_entities=true"
+                           f"&published_after={window_start.strftime('%Y-%m-%dT%H:%M')}"
+                           f"&limit={NEWS_BATCH_ARTICLES['marketaux']}&page={page}&api_token={self.marketaux_key}")
+                    response = http_client.get(url, provider='marketaux')
+                    sent += 1
+                    news_logger.info(f"[MARKETAUX] Response {response.status_code} for {len(batch)} symbols (page {page})")
+                    if response.status_code != 200:
+                        news_logger.error(f"[MARKETAUX] Failed with code {response.status_code} for {label}")
+                        if response.status_code in [401, 402, 403, 429, 500, 502, 503, 504]:
+                            news_logger.error(f"[MARKETAUX] Marking as capped due to error {response.status_code}")
+                        more = False
                         break
-                    except Exception as e:
-                        news_logger.error(f"[MARKETAUX] Article processing error: {e}")
-                        continue
-            else:
-                news_logger.warning(f"[MARKETAUX] No articles found for {symbol}")
+                    data = response.json()
+                    articles = data.get('data') or []
+                    news_logger.info(f"[MARKETAUX] Found {len(articles)} articles for {len(batch)} symbols")
+                    for article in articles:
+                        for entity in article.get('entities') or []:
+                            symbol = (entity.get('symbol') or '').upper()
+                            if symbol not in wanted:
+                                continue
+                            seen.add(symbol)
+                            if symbol in pending and self._ingest_marketaux_article(symbol, article):
+                                pending.discard(symbol)
+                    meta = data.get('meta') or {}
+                    more = bool(articles) and meta.get('found', 0) > page * (meta.get('limit') or len(articles))
+                    if not more or seen >= wanted:
+                        break
+            except Exception as e:
+                news_logger.error(f"[MARKETAUX] Error for {label}: {e}")
+            self._log_uncovered('MARKETAUX', wanted - seen, page, capped=more and not seen >= wanted)
+        return sent
+
+    def _ingest_marketaux_article(self, symbol, article):
+        """Vault + callback one Marketaux article for symbol; True if it was new and delivered"""
+        title = article.get('title', '')
+        published_at = article.get('published_at', '')
+        article_url = article.get('url', '')
+        try:
+            pub_datetime = datetime.datetime.strptime(published_at, '%Y-%m-%dT%H:%M:%S.%fZ')
+            pub_datetime = pub_datetime.replace(tzinfo=pytz.UTC).astimezone(NY_TZ)
+            age_hours = (datetime.datetime.now(NY_TZ) - pub_datetime).total_seconds() / 3600
+            if age_hours > self.KEYWORD_NEWS_WINDOW_HOURS:
+                news_logger.debug(f"[MARKETAUX] Skipping old article {age_hours:.1f}h")
+                return False
+            is_breaking = age_hours <= self.BREAKING_NEWS_WINDOW_HOURS and self.keyword_matcher.search(title)
+            # Check and add to persistent vault
+            if not self.add_to_vault(symbol, title, article_url, pub_datetime, 'marketaux'):
+                return False
+            self.news_cache[symbol] = {
+                'symbol': symbol,
+                'title': title,
+                'timestamp': pub_datetime,
+                'age_hours': age_hours,
+                'age_display': self.format_age(age_hours),
+                'url': article_url,
+                'is_breaking': is_breaking,
+                'tier': 2 if is_breaking else 3
+            }
+            if is_breaking:
+                register_breaking_news(symbol)
+            if self.callback:
+                news_logger.info(f"[MARKETAUX] Posting news update for {symbol}")
+                ui_bus.post(('news', symbol, article_url or title), self.callback, self.news_cache[symbol])
+            print(f"[MARKETAUX] Fetched news for {symbol}")
+            return True
         except Exception as e:
-            news_logger.error(f"[MARKETAUX] Error for {symbol}: {e}")
+            news_logger.error(f"[MARKETAUX] Article processing error: {e}")
+            return False
 
     def fetch_newsapi_news(self, symbol):
         """Fetch news from NewsAPI"""
         news_logger.info(f"[NEWSAPI] Fetching for {symbol}")
         try:
             url = f"https://newsapi.org/v2/everything?q={symbol}&sortBy=publishedAt&language=en&pageSize=10&apiKey={self.newsapi_key}"
-            response = requests.get(url, timeout=10)
+            response = http_client.get(url, provider='newsapi')
             news_logger.info(f"[NEWSAPI] Response {response.status_code} for {symbol}")
-            # After response = requests.get(url, timeout=10)
+            # After response = http_client.get(url)
             if response.status_code != 200:
                 news_logger.error(f"[NEWSAPI] Failed with code {response.status_code} for {symbol}")
                 if response.status_code in [401, 402, 403, 429, 500, 502, 503, 504]:
@@ -1239,7 +2119,7 @@ class NewsManager:
                         if age_hours > self.KEYWORD_NEWS_WINDOW_HOURS:
                             news_logger.debug(f"[NEWSAPI] Skipping old article {age_hours:.1f}h")
                             continue
-                        is_breaking = age_hours <= self.BREAKING_NEWS_WINDOW_HOURS and any(kw in title.lower() for kw in self.breaking_keywords)
+                        is_breaking = age_hours <= self.BREAKING_NEWS_WINDOW_HOURS and self.keyword_matcher.search(title)
                         # Check and add to persistent vault
                         if not self.add_to_vault(symbol, title, article_url, pub_datetime, 'newsapi'):
                             continue                      
@@ -1256,8 +2136,8 @@ class NewsManager:
                         if is_breaking:
                             register_breaking_news(symbol)
                         if self.callback:
-                            news_logger.info(f"[NEWSAPI] Calling callback for {symbol}")
-                            self.callback(self.news_cache[symbol])
+                            news_logger.info(f"[NEWSAPI] Posting news update for {symbol}")
+                            ui_bus.post(('news', symbol, article_url or title), self.callback, self.news_cache[symbol])
                         print(f"[NEWSAPI] Fetched news for {symbol}")
                         break
                     except Exception as e:
@@ -1283,90 +2163,46 @@ class NewsManager:
             return f"{weeks}w ago"
         
     def load_news_vault(self):
-        """Load persistent news vault from disk"""
+        """Open the persistent news vault and drop anything past the 72h rule"""
         try:
-            with open(NEWS_VAULT_FILE, 'r') as f:
-                self.news_vault = json.load(f)
+            self.news_vault = NewsVault()
             self.cleanup_expired_news()
-            print(f"[VAULT] Loaded {len(self.news_vault)} cached articles")
-        except FileNotFoundError:
-            self.news_vault = {}
-            print("[VAULT] No existing vault found, starting fresh")
+            print(f"[VAULT] Opened {NEWS_VAULT_DB}")
         except Exception as e:
             print(f"[VAULT] Load error: {e}")
-            self.news_vault = {}
-
-    def save_news_vault(self):
-        """Save news vault to disk"""
-        try:
-            with open(NEWS_VAULT_FILE, 'w') as f:
-                json.dump(self.news_vault, f, indent=2, default=str)
-            print(f"[VAULT] Saved {len(self.news_vault)} articles")
-        except Exception as e:
-            print(f"[VAULT] Save error: {e}")
+            self.news_vault = NewsVault(':memory:', legacy_file=None)
 
     def cleanup_expired_news(self):
         """Remove news older than VAULT_EXPIRATION_HOURS"""
-        now = datetime.datetime.now(NY_TZ)
-        expired_keys = []
-        
-        for article_id, article_data in self.news_vault.items():
-            try:
-                # Parse timestamp
-                ts_str = article_data.get('timestamp')
-                if isinstance(ts_str, str):
-                    article_time = datetime.datetime.fromisoformat(ts_str)
-                else:
-                    continue
-                    
-                age_hours = (now - article_time).total_seconds() / 3600
-                
-                if age_hours > self.VAULT_EXPIRATION_HOURS:
-                    expired_keys.append(article_id)
-            except Exception:
-                continue
-        
-        for key in expired_keys:
-            del self.news_vault[key]
-        
-        if expired_keys:
-            print(f"[VAULT] Cleaned {len(expired_keys)} expired articles (>{self.VAULT_EXPIRATION_HOURS}h)")
-            self.save_news_vault()
+        removed = self.news_vault.expire(self.VAULT_EXPIRATION_HOURS)
+        if removed:
+            print(f"[VAULT] Cleaned {removed} expired articles (>{self.VAULT_EXPIRATION_HOURS}h)")
 
     def add_to_vault(self, symbol, title, url, timestamp, source):
         """Add news to persistent vault with deduplication"""
         # Create unique ID from URL or title+symbol
         article_id = url if url else f"{symbol}:{title[:100]}"
-        
-        # Check if already in vault
-        if article_id in self.news_vault:
-            # Update if this is a better source (priority order)
-            existing_source = self.news_vault[article_id].get('source', 'unknown')
-            source_priority = {'polygon': 1, 'marketaux': 2, 'newsapi': 3, 'alphavantage': 4}
-            
-            if source_priority.get(source, 99) < source_priority.get(existing_source, 99):
-                self.news_vault[article_id]['source'] = source
-                print(f"[VAULT] Updated {symbol} source to {source}")
+        if not self.news_vault.add(article_id, symbol, title, url, timestamp, source):
             return False  # Already existed
-        
-        # Add new article
-        self.news_vault[article_id] = {
-            'symbol': symbol,
-            'title': title,
-            'url': url,
-            'timestamp': timestamp.isoformat() if timestamp else None,
-            'source': source,
-            'added_at': datetime.datetime.now(NY_TZ).isoformat()
-        }
-        
         print(f"[VAULT] Added {symbol} from {source}: {title[:60]}...")
-        
-        # Save every 10 new articles
-        if len(self.news_vault) % 10 == 0:
-            self.save_news_vault()
-        
         return True  # New article added
 
+    def latest_vault_news(self, symbol):
+        """Most recent vaulted article for symbol, shaped like a stock_news entry (or None)"""
+        articles = self.news_vault.for_symbol(symbol, limit=1) if self.news_vault is not None else []
+        if not articles:
+            return None
+        article = articles[0]
+        age_hours = (datetime.datetime.now(NY_TZ) - article['timestamp']).total_seconds() / 3600
+        return {
+            'symbol': symbol,
+            'title': article['title'],
+            'url': article['url'],
+            'timestamp': article['timestamp'],
+            'age_hours': age_hours,
+            'age_display': self.format_age(age_hours),
+        }
+
     def extract_source(self, url):
         """Extract domain name from URL"""
         try:
@@ -1388,9 +2224,8 @@ class NewsManager:
             article_url = article.get('url', '')
             if not article_id:
                 article_id = f"{title[:80]}::{ts}"
-            if article_id in self.seen_article_ids:
+            if self.seen_article_ids.check_and_add(article_id):
                 return
-            self.seen_article_ids.add(article_id)
             now = datetime.datetime.now(NY_TZ)
             if ts:
                 article_time = datetime.datetime.fromtimestamp(ts, tz=NY_TZ)
@@ -1400,7 +2235,8 @@ class NewsManager:
             if age_hours > self.KEYWORD_NEWS_WINDOW_HOURS:
                 return
             text = (title + " " + content).lower()
-            has_breaking_keywords = any(keyword in text for keyword in self.breaking_keywords)
+            matched_keywords = self.keyword_matcher.find(text)
+            has_breaking_keywords = bool(matched_keywords)
             if has_breaking_keywords and age_hours <= self.BREAKING_NEWS_WINDOW_HOURS:
                 is_breaking = True
                 news_type = "BREAKING"
@@ -1437,14 +2273,14 @@ class NewsManager:
                     'timestamp': article_time,
                     'age_hours': age_hours,
                     'age_display': age_display,
-                    'url': article_url
+                    'url': article_url,
+                    'keywords': matched_keywords
                 }
-                Clock.schedule_once(lambda dt, d=nd, s=sym: self.callback(d), 0)
+                ui_bus.post(('news', sym, article_url or title), self.callback, nd)
                 if is_breaking:
                     print(f"[BREAKING] {sym}: {title[:60]}... (Age: {age_hours:.1f}h)")
-                    if sym not in breaking_news_sound_played:
-                        breaking_news_sound_played.add(sym)
-                        Clock.schedule_once(lambda dt, s=sym, t=title: self._check_and_play_sound(s, t), 0.2)
+                    if not breaking_news_sound_played.check_and_add(sym):
+                        event_sink.call_later(0.2, self._check_and_play_sound, sym, title)
                 else:
                     print(f"[NEWS] {sym}: {title[:60]}... (Age: {age_hours:.1f}h)")
         except Exception as e:
@@ -1452,10 +2288,9 @@ class NewsManager:
 
     def _check_and_play_sound(self, symbol, title):
         try:
-            app = App.get_running_app()
-            if not hasattr(app.root, 'live_data'):
+            live_data = event_sink.live_channels()
+            if live_data is None:
                 return
-            live_data = app.root.live_data
             ticker_on_channel = False
             for channel_name, channel_stocks in live_data.items():
                 if channel_name == "Halts":
@@ -1474,8 +2309,11 @@ class NewsManager:
     def stop(self):
         """Stop news fetching threads"""
         self.running = False
-        self.save_news_vault()  # Save before shutdown      
-        print("[NEWS] NewsManager stopped, vault saved.")
+        if self.news_stream:
+            self.news_stream.stop()
+        if self.news_vault is not None:
+            self.news_vault.close()
+        print("[NEWS] NewsManager stopped, vault closed.")
 
     def start_news_stream(self):
         """Start continuous news system: Alpaca WebSocket (primary), secondary rotation, reset monitor"""
@@ -1525,13 +2363,13 @@ class NewsManager:
             try:
                 cycle += 1
                 news_logger.info(f"=== NEWS CYCLE {cycle} START ===")
-                app = App.get_running_app()
-                if not hasattr(app.root, 'live_data'):
+                live_data = event_sink.live_channels()
+                if live_data is None:
                     news_logger.warning("live_data not ready yet")
                     time.sleep(10)
                     continue
                 active_tickers = set()
-                for channel_name, channel_stocks in app.root.live_data.items():
+                for channel_name, channel_stocks in live_data.items():
                     if channel_name == "Halts":
                         continue
                     for stock in channel_stocks[:10]:
@@ -1547,6 +2385,7 @@ class NewsManager:
                         fetched += 1
                         time.sleep(2)
                 news_logger.info(f"Cycle {cycle} complete - fetched {fetched} new | cache: {len(self.news_cache)}")
+                news_logger.info(f"[DEDUP] {self.seen_article_ids.report()} | {breaking_news_sound_played.report()}")
                 time.sleep(300)
             except Exception as e:
                 news_logger.error(f"NEWS MONITOR ERROR: {e}")
@@ -1565,9 +2404,8 @@ class NewsManager:
                 article_url = article.get('url', '')
                 if not article_id:
                     article_id = f"{title[:80]}::{ts}"
-                if article_id in self.seen_article_ids:
+                if self.seen_article_ids.check_and_add(article_id):
                     return
-                self.seen_article_ids.add(article_id)
                 now = datetime.datetime.now(NY_TZ)
                 if ts:
                     article_time = datetime.datetime.fromtimestamp(ts, tz=NY_TZ)
@@ -1577,7 +2415,8 @@ class NewsManager:
                 if age_hours > self.KEYWORD_NEWS_WINDOW_HOURS:
                     return
                 text = (title + " " + content).lower()
-                has_breaking_keywords = any(keyword in text for keyword in self.breaking_keywords)
+                matched_keywords = self.keyword_matcher.find(text)
+                has_breaking_keywords = bool(matched_keywords)
                 if has_breaking_keywords and age_hours <= self.BREAKING_NEWS_WINDOW_HOURS:
                     is_breaking = True
                     news_type = "BREAKING"
@@ -1614,14 +2453,14 @@ class NewsManager:
                         'timestamp': article_time,
                         'age_hours': age_hours,
                         'age_display': age_display,
-                        'url': article_url
+                        'url': article_url,
+                        'keywords': matched_keywords
                     }
-                    Clock.schedule_once(lambda dt, d=nd, s=sym: self.callback(d), 0)
+                    ui_bus.post(('news', sym, article_url or title), self.callback, nd)
                     if is_breaking:
                         print(f"[BREAKING] {sym}: {title[:60]}... (Age: {age_hours:.1f}h)")
-                        if sym not in breaking_news_sound_played:
-                            breaking_news_sound_played.add(sym)
-                            Clock.schedule_once(lambda dt, s=sym, t=title: self._check_and_play_sound(s, t), 0.2)
+                        if not breaking_news_sound_played.check_and_add(sym):
+                            event_sink.call_later(0.2, self._check_and_play_sound, sym, title)
                     else:
                         print(f"[NEWS] {sym}: {title[:60]}... (Age: {age_hours:.1f}h)")
             except Exception as e:
@@ -1629,10 +2468,9 @@ class NewsManager:
 
     def _check_and_play_sound(self, symbol, title):
         try:
-            app = App.get_running_app()
-            if not hasattr(app.root, 'live_data'):
+            live_data = event_sink.live_channels()
+            if live_data is None:
                 return
-            live_data = app.root.live_data
             ticker_on_channel = False
             for channel_name, channel_stocks in live_data.items():
                 if channel_name == "Halts":
@@ -1648,7 +2486,7 @@ class NewsManager:
         except Exception as e:
             print(f"Sound check error: {e}")
 
-    #def is_continuous_time(self):
+    def is_continuous_time(self):
         """Return True if between 5 AM and 12 PM EST"""
         now_est = datetime.datetime.now(NY_TZ)
         return 5 <= now_est.hour < 12
@@ -1671,13 +2509,13 @@ class NewsManager:
     def gdelt_special_background_thread(self):
         """4 AM special run: pulls GDELT for all active tickers (excludes Halts)"""
         try:
-            app = App.get_running_app()
-            if not hasattr(app.root, 'live_data'):
+            live_data = event_sink.live_channels()
+            if live_data is None:
                 print("GDELT-SPECIAL: live_data not ready, skipping")
                 return
 
             active = set()
-            for ch_name, ch_stocks in app.root.live_data.items():
+            for ch_name, ch_stocks in live_data.items():
                 if ch_name == "Halts":
                     continue
                 for s in ch_stocks:
@@ -1709,14 +2547,14 @@ class NewsManager:
                     continue
                 cycle += 1
                 print(f"SECONDARY CYCLE {cycle}")
-                app = App.get_running_app()
-                if not hasattr(app.root, 'live_data'):
+                live_data = event_sink.live_channels()
+                if live_data is None:
                     time.sleep(3600)
                     continue
                 
                 # Collect active tickers (exclude Halts)
                 active = set()
-                for ch_name, ch_stocks in app.root.live_data.items():
+                for ch_name, ch_stocks in live_data.items():
                     if ch_name == "Halts":
                         continue
                     for s in ch_stocks:
@@ -1743,9 +2581,8 @@ class NewsManager:
                 # Priority 2: FMP
                 elif self.fmp_cycles < self.fmp_max_cycles:
                     used = "FMP"
-                    for sym in tickers:
-                        self.fetch_fmp_news(sym)
-                        time.sleep(0.3)
+                    sent = self.fetch_fmp_news_batch(tickers)
+                    print(f"SECONDARY: FMP batched {len(tickers)} tickers into {sent} requests")
                     self.fmp_cycles += 1
                     if self.fmp_cycles >= self.fmp_max_cycles:
                         self.capped_providers.add("FMP")
@@ -1753,9 +2590,8 @@ class NewsManager:
                 # Priority 3: Marketaux
                 elif self.marketaux_cycles < self.marketaux_max_cycles:
                     used = "Marketaux"
-                    for sym in tickers:
-                        self.fetch_marketaux_news(sym)
-                        time.sleep(0.3)
+                    sent = self.fetch_marketaux_news_batch(tickers)
+                    print(f"SECONDARY: Marketaux batched {len(tickers)} tickers into {sent} requests")
                     self.marketaux_cycles += 1
                     if self.marketaux_cycles >= self.marketaux_max_cycles:
                         self.capped_providers.add("Marketaux")
@@ -1900,6 +2736,48 @@ class EnrichmentManager:
     def get_enriched_list(self):
         return list(self.enriched.keys())
 
+class FundamentalsStore:
+    """
+    Persistent per-ticker fundamentals (avg volume, float, shares outstanding, 52-week range).
+    Backed by MaintenanceEngine.ticker_metadata / ticker_metadata.json:
+        {symbol: {'avg_volume': 2500000, ..., 'updated': {'avg_volume': <epoch>, ...}}}
+    Reads are plain dict lookups so the Tier 1 hot loop never touches the network.
+    """
+    FIELDS = tuple(FUNDAMENTALS_TTL.keys())
+
+    def __init__(self, metadata):
+        self.metadata = metadata
+
+    def get(self, symbol, field, default=0):
+        entry = self.metadata.get(symbol)
+        if not entry:
+            return default
+        value = entry.get(field)
+        return default if value is None else value
+
+    def set(self, symbol, field, value, now=None):
+        entry = self.metadata.setdefault(symbol, {'updated': {}})
+        entry[field] = value
+        entry.setdefault('updated', {})[field] = now if now is not None else time.time()
+
+    def is_stale(self, symbol, field, now=None):
+        entry = self.metadata.get(symbol)
+        if not entry:
+            return True
+        updated = entry.get('updated', {}).get(field)
+        if updated is None:
+            return True
+        now = now if now is not None else time.time()
+        return now - updated > FUNDAMENTALS_TTL[field]
+
+    def stale_symbols(self, symbols, fields):
+        now = time.time()
+        return [s for s in symbols if any(self.is_stale(s, f, now) for f in fields)]
+
+    def coverage(self, symbols, field='avg_volume'):
+        """Number of symbols with a cached value for field"""
+        return sum(1 for s in symbols if self.metadata.get(s, {}).get(field) is not None)
+
 class MaintenanceEngine:
     def __init__(self):
         self.master_tickers = []
@@ -1908,14 +2786,19 @@ class MaintenanceEngine:
         self.price_snapshots = {}
         self.candidate_alerted = set()
         self.ticker_metadata = {}
+        self.fundamentals = FundamentalsStore(self.ticker_metadata)
         self.maintenance_log = {}
+        self.eligible_tickers = []
+        self.share_refresh_thread = None
 
     def load_all_caches(self):
         self.master_tickers = self._load_json(MASTER_TICKERS_FILE, [])
         self.yesterday_prices = self._load_json(PRICE_CACHE_FILE, {})
         self.price_history = self._load_json(PRICE_HISTORY_FILE, {})
         self.ticker_metadata = self._load_json(TICKER_METADATA_FILE, {})
+        self.fundamentals = FundamentalsStore(self.ticker_metadata)
         self.maintenance_log = self._load_json(MAINTENANCE_LOG_FILE, {})
+        self.eligible_tickers = self._load_json(ELIGIBILITY_INDEX_FILE, {}).get('symbols', [])
 
     def save_all_caches(self):
         self._save_json(MASTER_TICKERS_FILE, self.master_tickers)
@@ -1928,7 +2811,7 @@ class MaintenanceEngine:
         timestamp = datetime.datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
         backup_path = os.path.join(BACKUP_DIR, timestamp)
         os.makedirs(backup_path, exist_ok=True)
-        for filepath in [MASTER_TICKERS_FILE, ENRICHED_TICKERS_FILE, PRICE_CACHE_FILE, PRICE_HISTORY_FILE, TICKER_METADATA_FILE]:
+        for filepath in [MASTER_TICKERS_FILE, ENRICHED_TICKERS_FILE, PRICE_CACHE_FILE, PRICE_HISTORY_FILE, TICKER_METADATA_FILE, ELIGIBILITY_INDEX_FILE]:
             if os.path.exists(filepath):
                 basename = os.path.basename(filepath)
                 with open(filepath, 'rb') as src:
@@ -1950,57 +2833,488 @@ class MaintenanceEngine:
         except Exception as e:
             print(f"[ERROR] Failed to save {path}: {e}")
 
-def download_ticker_universe(self):
-    print(f"[MAINT] Downloading ticker universe...")
-    try:
-        nasdaq_url = 'ftp://ftp.nasdaqtrader.com/SymbolDirectory/nasdaqlisted.txt'
-        other_url = 'ftp://ftp.nasdaqtrader.com/SymbolDirectory/otherlisted.txt'
-        nasdaq_df = pd.read_csv(nasdaq_url, sep='|')
-        other_df = pd.read_csv(other_url, sep='|')
-        nasdaq_list = nasdaq_df[nasdaq_df['Test Issue'] == 'N']['Symbol'].tolist()
-        other_list = other_df[other_df['Test Issue'] == 'N']['ACT Symbol'].tolist()
-        all_tickers = set(nasdaq_list + other_list)
-        all_tickers = {str(t).strip() for t in all_tickers if t and str(t).strip() and len(str(t).strip()) <= 5}
-        self.master_tickers = list(all_tickers)
-        self._save_json(MASTER_TICKERS_FILE, self.master_tickers)
-        print(f"[MAINT] Downloaded {len(self.master_tickers)} tickers (NO VOLUME FILTER)")
-    except Exception as e:
-        print(f"[ERROR] Ticker download failed: {e}")
-
-def refresh_prices(self):
-    print(f"[MAINT] Refreshing yesterday prices...")
-    if not self.master_tickers:
-        print(f"[MAINT] No tickers to refresh")
-        return
-    updated = 0
-    for symbol in self.master_tickers[:1000]:
+    def download_ticker_universe(self):
+        print(f"[MAINT] Downloading ticker universe...")
         try:
-            t = yf.Ticker(symbol)
-            hist = t.history(period="1d", interval="1d")
-            if hist is not None and not hist.empty:
-                close_price = float(hist['Close'].iloc[-1])
-                self.yesterday_prices[symbol] = close_price
-                updated += 1
-            time.sleep(0.1)
+            nasdaq_url = 'ftp://ftp.nasdaqtrader.com/SymbolDirectory/nasdaqlisted.txt'
+            other_url = 'ftp://ftp.nasdaqtrader.com/SymbolDirectory/otherlisted.txt'
+            nasdaq_df = pd.read_csv(nasdaq_url, sep='|')
+            other_df = pd.read_csv(other_url, sep='|')
+            nasdaq_list = nasdaq_df[nasdaq_df['Test Issue'] == 'N']['Symbol'].tolist()
+            other_list = other_df[other_df['Test Issue'] == 'N']['ACT Symbol'].tolist()
+            all_tickers = set(nasdaq_list + other_list)
+            all_tickers = {str(t).strip() for t in all_tickers if t and str(t).strip() and len(str(t).strip()) <= 5}
+            self.master_tickers = list(all_tickers)
+            self._save_json(MASTER_TICKERS_FILE, self.master_tickers)
+            print(f"[MAINT] Downloaded {len(self.master_tickers)} tickers (NO VOLUME FILTER)")
         except Exception as e:
-            continue
-    self._save_json(PRICE_CACHE_FILE, self.yesterday_prices)
-    print(f"[MAINT] Refreshed {updated} prices")
-
-def weekend_mega_build(self):
-    print(f"[MAINT] ===== WEEKEND MEGA BUILD START =====")
-    self.backup_caches("Pre-weekend-build")
-    self.download_ticker_universe()
-    self.refresh_prices()
-    self.backup_caches("Post-weekend-build")
-    print(f"[MAINT] ===== WEEKEND MEGA BUILD COMPLETE =====")
-
-def weekday_maintenance(self):
-    print(f"[MAINT] ===== WEEKDAY MAINTENANCE START =====")
-    self.backup_caches("Pre-daily-maintenance")
-    self.refresh_prices()
-    self.backup_caches("Post-daily-maintenance")
-    print(f"[MAINT] ===== WEEKDAY MAINTENANCE COMPLETE =====")
+            print(f"[ERROR] Ticker download failed: {e}")
+
+    def refresh_prices(self):
+        print(f"[MAINT] Refreshing yesterday prices...")
+        if not self.master_tickers:
+            print(f"[MAINT] No tickers to refresh")
+            return
+        updated = 0
+        for chunk_idx in range(0, len(self.master_tickers), FUNDAMENTALS_CHUNK_SIZE):
+            chunk = self.master_tickers[chunk_idx:chunk_idx + FUNDAMENTALS_CHUNK_SIZE]
+            try:
+                data = yf.download(tickers=chunk, period="5d", interval="1d", group_by='ticker', threads=True, progress=False)
+                if data is None or data.empty:
+                    continue
+                if not isinstance(data.columns, pd.MultiIndex):
+                    data = pd.concat({chunk[0]: data}, axis=1)
+                closes = data.xs('Close', axis=1, level=1).ffill().iloc[-1]
+                for symbol, close_price in closes.dropna().items():
+                    self.yesterday_prices[symbol] = float(close_price)
+                    updated += 1
+            except Exception as e:
+                print(f"[MAINT] Price chunk error: {e}")
+        self._save_json(PRICE_CACHE_FILE, self.yesterday_prices)
+        print(f"[MAINT] Refreshed {updated} prices")
+
+    def refresh_fundamentals(self, symbols=None, force=False):
+        """
+        Bulk refresh of the fundamentals store (run off-hours).
+        - avg volume / 52-week range: chunked 1y daily yf.download, no per-ticker calls
+        - float / shares outstanding: .info only for symbols whose weekly TTL expired
+        """
+        symbols = list(symbols if symbols is not None else self.master_tickers)
+        if not symbols:
+            print(f"[MAINT] No tickers for fundamentals refresh")
+            return
+        print(f"[MAINT] Refreshing fundamentals for {len(symbols)} tickers...")
+        start_time = time.time()
+        price_updated = self.refresh_price_fundamentals(symbols, force)
+        shares_updated = self.refresh_share_fundamentals(symbols, force)
+        self._save_json(TICKER_METADATA_FILE, self.ticker_metadata)
+        print(f"[MAINT] Fundamentals refreshed: {price_updated} volume/52wk, {shares_updated} float/shares in {time.time() - start_time:.1f}s")
+
+    def refresh_price_fundamentals(self, symbols, force=False):
+        """avg volume / 52-week range from chunked 1y daily yf.download; returns tickers updated"""
+        store = self.fundamentals
+        price_fields = ('avg_volume', 'week52_high', 'week52_low')
+        stale = symbols if force else store.stale_symbols(symbols, price_fields)
+        price_updated = 0
+        for chunk_idx in range(0, len(stale), FUNDAMENTALS_CHUNK_SIZE):
+            chunk = stale[chunk_idx:chunk_idx + FUNDAMENTALS_CHUNK_SIZE]
+            try:
+                data = yf.download(tickers=chunk, period="1y", interval="1d", group_by='ticker', threads=True, progress=False)
+                if data is None or data.empty:
+                    continue
+                now = time.time()
+                for ticker in chunk:
+                    try:
+                        if isinstance(data.columns, pd.MultiIndex):
+                            if ticker not in data.columns.get_level_values(0):
+                                continue
+                            ticker_df = data[ticker]
+                        else:
+                            ticker_df = data
+                        volumes = ticker_df['Volume'].dropna()
+                        if volumes.empty:
+                            continue
+                        # Yahoo's averageVolume is a 3-month (~63 session) mean
+                        store.set(ticker, 'avg_volume', int(volumes.tail(63).mean()), now)
+                        store.set(ticker, 'week52_high', float(ticker_df['High'].max()), now)
+                        store.set(ticker, 'week52_low', float(ticker_df['Low'].min()), now)
+                        price_updated += 1
+                    except Exception:
+                        continue
+            except Exception as e:
+                print(f"[MAINT] Fundamentals chunk error: {e}")
+        return price_updated
+
+    def refresh_share_fundamentals(self, symbols, force=False):
+        """float / shares outstanding via per-ticker .info, only where the weekly TTL expired"""
+        store = self.fundamentals
+        share_fields = ('float_shares', 'shares_outstanding')
+        stale = symbols if force else store.stale_symbols(symbols, share_fields)
+
+        def _fetch_shares(ticker):
+            try:
+                info = yf.Ticker(ticker).info or {}
+                return ticker, info.get('floatShares'), info.get('sharesOutstanding')
+            except Exception:
+                return ticker, None, None
+
+        shares_updated = 0
+        with ThreadPoolExecutor(max_workers=FUNDAMENTALS_INFO_WORKERS) as executor:
+            for ticker, float_shares, shares_outstanding in executor.map(_fetch_shares, stale):
+                if float_shares is None and shares_outstanding is None:
+                    continue
+                now = time.time()
+                store.set(ticker, 'float_shares', int(float_shares or 0), now)
+                store.set(ticker, 'shares_outstanding', int(shares_outstanding or 0), now)
+                shares_updated += 1
+        return shares_updated
+
+    def refresh_share_fundamentals_async(self, symbols):
+        """Run refresh_share_fundamentals on a background thread (one at a time), then save"""
+        if self.share_refresh_thread and self.share_refresh_thread.is_alive():
+            return
+
+        def _run():
+            start_time = time.time()
+            updated = self.refresh_share_fundamentals(symbols)
+            self._save_json(TICKER_METADATA_FILE, self.ticker_metadata)
+            print(f"[MAINT] Background float/shares refresh: {updated} tickers in {time.time() - start_time:.1f}s")
+
+        self.share_refresh_thread = threading.Thread(target=_run, daemon=True)
+        self.share_refresh_thread.start()
+
+    def build_eligibility_index(self):
+        """
+        Tickers that could pass the Tier 1 gates tomorrow, from previous close and avg volume
+        (gates widened by the ELIGIBILITY_*_SLACK factors). Tickers with a price in band but
+        no cached avg volume are kept - Tier 1 counts them as missing fundamentals.
+        """
+        price_min = TIER1_PRICE_MIN * (1 - ELIGIBILITY_PRICE_SLACK)
+        price_max = TIER1_PRICE_MAX * (1 + ELIGIBILITY_PRICE_SLACK)
+        volume_min = TIER1_MIN_AVG_VOLUME * ELIGIBILITY_VOLUME_SLACK
+        eligible = []
+        for symbol in self.master_tickers:
+            prev_close = self.yesterday_prices.get(symbol, 0)
+            if not (price_min <= prev_close <= price_max):
+                continue
+            avg_volume = self.fundamentals.get(symbol, 'avg_volume', 0)
+            if avg_volume and avg_volume < volume_min:
+                continue
+            eligible.append(symbol)
+        self.eligible_tickers = eligible
+        self._save_json(ELIGIBILITY_INDEX_FILE, {
+            'built': datetime.datetime.now(NY_TZ).isoformat(),
+            'price_range': [price_min, price_max],
+            'min_avg_volume': volume_min,
+            'symbols': eligible
+        })
+        print(f"[MAINT] Eligibility index: {len(eligible)}/{len(self.master_tickers)} tickers")
+
+    def weekend_mega_build(self):
+        print(f"[MAINT] ===== WEEKEND MEGA BUILD START =====")
+        self.backup_caches("Pre-weekend-build")
+        self.download_ticker_universe()
+        self.refresh_prices()
+        self.refresh_fundamentals(force=True)
+        self.build_eligibility_index()
+        self.backup_caches("Post-weekend-build")
+        print(f"[MAINT] ===== WEEKEND MEGA BUILD COMPLETE =====")
+
+    def weekday_maintenance(self):
+        print(f"[MAINT] ===== WEEKDAY MAINTENANCE START =====")
+        self.backup_caches("Pre-daily-maintenance")
+        self.refresh_prices()
+        self.refresh_fundamentals()
+        self.build_eligibility_index()
+        self.backup_caches("Post-daily-maintenance")
+        print(f"[MAINT] ===== WEEKDAY MAINTENANCE COMPLETE =====")
+
+class _BarSeries:
+    __slots__ = ('ts', 'high', 'close', 'volume', 'n', 'fetched_at')
+
+    def __init__(self, capacity):
+        self.ts = np.empty(capacity, dtype=np.int64)
+        self.high = np.empty(capacity, dtype=np.float32)
+        self.close = np.empty(capacity, dtype=np.float32)
+        self.volume = np.empty(capacity, dtype=np.float32)
+        self.n = 0
+        self.fetched_at = 0
+
+    def reserve(self, size):
+        if size <= len(self.ts):
+            return
+        capacity = max(size, 2 * len(self.ts))
+        for name in ('ts', 'high', 'close', 'volume'):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:self.n] = old[:self.n]
+            setattr(self, name, new)
+
+class MinuteBarStore:
+    """
+    Today's 1m bars per symbol in compact NumPy arrays (epoch-second timestamps,
+    float32 high/close/volume). Bars are merged by timestamp, so a delta download
+    that re-sends the still-forming last bar replaces it instead of double counting.
+    Everything is dropped when the New York trading day changes.
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.series = {}
+        self.day = None
+        self.day_start = 0
+
+    def roll(self, now=None):
+        now_est = now or datetime.datetime.now(NY_TZ)
+        day = now_est.strftime('%Y-%m-%d')
+        if day != self.day:
+            with self.lock:
+                self.series = {}
+                self.day = day
+                self.day_start = int(now_est.replace(hour=0, minute=0, second=0, microsecond=0).timestamp())
+
+    def merge(self, bars):
+        """bars: {symbol: (ts, high, close, volume)} arrays sorted by ts"""
+        with self.lock:
+            for symbol, (ts, high, close, volume) in bars.items():
+                keep = ts >= self.day_start
+                ts, high, close, volume = ts[keep], high[keep], close[keep], volume[keep]
+                series = self.series.get(symbol)
+                if series is None:
+                    series = self.series[symbol] = _BarSeries(max(len(ts), 64))
+                if len(ts):
+                    cut = int(np.searchsorted(series.ts[:series.n], ts[0]))
+                    series.reserve(cut + len(ts))
+                    series.ts[cut:cut + len(ts)] = ts
+                    series.high[cut:cut + len(ts)] = high
+                    series.close[cut:cut + len(ts)] = close
+                    series.volume[cut:cut + len(ts)] = volume
+                    series.n = cut + len(ts)
+
+    def mark_fetched(self, symbols, fetched_at):
+        """Record a completed fetch, including symbols that returned no bars"""
+        with self.lock:
+            for symbol in symbols:
+                series = self.series.get(symbol)
+                if series is None:
+                    series = self.series[symbol] = _BarSeries(64)
+                series.fetched_at = fetched_at
+
+    def delta_start(self, symbols):
+        """Epoch to resume a chunk download from, or None if any symbol needs a full day"""
+        with self.lock:
+            starts = []
+            for symbol in symbols:
+                series = self.series.get(symbol)
+                if series is None or not series.fetched_at:
+                    return None
+                starts.append(series.fetched_at)
+        if not starts:
+            return None
+        return max(self.day_start, (min(starts) - MINUTE_BARS_OVERLAP) // 60 * 60)
+
+    def snapshot(self, symbols):
+        """Aligned arrays (last_close, last_volume, cum_volume, day_high); NaN where no bars"""
+        count = len(symbols)
+        last_close = np.full(count, np.nan)
+        last_volume = np.full(count, np.nan)
+        cum_volume = np.zeros(count)
+        day_high = np.full(count, np.nan)
+        with self.lock:
+            for i, symbol in enumerate(symbols):
+                series = self.series.get(symbol)
+                if series is None or not series.n:
+                    continue
+                n = series.n
+                last_close[i] = series.close[n - 1]
+                last_volume[i] = series.volume[n - 1]
+                cum_volume[i] = series.volume[:n].sum(dtype=np.float64)
+                day_high[i] = series.high[:n].max()
+        return last_close, last_volume, cum_volume, day_high
+
+    def summary(self, symbol):
+        last_close, last_volume, cum_volume, day_high = self.snapshot([symbol])
+        if np.isnan(last_close[0]):
+            return None
+        return {'current_price': float(last_close[0]), 'cbvol': int(last_volume[0]),
+                'volume': int(cum_volume[0]), 'day_high': float(day_high[0])}
+
+def minute_bars_from_frame(data, symbols):
+    """
+    Split one yf.download(group_by='ticker') frame into per-symbol sorted arrays.
+    Returns {symbol: (ts, high, close, volume)}; symbols without bars are omitted.
+    """
+    if data is None or data.empty or not symbols:
+        return {}
+    if not isinstance(data.columns, pd.MultiIndex):
+        data = pd.concat({symbols[0]: data}, axis=1)
+    try:
+        closes = data.xs('Close', axis=1, level=1).reindex(columns=symbols).to_numpy(dtype=np.float32)
+        highs = data.xs('High', axis=1, level=1).reindex(columns=symbols).to_numpy(dtype=np.float32)
+        volumes = data.xs('Volume', axis=1, level=1).reindex(columns=symbols).to_numpy(dtype=np.float32)
+    except KeyError:
+        return {}
+    ts = pd.DatetimeIndex(data.index).as_unit('s').asi8
+    order = np.argsort(ts, kind='stable')
+    ts, closes, highs, volumes = ts[order], closes[order], highs[order], np.nan_to_num(volumes[order])
+
+    bars = {}
+    valid = ~np.isnan(closes)
+    for i in np.flatnonzero(valid.any(axis=0)):
+        rows = valid[:, i]
+        bars[symbols[i]] = (ts[rows], highs[rows, i], closes[rows, i], volumes[rows, i])
+    return bars
+
+def tier1_prefilter(symbols, last_close, last_volume, cum_volume, avg_volumes, prev_closes):
+    """
+    Vectorized Tier 1 gates over one chunk's per-symbol reductions (MinuteBarStore.snapshot).
+    Applies price band, volume and gap gates as masks.
+    avg_volumes / prev_closes: {symbol: value} lookups (missing -> 0 / no gap data).
+    Returns (candidates, missing_fundamentals).
+    """
+    if not symbols:
+        return [], 0
+    avg_volume = np.fromiter((avg_volumes.get(s, 0) or 0 for s in symbols), dtype=float, count=len(symbols))
+    prev_close = np.fromiter((prev_closes.get(s, 0) or 0 for s in symbols), dtype=float, count=len(symbols))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        gap_pct = np.where(prev_close > 0, (last_close - prev_close) / prev_close * 100, np.nan)
+
+    price_mask = (last_close >= TIER1_PRICE_MIN) & (last_close <= TIER1_PRICE_MAX) & ~np.isnan(last_volume)
+    mask = price_mask & (avg_volume >= TIER1_MIN_AVG_VOLUME)
+    if TIER1_MIN_GAP_PCT > 0:
+        mask &= np.abs(np.nan_to_num(gap_pct)) >= TIER1_MIN_GAP_PCT
+    missing_fundamentals = int(np.count_nonzero(price_mask & (avg_volume <= 0)))
+
+    candidates = []
+    for i in np.flatnonzero(mask):
+        candidates.append({
+            'symbol': symbols[i],
+            'current_price': float(last_close[i]),
+            'volume': int(last_volume[i]),
+            'cum_volume': int(cum_volume[i]),
+            'avg_volume': int(avg_volume[i]),
+            'prev_close': float(prev_close[i]) if prev_close[i] > 0 else float(last_close[i]),
+            'gap_pct': float(gap_pct[i]) if not np.isnan(gap_pct[i]) else 0.0
+        })
+    return candidates, missing_fundamentals
+
+class RateLimiter:
+    """
+    Thread-safe token bucket shared by the Tier 1 chunk submitters.
+    acquire() blocks until a token is free; penalize() holds every caller back
+    (used after a failed chunk instead of a fixed per-chunk sleep).
+    """
+    def __init__(self, rate, burst=1):
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self.tokens = float(self.burst)
+        self.last = time.monotonic()
+        self.blocked_until = 0.0
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.last) * self.rate)
+                self.last = now
+                if now >= self.blocked_until and self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                delay = max(self.blocked_until - now, (1 - self.tokens) / self.rate)
+            time.sleep(delay)
+
+    def try_acquire(self):
+        """Non-blocking acquire - False if no token is available right now"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            if now >= self.blocked_until and self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+    def penalize(self, seconds):
+        with self.lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+            self.tokens = 0.0
+
+class PriorityScanScheduler:
+    """
+    Urgency heap feeding the data tiers: news triggers before enriched tickers (by score).
+    Each class drains under its own RateLimiter budget; entries over budget stay queued.
+    The rotation class has no heap entries - rotation_batch() picks the stalest tickers.
+    """
+    CLASS_RANK = {'news': 0, 'enriched': 1, 'rotation': 2}
+
+    def __init__(self, budgets):
+        self.heap = []
+        self.queued = {}  # symbol -> rank of its live heap entry
+        self.limiters = {cls: RateLimiter(rate, burst) for cls, (rate, burst) in budgets.items()}
+        self.last_scanned = {}
+        self.dispatched = {cls: 0 for cls in self.CLASS_RANK}
+        self.seq = 0
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+
+    def push(self, symbol, cls, score=0.0):
+        """Queue symbol under cls unless it is already queued at the same or higher urgency"""
+        rank = self.CLASS_RANK[cls]
+        with self.lock:
+            if self.queued.get(symbol, len(self.CLASS_RANK)) <= rank:
+                return False
+            self.queued[symbol] = rank
+            self.seq += 1
+            heapq.heappush(self.heap, (rank, -score, self.seq, symbol, cls))
+        if cls == 'news':
+            self.wakeup.set()
+        return True
+
+    def pop_ready(self, limit=100):
+        """Pop up to limit queued symbols whose class still has budget -> [(symbol, cls)]"""
+        ready, deferred, exhausted = [], [], set()
+        now = time.time()
+        with self.lock:
+            while self.heap and len(ready) < limit:
+                entry = heapq.heappop(self.heap)
+                rank, _, _, symbol, cls = entry
+                if self.queued.get(symbol) != rank:
+                    continue  # superseded by a more urgent push
+                if cls in exhausted or not self.limiters[cls].try_acquire():
+                    exhausted.add(cls)
+                    deferred.append(entry)
+                    continue
+                del self.queued[symbol]
+                self.last_scanned[symbol] = now
+                self.dispatched[cls] += 1
+                ready.append((symbol, cls))
+            for entry in deferred:
+                heapq.heappush(self.heap, entry)
+        return ready
+
+    def rotation_batch(self, symbols, size):
+        """The size least recently scanned symbols (never scanned first), marked as scanned"""
+        now = time.time()
+        with self.lock:
+            batch = heapq.nsmallest(size, symbols, key=lambda s: self.last_scanned.get(s, 0))
+            for symbol in batch:
+                self.last_scanned[symbol] = now
+            self.dispatched['rotation'] += len(batch)
+        return batch
+
+    def depth(self):
+        with self.lock:
+            return len(self.queued)
+
+def tier1_fetch_chunk(chunk, start_ts=None):
+    """
+    Tier 1 worker: download one chunk's 1m bars (full day, or only bars since
+    start_ts) and split them into per-symbol arrays.
+    Runs in a spawned process (yf.download keeps module-global state and is not
+    thread-safe), so only plain dicts and NumPy arrays cross the process boundary.
+    """
+    result = {'symbols': len(chunk), 'bars': {}, 'bar_count': 0, 'delta': start_ts is not None,
+              'download_s': 0.0, 'parse_s': 0.0, 'error': None, 'fetched_at': int(time.time())}
+    t0 = time.perf_counter()
+    try:
+        if start_ts is None:
+            data = yf.download(tickers=chunk, period="1d", interval="1m", group_by='ticker', threads=True, progress=False)
+        else:
+            start = datetime.datetime.fromtimestamp(start_ts, tz=datetime.timezone.utc)
+            data = yf.download(tickers=chunk, start=start, interval="1m", group_by='ticker', threads=True, progress=False)
+        t1 = time.perf_counter()
+        result['download_s'] = t1 - t0
+        if data.empty:
+            result['error'] = 'empty'
+            return result
+        result['bars'] = minute_bars_from_frame(data, chunk)
+        result['bar_count'] = sum(len(b[0]) for b in result['bars'].values())
+        result['parse_s'] = time.perf_counter() - t1
+    except Exception as e:
+        result['download_s'] = result['download_s'] or time.perf_counter() - t0
+        result['error'] = str(e)
+    return result
 
 def yfinance_bulk_download(universe):
     """
@@ -2053,6 +3367,192 @@ def yfinance_bulk_download(universe):
 
 import threading
 
+class JsonStreamCodec:
+    """Alpaca stream wire format: JSON text frames"""
+    name = 'json'
+    headers = []
+
+    def decode(self, message):
+        return json.loads(message)
+
+    def send(self, ws, obj):
+        ws.send(json.dumps(obj))
+
+class MsgpackStreamCodec:
+    """
+    Alpaca stream wire format: MessagePack binary frames (requested with the
+    Content-Type header). Timestamps arrive as msgpack ext types and are decoded
+    to tz-aware datetimes.
+    """
+    name = 'msgpack'
+    headers = ['Content-Type: application/msgpack']
+
+    def decode(self, message):
+        return msgpack.unpackb(message, timestamp=3)
+
+    def send(self, ws, obj):
+        ws.send(msgpack.packb(obj), opcode=websocket.ABNF.OPCODE_BINARY)
+
+def get_stream_codec(fmt=None):
+    fmt = fmt or ALPACA_STREAM_FORMAT
+    if fmt == 'msgpack':
+        if msgpack is not None:
+            return MsgpackStreamCodec()
+        print("[STREAM] msgpack not installed - falling back to JSON")
+    return JsonStreamCodec()
+
+def stream_timestamp(value):
+    """Normalize a stream timestamp (RFC3339 string or datetime) to an ISO string"""
+    return value.isoformat() if isinstance(value, datetime.datetime) else value
+
+def bench_stream_decoders(messages=1000, per_frame=10, rounds=200):
+    """
+    Micro-benchmark: decode cost per `messages` Alpaca quote messages, JSON vs msgpack,
+    sent as frames of `per_frame` quotes. Run with: python 193.py -- --bench
+    """
+    ts = datetime.datetime.now(datetime.timezone.utc)
+    frames = []
+    for f in range(messages // per_frame):
+        frames.append([{
+            "T": "q", "S": f"SYM{f * per_frame + i}", "bx": "V", "bp": 4.21, "bs": 3,
+            "ax": "V", "ap": 4.23, "as": 5, "c": ["R"], "z": "C", "t": ts
+        } for i in range(per_frame)])
+    payloads = {'json': [json.dumps(fr, default=lambda d: d.isoformat().replace('+00:00', 'Z')) for fr in frames]}
+    if msgpack is not None:
+        payloads['msgpack'] = [msgpack.packb(fr, datetime=True) for fr in frames]
+    else:
+        print("[BENCH] msgpack not installed - JSON only")
+
+    results = {}
+    for fmt, encoded in payloads.items():
+        codec = get_stream_codec(fmt)
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for payload in encoded:
+                codec.decode(payload)
+        per_1000 = (time.perf_counter() - start) / rounds / messages * 1000
+        results[fmt] = per_1000
+        size = sum(len(p) for p in encoded)
+        print(f"[BENCH] {fmt:8s} {per_1000 * 1e6:8.1f} us / 1000 quotes  ({size / messages:.0f} bytes/quote)")
+    if len(results) == 2:
+        print(f"[BENCH] msgpack decode is {results['json'] / results['msgpack']:.2f}x JSON")
+    return results
+
+class AlpacaStreamManager:
+    """
+    One long-lived Alpaca stream connection (market data or news).
+    Owns auth and reconnects, and keeps the desired subscription set: set_symbols()
+    only sends subscribe/unsubscribe deltas, and the full set is re-sent after
+    every (re)authentication. Data messages go to on_data(msg).
+    """
+    def __init__(self, url, channels, on_data, tag, logger=None, codec=None):
+        self.url = url
+        self.codec = codec or get_stream_codec()
+        self.channels = channels          # e.g. ('quotes', 'trades') or ('news',)
+        self.on_data = on_data
+        self.tag = tag
+        self.logger = logger or scanner_logger
+        self.desired = set()
+        self.subscribed = set()
+        self.authenticated = False
+        self.running = False
+        self.ws = None
+        self.thread = None
+        self.lock = threading.Lock()
+        self.stats = {'connects': 0, 'subscribe_msgs': 0, 'unsubscribe_msgs': 0}
+
+    def start(self):
+        if self.thread and self.thread.is_alive():
+            return
+        self.running = True
+        self.ws = websocket.WebSocketApp(
+            self.url,
+            header=self.codec.headers,
+            on_open=self._on_open,
+            on_message=self._on_message,
+            on_error=self._on_error,
+            on_close=self._on_close
+        )
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        while self.running:
+            try:
+                self.ws.run_forever(sslopt={"cert_reqs": ssl.CERT_NONE}, ping_interval=20, ping_timeout=10,
+                                    reconnect=ALPACA_STREAM_RECONNECT)
+            except Exception as e:
+                self.logger.error(f"[{self.tag}] Stream loop error: {e}")
+            if self.running:
+                time.sleep(ALPACA_STREAM_RECONNECT)
+
+    def stop(self):
+        self.running = False
+        if self.ws:
+            self.ws.close()
+
+    def set_symbols(self, symbols):
+        """Make symbols the live subscription set (deltas only if already connected)"""
+        with self.lock:
+            self.desired = set(symbols)
+            if self.authenticated:
+                self._sync()
+
+    def _sync(self):
+        # Caller holds self.lock
+        added = sorted(self.desired - self.subscribed)
+        removed = sorted(self.subscribed - self.desired)
+        try:
+            if removed:
+                self.codec.send(self.ws, {"action": "unsubscribe", **{ch: removed for ch in self.channels}})
+                self.stats['unsubscribe_msgs'] += 1
+            if added:
+                self.codec.send(self.ws, {"action": "subscribe", **{ch: added for ch in self.channels}})
+                self.stats['subscribe_msgs'] += 1
+            self.subscribed = set(self.desired)
+            if added or removed:
+                print(f"[{self.tag}] Subscription +{len(added)} -{len(removed)} ({len(self.subscribed)} live)")
+        except Exception as e:
+            print(f"[{self.tag}] Subscribe error: {e}")
+            self.logger.error(f"[{self.tag}] Subscribe error: {e}")
+
+    def _on_open(self, ws):
+        with self.lock:
+            self.authenticated = False
+            self.subscribed = set()
+        self.stats['connects'] += 1
+        print(f"[{self.tag}] Alpaca stream connected ({self.codec.name}), authenticating...")
+        self.codec.send(ws, {"action": "auth", "key": ALPACA_API_KEY, "secret": ALPACA_SECRET_KEY})
+
+    def _on_message(self, ws, message):
+        try:
+            data = self.codec.decode(message)
+            if not isinstance(data, list):
+                return
+            for msg in data:
+                msg_type = msg.get("T")
+                if msg_type == "success" and msg.get("msg") == "authenticated":
+                    print(f"[{self.tag}] ✓ Authenticated with Alpaca")
+                    with self.lock:
+                        self.authenticated = True
+                        self._sync()
+                elif msg_type == "error":
+                    self.logger.error(f"[{self.tag}] Stream error {msg.get('code')}: {msg.get('msg')}")
+                elif msg_type not in ("success", "subscription"):
+                    self.on_data(msg)
+        except Exception as e:
+            print(f"[{self.tag}] Message processing error: {e}")
+            self.logger.error(f"[{self.tag}] Message processing error: {e}")
+
+    def _on_error(self, ws, error):
+        print(f"[{self.tag}] WebSocket error: {error}")
+
+    def _on_close(self, ws, *args):
+        with self.lock:
+            self.authenticated = False
+            self.subscribed = set()
+        print(f"[{self.tag}] Alpaca stream closed")
+
 def start_alpaca_websocket_validate(candidates, on_validate):
     """
     Launch Alpaca WebSocket, authenticate, subscribe to candidate tickers, and validate price (2% variance).
@@ -2177,7 +3677,6 @@ def get_tradier_session_id():
     """
     Fetch Tradier WebSocket session ID via REST.
     """
-    import requests
     print("[TRADIER] Requesting WebSocket session ID...")
     scanner_logger.info("[TRADIER] Requesting WebSocket session ID...")
     url = "https://api.tradier.com/v1/markets/events/session"
@@ -2185,7 +3684,7 @@ def get_tradier_session_id():
         "Authorization": f"Bearer {TRADIER_ACCESS_TOKEN}",
         "Accept": "application/json"
     }
-    response = requests.post(url, headers=headers)
+    response = http_client.post(url, provider='tradier', headers=headers)
     if response.status_code == 200:
         data = response.json()
         session_id = data["stream"]["sessionid"]
@@ -2202,7 +3701,6 @@ def tradier_manual_update(symbols):
     Manual bulk quote update for current tickers (user-triggered).
     Returns dict of {symbol: data_dict}.
     """
-    import requests
     import datetime
     url = "https://api.tradier.com/v1/markets/quotes"
     headers = {
@@ -2213,7 +3711,7 @@ def tradier_manual_update(symbols):
         "symbols": ",".join(symbols),
         "greeks": "false"
     }
-    response = requests.get(url, headers=headers, params=params)
+    response = http_client.get(url, provider='tradier', headers=headers, params=params)
     updated = {}
     if response.status_code == 200:
         data = response.json()
@@ -2236,6 +3734,317 @@ def tradier_manual_update(symbols):
         print(f"[TRADIER] REST update failed: {response.status_code}")
     return updated
 
+class QuickMoveDetector:
+    """
+    Sliding-window min/max of recent prices per symbol for quick-move checks.
+    Each window keeps two monotonic deques of (timestamp, price) - increasing for
+    the minimum, decreasing for the maximum - so record() and the window lookups
+    are amortized O(1) per tick. Shared by Tier 3 and CategorizationEngine.quick_move.
+    """
+    def __init__(self, windows=QUICK_MOVE_WINDOWS):
+        self.windows = tuple(sorted(windows))
+        self.state = {}  # symbol -> {window: (min_deque, max_deque)}
+        self.lock = threading.Lock()
+
+    def record(self, symbol, price, now=None):
+        now = now if now is not None else time.time()
+        price = float(price)
+        with self.lock:
+            windows = self.state.get(symbol)
+            if windows is None:
+                windows = self.state[symbol] = {w: (deque(), deque()) for w in self.windows}
+            for window, (mins, maxs) in windows.items():
+                while mins and mins[-1][1] >= price:
+                    mins.pop()
+                mins.append((now, price))
+                while maxs and maxs[-1][1] <= price:
+                    maxs.pop()
+                maxs.append((now, price))
+                cutoff = now - window
+                while mins[0][0] < cutoff:
+                    mins.popleft()
+                while maxs[0][0] < cutoff:
+                    maxs.popleft()
+
+    def window_range(self, symbol, window, now=None):
+        """(min, max) price over the last `window` seconds, or None if no ticks"""
+        now = now if now is not None else time.time()
+        with self.lock:
+            windows = self.state.get(symbol)
+            if not windows:
+                return None
+            mins, maxs = windows[window]
+            cutoff = now - window
+            while mins and mins[0][0] < cutoff:
+                mins.popleft()
+            while maxs and maxs[0][0] < cutoff:
+                maxs.popleft()
+            if not mins:
+                return None
+            return mins[0][1], maxs[0][1]
+
+    def move_pct(self, symbol, price, window, now=None):
+        """Percent move of price above the window minimum (0 if unknown)"""
+        price_range = self.window_range(symbol, window, now)
+        if not price_range or price_range[0] <= 0:
+            return 0.0
+        return (float(price) - price_range[0]) / price_range[0] * 100
+
+    def discard(self, symbol):
+        with self.lock:
+            self.state.pop(symbol, None)
+
+class AlertStateMachine:
+    """
+    Per (symbol, timeframe) alert hysteresis: armed -> fired -> cooldown -> armed.
+    - armed: fires as soon as the condition holds
+    - fired: quiet for `cooldown` seconds whatever the condition does
+    - cooldown: re-arms once the condition clears, or on a new high more than
+      `rearm_pct` beyond the fired price (which fires again on the same tick)
+    update() returns the new state on a transition, else None - callers alert on FIRED only.
+    """
+    ARMED, FIRED, COOLDOWN = 'armed', 'fired', 'cooldown'
+
+    def __init__(self, cooldown=QUICK_MOVE_COOLDOWN, rearm_pct=QUICK_MOVE_REARM_PCT):
+        self.cooldown = cooldown
+        self.rearm_pct = rearm_pct
+        self.state = {}  # (symbol, timeframe) -> [state, fired_price, fired_at]
+        self.transitions = 0
+        self.suppressed = 0
+
+    def update(self, symbol, timeframe, triggered, price, now=None):
+        now = now if now is not None else time.time()
+        key = (symbol, timeframe)
+        entry = self.state.get(key)
+        if entry is None:
+            entry = self.state[key] = [self.ARMED, 0.0, 0.0]
+        state, fired_price, fired_at = entry
+        transition = None
+        
+        if state == self.FIRED and now - fired_at >= self.cooldown:
+            entry[0] = state = transition = self.COOLDOWN
+        if state == self.COOLDOWN and (not triggered or price > fired_price * (1 + self.rearm_pct / 100)):
+            entry[0] = state = transition = self.ARMED
+        if state == self.ARMED and triggered:
+            entry[:] = [self.FIRED, float(price), now]
+            transition = self.FIRED
+        elif triggered:
+            self.suppressed += 1
+        
+        if transition:
+            self.transitions += 1
+        return transition
+
+    def discard(self, symbol):
+        for key in [k for k in self.state if k[0] == symbol]:
+            del self.state[key]
+
+def bench_quick_move_detector(symbols=500, ticks_per_sec=20, seconds=60, legacy_symbols=10):
+    """
+    Benchmark the quick-move path at `symbols` x `ticks_per_sec`: QuickMoveDetector vs
+    the old list rebuild + two full scans per tick. Both are pre-warmed with a full
+    10-minute window; the legacy run uses `legacy_symbols` symbols to keep memory sane
+    (its per-tick cost depends on window length, not symbol count).
+    """
+    rng = random.Random(7)
+    window = max(QUICK_MOVE_WINDOWS)
+    warm_ticks = window * ticks_per_sec
+    step = 1.0 / ticks_per_sec
+
+    detector = QuickMoveDetector()
+    names = [f"SYM{i}" for i in range(symbols)]
+    for t in range(window):  # 1 tick/s is enough to fill the deques' steady state
+        for name in names:
+            detector.record(name, 5 + rng.random(), t)
+    t0 = window
+    ticks = 0
+    start = time.perf_counter()
+    for i in range(seconds * ticks_per_sec):
+        t = t0 + i * step
+        for name in names:
+            price = 5 + rng.random()
+            detector.record(name, price, t)
+            for w in QUICK_MOVE_WINDOWS:
+                detector.move_pct(name, price, w, t)
+            ticks += 1
+    new_us = (time.perf_counter() - start) / ticks * 1e6
+
+    history = {f"SYM{i}": [{"price": 5 + rng.random(), "timestamp": j * step} for j in range(warm_ticks)]
+               for i in range(legacy_symbols)}
+    legacy_ticks = 0
+    start = time.perf_counter()
+    for i in range(ticks_per_sec * 5):
+        t = t0 + i * step
+        for name in history:
+            price = 5 + rng.random()
+            history[name].append({"price": price, "timestamp": t})
+            history[name] = [p for p in history[name] if p["timestamp"] > t - window]
+            for w in QUICK_MOVE_WINDOWS:
+                prices = [p["price"] for p in history[name] if p["timestamp"] >= t - w]
+                min(prices), max(prices)
+            legacy_ticks += 1
+    legacy_us = (time.perf_counter() - start) / legacy_ticks * 1e6
+
+    load = symbols * ticks_per_sec
+    print(f"[BENCH] quick-move detector {new_us:8.2f} us/tick -> {new_us * load / 1e4:6.1f}% of a core at {load:,} ticks/s")
+    print(f"[BENCH] quick-move legacy   {legacy_us:8.2f} us/tick -> {legacy_us * load / 1e4:6.1f}% of a core at {load:,} ticks/s")
+    return new_us, legacy_us
+
+class CategorizationEngine:
+    """
+    Channel categorization on its own worker thread.
+    Producers submit() tick snapshots into a bounded queue and never wait: when the
+    queue is full the oldest snapshot is dropped. The worker classifies each snapshot,
+    diffs it against the symbol's current channel membership and publishes
+    {'symbol', 'row', 'channels', 'added', 'removed'} to the UI through ui_bus.
+    News for newly categorized symbols is fetched on a separate news thread.
+    """
+    TECHNICAL_CHANNELS = ("PreGap", "HOD", "RunUp", "P-HOD", "P-RunUp", "Rvsl")
+
+    def __init__(self, quick_moves, maxsize=CATEGORIZER_QUEUE_SIZE):
+        self.quick_moves = quick_moves
+        self.queue = queue.Queue(maxsize=maxsize)
+        self.news_queue = queue.Queue()
+        self.news_inflight = set()
+        self.membership = {}
+        self.on_diff = None        # UI handler, called on the Kivy thread
+        self.news_lookup = None    # symbol -> cached news dict or None
+        self.news_fetcher = None   # symbol -> None, blocking HTTP allowed
+        self.running = False
+        self.stats = {'submitted': 0, 'dropped': 0, 'processed': 0, 'diffs': 0, 'news_fetches': 0}
+
+    def start(self):
+        if self.running:
+            return
+        self.running = True
+        threading.Thread(target=self._worker, daemon=True).start()
+        threading.Thread(target=self._news_worker, daemon=True).start()
+
+    def stop(self):
+        self.running = False
+
+    def submit(self, snapshot):
+        """Enqueue a tick snapshot without blocking the caller"""
+        self.stats['submitted'] += 1
+        while True:
+            try:
+                self.queue.put_nowait(snapshot)
+                return
+            except queue.Full:
+                try:
+                    self.queue.get_nowait()
+                    self.stats['dropped'] += 1
+                except queue.Empty:
+                    pass
+
+    def discard(self, symbol):
+        self.membership.pop(symbol, None)
+
+    def quick_move(self, symbol, price, now=None):
+        """5% in 5 minutes or 10% in 10 minutes"""
+        now = now or time.time()
+        return (self.quick_moves.move_pct(symbol, price, 300, now) >= 5.0 or
+                self.quick_moves.move_pct(symbol, price, 600, now) >= 10.0)
+
+    def classify(self, snap):
+        """Channels a tick snapshot qualifies for"""
+        symbol = snap['symbol']
+        price = snap['price']
+        change_pct = snap['change_pct']
+        volume = snap['volume']
+        rvol = snap['rvol']
+        float_shares = snap['float']
+        is_new_hod = snap['is_new_hod']
+        now_est = datetime.datetime.now(NY_TZ)
+        is_premarket = now_est.hour < 9 or (now_est.hour == 9 and now_est.minute < 30)
+        channels = set()
+
+        # PreGap: <= $15, premarket, >=10% change, >=500K volume, <=100M float
+        if (is_premarket and price <= 15.0 and abs(change_pct) >= 10.0 and
+            volume >= 500000 and float_shares <= 100000000):
+            channels.add('PreGap')
+        # HOD: $1-$15, new HOD, >=5.0x RVOL, <=100M float, >=+10% gain
+        if (1.0 <= price <= 15.0 and is_new_hod and rvol >= 5.0 and
+            float_shares <= 100000000 and change_pct >= 10.0):
+            channels.add('HOD')
+        # RunUp: $1-$15, gap>=10%, >=5x RVOL, float<10M, quick move
+        if (1.0 <= price <= 15.0 and change_pct >= 10.0 and
+            rvol >= 5.0 and float_shares < 10 and self.quick_move(symbol, price)):
+            channels.add('RunUp')
+        # P-HOD: <= $1, new HOD, >=5.0x RVOL, <=100M float, >=+10% gain
+        if (price <= 1.0 and is_new_hod and rvol >= 5.0 and
+            float_shares <= 100000000 and change_pct >= 10.0):
+            channels.add('P-HOD')
+        # P-RunUp: <= $1, gap>=10%, >=7x RVOL, float<10M, quick move
+        if (price <= 1.0 and change_pct >= 10.0 and
+            rvol >= 7.0 and float_shares < 10 and self.quick_move(symbol, price)):
+            channels.add('P-RunUp')
+        # Rvsl: <=$15, >=8.0x RVOL, >=8% change
+        if price <= 15.0 and rvol >= 8.0 and abs(change_pct) >= 8.0:
+            channels.add('Rvsl')
+        # Breaking News: breaking headline within the last 2 hours, regardless of technicals
+        news = (self.news_lookup(symbol) if self.news_lookup else None) or {}
+        if news.get('is_breaking', False) and news.get('age_hours', 999) <= 2.0:
+            channels.add('BKG-News')
+        return channels
+
+    def process(self, snap):
+        symbol = snap['symbol']
+        channels = self.classify(snap)
+        previous = self.membership.get(symbol, frozenset())
+        self.stats['processed'] += 1
+        if not channels and not previous:
+            return None
+        self.membership[symbol] = frozenset(channels)
+        diff = {
+            'symbol': symbol,
+            'row': snap['row'],
+            'channels': frozenset(channels),
+            'added': frozenset(channels - previous),
+            'removed': previous - channels,
+        }
+        if diff['added'] & set(self.TECHNICAL_CHANNELS):
+            self._request_news(symbol)
+        if self.on_diff:
+            ui_bus.post(('channels', symbol), self.on_diff, diff)
+            self.stats['diffs'] += 1
+        return diff
+
+    def _request_news(self, symbol):
+        if not self.news_fetcher or symbol in self.news_inflight:
+            return
+        if self.news_lookup and self.news_lookup(symbol):
+            return
+        self.news_inflight.add(symbol)
+        self.news_queue.put(symbol)
+
+    def _worker(self):
+        while self.running:
+            try:
+                snap = self.queue.get(timeout=1)
+            except queue.Empty:
+                continue
+            try:
+                self.process(snap)
+            except Exception as e:
+                print(f"[CATEGORIZE] Worker error: {e}")
+                scanner_logger.error(f"[CATEGORIZE] Worker error: {e}")
+
+    def _news_worker(self):
+        while self.running:
+            try:
+                symbol = self.news_queue.get(timeout=1)
+            except queue.Empty:
+                continue
+            try:
+                self.news_fetcher(symbol)
+                self.stats['news_fetches'] += 1
+            except Exception as e:
+                print(f"[CATEGORIZE] News fetch error for {symbol}: {e}")
+            finally:
+                self.news_inflight.discard(symbol)
+
+
 class MarketDataManager:
     def __init__(self, callback, news_manager_ref=None, enrichment_manager_ref=None):
         self.callback = callback
@@ -2247,11 +4056,13 @@ class MarketDataManager:
         self.tier2_validated_queue = queue.Queue()
         self.stock_data = {}
         self.candidate_alerted = set()
-        self.tradier_price_history = {}
+        self.quick_moves = QuickMoveDetector()
+        self.quick_move_alerts = AlertStateMachine()
+        self.categorizer = CategorizationEngine(self.quick_moves)
         self.tradier_ws = None
         self.tradier_session_id = None
         self.current_tradier_symbols = []
-        self.alpaca_ws = None
+        self.alpaca_stream = None
         self.current_alpaca_symbols = []
         self.alpaca_validated_data = {}
         self.price_history = {}
@@ -2259,8 +4070,14 @@ class MarketDataManager:
         self.all_tickers = []
         self.market_open_time = None
         self.scan_count = 0
-        self.rotation_offset = 0
-        self.news_trigger_queue = set()
+        self.scan_scheduler = PriorityScanScheduler(SCAN_CLASS_BUDGETS)
+        self.tier1_pool = None
+        self.tier1_rate_limiter = RateLimiter(TIER1_CHUNK_RATE, TIER1_CHUNK_BURST)
+        self.tier1_last_pass = {}
+        self.tier1_pass_id = 0
+        self.minute_bars = MinuteBarStore()
+        self.tier1_promoted = set()
+        self.tier1_promoted_day = None
         self.maintenance_engine = MaintenanceEngine()
         self.load_all_caches()
         self.start_maintenance_scheduler()
@@ -2281,8 +4098,7 @@ class MarketDataManager:
         print(f"[CACHE] Saved all caches")
 
     def add_news_trigger(self, symbol, title):
-        if symbol and symbol.upper() not in self.news_trigger_queue:
-            self.news_trigger_queue.add(symbol.upper())
+        if symbol and self.scan_scheduler.push(symbol.upper(), 'news'):
             print(f"[NEWS-TRIGGER] {symbol}: {title[:50]}")
 
     def start_maintenance_scheduler(self):
@@ -2320,138 +4136,257 @@ class MarketDataManager:
             return
         print(f"Starting scanner with {len(self.all_tickers)} tickers")
         self.running = True
+        self.categorizer.start()
         now_est = datetime.datetime.now(NY_TZ)
         self.market_open_time = now_est.replace(hour=9, minute=30, second=0, microsecond=0)
         # Launch Three-Tier Architecture
         threading.Thread(target=self._tier1_yfinance_bulk_prefilter, daemon=True).start()
         threading.Thread(target=self._tier2_alpaca_websocket_manager, daemon=True).start()
         threading.Thread(target=self._tier3_tradier_websocket_manager, daemon=True).start()
+        threading.Thread(target=self._priority_scan_loop, daemon=True).start()
         print("[SCANNER] Three-Tier Architecture launched: Tier1 (yfinance) -> Tier2 (Alpaca) -> Tier3 (Tradier)")
 
-    def _bulk_scan_loop(self):
+    def _priority_scan_loop(self):
+        """
+        Feeds news-triggered and enriched tickers straight to Tier 2 as priority batches,
+        ahead of the hourly Tier 1 pass. Wakes immediately on a news trigger.
+        """
+        last_enriched = 0
         while self.running:
             try:
-                self.scan_count += 1
-                print(f"\n=== SCAN #{self.scan_count} ===")
-                start_time = time.time()
-                
-                scan_list = []
-                
-                if self.enrichment_manager_ref:
-                    enriched_list = self.enrichment_manager_ref.get_enriched_list()
-                    scan_list.extend(enriched_list)
-                    print(f"Priority 1: {len(enriched_list)} enriched")
+                self.scan_scheduler.wakeup.wait(1.0)
+                self.scan_scheduler.wakeup.clear()
                 
-                rotation_size = 500
-                if len(self.all_tickers) > 0:
-                    rotation_slice = []
-                    for i in range(rotation_size):
-                        idx = (self.rotation_offset + i) % len(self.all_tickers)
-                        rotation_slice.append(self.all_tickers[idx])
-                    scan_list.extend(rotation_slice)
-                    self.rotation_offset = (self.rotation_offset + rotation_size) % len(self.all_tickers)
-                    print(f"Priority 2: {len(rotation_slice)} rotation")
+                if self.enrichment_manager_ref and time.time() - last_enriched >= ENRICHED_REFRESH_INTERVAL:
+                    for symbol, info in list(self.enrichment_manager_ref.enriched.items()):
+                        self.scan_scheduler.push(symbol, 'enriched', info.get('score', 0))
+                    last_enriched = time.time()
                 
-                if len(self.news_trigger_queue) > 0:
-                    news_list = list(self.news_trigger_queue)
-                    scan_list.extend(news_list)
-                    print(f"Priority 3: {len(news_list)} news-triggered")
-                    self.news_trigger_queue.clear()
-                
-                scan_list = list(set(scan_list))
-                # DISABLED - NOW USING 3-TIER SYSTEM
-                # self.batch_scan_tickers(scan_list)
-                pass
-                
-                print(f"Scan completed in {time.time() - start_time:.1f}s")
-                time.sleep(300)
+                ready = self.scan_scheduler.pop_ready()
+                if not ready:
+                    continue
+                self.scan_count += 1
+                items = [self._priority_scan_item(symbol, cls) for symbol, cls in ready]
+                self.tier1_shortlist_queue.put({'pass_id': None, 'candidates': items, 'final': False, 'priority': True})
+                news_count = sum(1 for _, cls in ready if cls == 'news')
+                scanner_logger.info(f"[PRIORITY] Scan #{self.scan_count}: {news_count} news, {len(ready) - news_count} enriched -> Tier 2 "
+                                    f"({self.scan_scheduler.depth()} still queued)")
             except Exception as e:
-                print(f"Scan error: {e}")
-                time.sleep(60)
+                scanner_logger.error(f"[PRIORITY] Error: {e}")
+                time.sleep(5)
+
+    def _priority_scan_item(self, symbol, cls):
+        """Tier 2 item for a scheduler symbol, filled from the bar and fundamentals caches"""
+        fundamentals = self.maintenance_engine.fundamentals
+        bars = self.minute_bars.summary(symbol) or {}
+        prev_close = self.yesterday_prices.get(symbol, 0) or bars.get('current_price', 0)
+        float_shares = fundamentals.get(symbol, 'float_shares', 0) or fundamentals.get(symbol, 'shares_outstanding', 0)
+        item = {
+            'symbol': symbol,
+            'prev_close': prev_close,
+            'avg_volume': fundamentals.get(symbol, 'avg_volume', 0),
+            'float': float_shares / 1_000_000,
+            'week52_high': fundamentals.get(symbol, 'week52_high', 0),
+            'week52_low': fundamentals.get(symbol, 'week52_low', 0),
+            'source': cls,
+            'pinned_until': time.time() + SCAN_PIN_SECONDS[cls]
+        }
+        if bars:
+            item.update({
+                'current_price': bars['current_price'],
+                'volume': bars['cbvol'],
+                'cum_volume': bars['volume']
+            })
+        return item
+
     # =====================================================
     # THREE-TIER ARCHITECTURE
     # =====================================================
     
+    def _get_tier1_pool(self):
+        """Lazily start the Tier 1 worker processes (kept alive across passes)"""
+        if self.tier1_pool is None:
+            self.tier1_pool = ProcessPoolExecutor(max_workers=TIER1_MAX_IN_FLIGHT,
+                                                  mp_context=multiprocessing.get_context('spawn'))
+        return self.tier1_pool
+
+    def _reset_tier1_pool(self):
+        if self.tier1_pool is not None:
+            self.tier1_pool.shutdown(wait=False, cancel_futures=True)
+            self.tier1_pool = None
+
+    def _run_tier1_chunks(self, chunks, fundamentals, on_result=None):
+        """
+        Fetch all chunks with up to TIER1_MAX_IN_FLIGHT in flight, merge the bars into
+        self.minute_bars and gate each chunk from the store.
+        Submission is paced by the shared rate limiter; a failed chunk penalizes it.
+        on_result(idx, result) is called as each chunk completes (completion order).
+        Returns the result dicts of the chunks that completed, in chunk order. Chunks never
+        run (scanner stopped mid-pass) are omitted, so use result['chunk'] for the index.
+        """
+        results = [None] * len(chunks)
+        pending = {}
+
+        def _finish(idx, result):
+            chunk = chunks[idx]
+            t0 = time.perf_counter()
+            if result['error'] is None or result['error'] == 'empty':
+                self.minute_bars.merge(result.pop('bars'))
+                self.minute_bars.mark_fetched(chunk, result['fetched_at'])
+            else:
+                result.pop('bars', None)
+                self.tier1_rate_limiter.penalize(TIER1_ERROR_BACKOFF)
+            last_close, last_volume, cum_volume, _ = self.minute_bars.snapshot(chunk)
+            avg_volumes = {t: fundamentals.get(t, 'avg_volume', 0) for t in chunk}
+            result['candidates'], result['missing'] = tier1_prefilter(
+                chunk, last_close, last_volume, cum_volume, avg_volumes, self.yesterday_prices)
+            result['chunk'] = idx
+            result['gate_s'] = time.perf_counter() - t0
+            results[idx] = result
+            if on_result:
+                on_result(idx, result)
+
+        def _collect(done):
+            for fut in done:
+                idx = pending.pop(fut)
+                try:
+                    result = fut.result()
+                except BrokenProcessPool:
+                    scanner_logger.error(f"[TIER1] Worker pool broke on chunk {idx} - retrying inline")
+                    self._reset_tier1_pool()
+                    result = tier1_fetch_chunk(chunks[idx], self.minute_bars.delta_start(chunks[idx]))
+                _finish(idx, result)
+
+        for idx, chunk in enumerate(chunks):
+            if not self.running:
+                break
+            if len(pending) >= TIER1_MAX_IN_FLIGHT:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                _collect(done)
+            self.tier1_rate_limiter.acquire()
+            start_ts = self.minute_bars.delta_start(chunk)
+            try:
+                pending[self._get_tier1_pool().submit(tier1_fetch_chunk, chunk, start_ts)] = idx
+            except (BrokenProcessPool, RuntimeError) as e:
+                scanner_logger.error(f"[TIER1] Worker pool unavailable ({e}) - chunk {idx} inline")
+                self._reset_tier1_pool()
+                _finish(idx, tier1_fetch_chunk(chunk, start_ts))
+        if pending:
+            _collect(wait(pending).done)
+        return [r for r in results if r is not None]
+
     def _tier1_yfinance_bulk_prefilter(self):
-        """Tier 1: yfinance bulk prefilter - scans market in 500-ticker chunks"""
+        """Tier 1: yfinance bulk prefilter - scans market in parallel 500-ticker chunks"""
         while self.running:
             try:
                 scanner_logger.info(f"[TIER1] Starting scan at {datetime.datetime.now(NY_TZ)}")
                 start_time = time.time()
                 candidates = []
                 
-                universe = self.all_tickers[:8000] if len(self.all_tickers) > 8000 else self.all_tickers
-                chunk_size = 500
+                engine = self.maintenance_engine
+                # Re-read each pass: load_all_caches() replaces the store
+                fundamentals = engine.fundamentals
+                # Cold start: fundamentals store and eligibility index are normally built off-hours.
+                # Only the bulk volume/52-week download runs inline; per-ticker .info (float/shares)
+                # is handed to a background refresh so it never blocks the first pass
+                if fundamentals.coverage(self.all_tickers) == 0:
+                    scanner_logger.info("[TIER1] Fundamentals store empty - running one-off bulk volume/52wk refresh")
+                    cold_start = self.all_tickers[:8000]
+                    engine.refresh_price_fundamentals(cold_start)
+                    engine._save_json(TICKER_METADATA_FILE, engine.ticker_metadata)
+                    engine.refresh_share_fundamentals_async(cold_start)
+                if not engine.eligible_tickers and self.yesterday_prices:
+                    scanner_logger.info("[TIER1] Eligibility index empty - building from cached closes")
+                    engine.build_eligibility_index()
+                eligible = list(engine.eligible_tickers)
+                if not eligible:
+                    eligible = self.all_tickers[:8000]
+                missing_fundamentals = 0
+                self.minute_bars.roll()
+                if self.tier1_promoted_day != self.minute_bars.day:
+                    self.tier1_promoted = set()
+                    self.tier1_promoted_day = self.minute_bars.day
+                # Rotation hits from earlier passes today are rescanned with the index
+                eligible_set = set(eligible)
+                eligible += sorted(self.tier1_promoted - eligible_set)
+
+                # Second-class sweep: a rotating slice of everything outside the index
+                eligible_set = set(eligible)
+                rest = [t for t in self.all_tickers if t not in eligible_set]
+                rotation = self.scan_scheduler.rotation_batch(rest, TIER1_ROTATION_SIZE)
+                scanner_logger.info(f"[TIER1] Scanning {len(eligible)} eligible + {len(rotation)} rotation tickers")
                 
-                for chunk_idx in range(0, len(universe), chunk_size):
-                    chunk = universe[chunk_idx:chunk_idx + chunk_size]
-                    
-                    try:
-                        data = yf.download(tickers=chunk, period="1d", interval="1m", group_by='ticker', threads=True, progress=False)
-                        
-                        if data.empty:
-                            time.sleep(5)
-                            continue
-                        
-                        for ticker in chunk:
-                            try:
-                                if len(chunk) == 1:
-                                    ticker_df = data
-                                else:
-                                    if ticker in data.columns.get_level_values(0):
-                                        ticker_df = data[ticker]
-                                    else:
-                                        continue
-                                
-                                if ticker_df is None or ticker_df.empty:
-                                    continue
-                                
-                                if 'Close' in ticker_df.columns:
-                                    close_prices = ticker_df['Close'].dropna()
-                                    if close_prices.empty:
-                                        continue
-                                    current_price = float(close_prices.iloc[-1])
-                                else:
-                                    continue
-                                
-                                if current_price < 1.0 or current_price > 10.0:
-                                    continue
-                                
-                                if 'Volume' in ticker_df.columns:
-                                    volumes = ticker_df['Volume'].dropna()
-                                    if volumes.empty:
-                                        continue
-                                    current_volume = int(volumes.iloc[-1])
-                                else:
-                                    continue
-                                
-                                try:
-                                    t = yf.Ticker(ticker)
-                                    info = t.info or {}
-                                    avg_volume = int(info.get('averageVolume', 0))
-                                    
-                                    if avg_volume < 2000000:
-                                        continue
-                                    
-                                    candidates.append({'symbol': ticker, 'current_price': current_price, 'volume': current_volume, 'avg_volume': avg_volume})
-                                except:
-                                    continue
-                            except:
-                                continue
-                        
-                        time.sleep(2)
-                    except Exception as e:
-                        scanner_logger.error(f"[TIER1] Chunk error: {e}")
-                        time.sleep(10)
-                        continue
+                # Eligible chunks stay stable across passes so they keep their delta fetches
+                chunks = [eligible[i:i + TIER1_CHUNK_SIZE] for i in range(0, len(eligible), TIER1_CHUNK_SIZE)]
+                rotation_set = set(rotation)
+                chunks += [rotation[i:i + TIER1_CHUNK_SIZE] for i in range(0, len(rotation), TIER1_CHUNK_SIZE)]
+                self.tier1_pass_id += 1
+                pass_id = self.tier1_pass_id
+
+                def _emit_chunk(idx, result):
+                    # Hand each chunk's candidates to Tier 2 as soon as it lands
+                    for item in result['candidates']:
+                        ticker = item['symbol']
+                        float_shares = fundamentals.get(ticker, 'float_shares', 0) or fundamentals.get(ticker, 'shares_outstanding', 0)
+                        item.update({
+                            'float': float_shares / 1_000_000,
+                            'week52_high': fundamentals.get(ticker, 'week52_high', 0),
+                            'week52_low': fundamentals.get(ticker, 'week52_low', 0)
+                        })
+                    if result['candidates']:
+                        self.tier1_shortlist_queue.put({'pass_id': pass_id, 'candidates': result['candidates'], 'final': False})
+                        scanner_logger.info(f"[TIER1] Chunk {idx}: {len(result['candidates'])} candidates -> Tier 2 "
+                                            f"({time.time()-start_time:.1f}s into pass)")
+
+                chunk_results = self._run_tier1_chunks(chunks, fundamentals, on_result=_emit_chunk)
+                
+                chunk_stats = []
+                for result in chunk_results:
+                    missing_fundamentals += result['missing']
+                    candidates.extend(result['candidates'])
+                    self.tier1_promoted.update(c['symbol'] for c in result['candidates'] if c['symbol'] in rotation_set)
+                    chunk_stats.append({
+                        'chunk': result['chunk'],
+                        'symbols': result['symbols'],
+                        'candidates': len(result['candidates']),
+                        'delta': result['delta'],
+                        'bars': result['bar_count'],
+                        'download_s': round(result['download_s'], 2),
+                        'parse_s': round(result['parse_s'], 3),
+                        'gate_s': round(result['gate_s'], 3),
+                        'error': result['error']
+                    })
+                    if result['error'] and result['error'] != 'empty':
+                        scanner_logger.error(f"[TIER1] Chunk {result['chunk']} error: {result['error']}")
                 
-                scanner_logger.info(f"[TIER1] Found {len(candidates)} candidates in {time.time()-start_time:.1f}s")
+                duration = time.time() - start_time
+                self.tier1_last_pass = {
+                    'started': start_time,
+                    'duration_s': round(duration, 2),
+                    'workers': TIER1_MAX_IN_FLIGHT,
+                    'chunks': chunk_stats,
+                    'bars': sum(s['bars'] for s in chunk_stats),
+                    'candidates': len(candidates)
+                }
+                if chunk_stats:
+                    slowest = max(chunk_stats, key=lambda s: s['download_s'])
+                    mean_dl = sum(s['download_s'] for s in chunk_stats) / len(chunk_stats)
+                    mean_parse = sum(s['parse_s'] for s in chunk_stats) / len(chunk_stats)
+                    bars = sum(s['bars'] for s in chunk_stats)
+                    delta_chunks = sum(1 for s in chunk_stats if s['delta'])
+                    scanner_logger.info(f"[TIER1] {len(chunk_stats)} chunks x{TIER1_MAX_IN_FLIGHT} in flight: "
+                                        f"mean download {mean_dl:.1f}s, mean parse {mean_parse:.3f}s, "
+                                        f"slowest chunk {slowest['chunk']} ({slowest['download_s']:.1f}s), "
+                                        f"{bars:,} bars received ({delta_chunks} delta chunks)")
+                scanner_logger.info(f"[TIER1] Found {len(candidates)} candidates in {duration:.1f}s ({missing_fundamentals} price-eligible tickers without cached fundamentals)")
                 
                 with open("prefiltered_candidates.json", "w") as f:
                     json.dump(candidates, f, indent=2)
                 
-                if candidates:
-                    self.tier1_shortlist_queue.put(candidates)
+                # End-of-pass marker: Tier 2 drops live symbols that did not qualify this pass
+                if self.running and all(not s['error'] or s['error'] == 'empty' for s in chunk_stats):
+                    self.tier1_shortlist_queue.put({'pass_id': pass_id, 'candidates': [], 'final': True,
+                                                    'symbols': [c['symbol'] for c in candidates]})
                 
                 time.sleep(3600)
             except Exception as e:
@@ -2461,94 +4396,24 @@ class MarketDataManager:
     def _tier2_alpaca_websocket_manager(self):
         """
         Tier 2: Alpaca WebSocket
-        - Subscribes to Tier 1 shortlist (375-500 symbols)
+        - Merges Tier 1 chunk batches into a live set (max 500 symbols)
         - Real-time price/volume streaming
         - Fills missing data (RVol, float, etc.)
         - Validates yfinance data accuracy
-        - Passes validated tickers to Tier 3
+        - Passes validated tickers to Tier 3 in rolling batches as quotes arrive
         """
         print("[TIER2] Alpaca WebSocket manager started")
         
-        # Store current shortlist and WebSocket connection
+        # Live Tier 1 candidates (symbol -> item); quote state persists across shortlists
+        self.tier2_live = {}
+        self.tier2_pending = {}            # symbol -> validation wave id
+        self.tier2_priority_overflow = 0   # priority symbols refused at TIER2_PRIORITY_MAX_SYMBOLS
+        self.tier3_overflow = 0            # releases held back because Tier 3 was at TIER3_MAX_SYMBOLS
+        self.tier2_arrivals = queue.Queue()  # first quotes for pending symbols (from the stream thread)
         self.current_alpaca_symbols = []
-        self.alpaca_ws = None
         self.alpaca_validated_data = {}
-        
-        def on_open(ws):
-            import json
-            print("[TIER2] Alpaca WebSocket connected, authenticating...")
-            auth_msg = {
-                "action": "auth",
-                "key": ALPACA_API_KEY,
-                "secret": ALPACA_SECRET_KEY
-            }
-            ws.send(json.dumps(auth_msg))
-        
-        def on_message(ws, message):
-            try:
-                data = json.loads(message)
-                
-                # Handle auth response
-                if isinstance(data, list):
-                    for msg in data:
-                        msg_type = msg.get("T")
-                        
-                        # Authentication successful
-                        if msg_type == "success" and msg.get("msg") == "authenticated":
-                            print("[TIER2] ✓ Authenticated with Alpaca")
-                            # Subscribe to symbols
-                            if self.current_alpaca_symbols:
-                                self._alpaca_subscribe(ws, self.current_alpaca_symbols)
-                        
-                        # Quote data (real-time price updates)
-                        elif msg_type == "q":
-                            symbol = msg.get("S")
-                            ask_price = msg.get("ap")
-                            bid_price = msg.get("bp")
-                            ask_size = msg.get("as")
-                            bid_size = msg.get("bs")
-                            timestamp = msg.get("t")
-                            
-                            if symbol and ask_price:
-                                # Store validated price data
-                                self.alpaca_validated_data[symbol] = {
-                                    "symbol": symbol,
-                                    "alpaca_price": ask_price,
-                                    "bid_price": bid_price,
-                                    "ask_size": ask_size,
-                                    "bid_size": bid_size,
-                                    "timestamp": timestamp,
-                                    "validated": True
-                                }
-                                
-                                # Print validation progress
-                                validated_count = len(self.alpaca_validated_data)
-                                if validated_count % 50 == 0:
-                                    print(f"[TIER2] Validated {validated_count}/{len(self.current_alpaca_symbols)} symbols...")
-                        
-                        # Trade data
-                        elif msg_type == "t":
-                            symbol = msg.get("S")
-                            price = msg.get("p")
-                            size = msg.get("s")
-                            
-                            if symbol and price:
-                                if symbol not in self.alpaca_validated_data:
-                                    self.alpaca_validated_data[symbol] = {}
-                                
-                                self.alpaca_validated_data[symbol].update({
-                                    "last_trade_price": price,
-                                    "last_trade_size": size
-                                })
-                
-            except Exception as e:
-                print(f"[TIER2] Message processing error: {e}")
-        
-        def on_error(ws, error):
-            print(f"[TIER2] WebSocket error: {error}")
-        
-        def on_close(ws, *args):
-            print("[TIER2] Alpaca WebSocket closed")
+        self.alpaca_stream = AlpacaStreamManager(ALPACA_DATA_STREAM_URL, ('quotes', 'trades'),
+                                                 self._on_alpaca_data, 'TIER2')
         
         # Load existing prefiltered list on startup (BEFORE while loop)
         try:
@@ -2561,79 +4426,97 @@ class MarketDataManager:
         except:
             pass
         
+        waves = {}         # wave id -> {'pending', 'total', 'quoted', 'deadline', 'started'}
+        wave_seq = 0
+        forwarded = set()  # symbols already handed to Tier 3
+        deferred = []      # released symbols waiting for a Tier 3 slot, oldest first
         while self.running:
             try:
-                shortlist = self.tier1_shortlist_queue.get()
-                scanner_logger.info(f"[TIER2] Received {len(shortlist)} tickers from Tier1")
-                print(f"\n{'='*60}")
-                print(f"[TIER2] Received {len(shortlist)} tickers from Tier 1")
-                print(f"{'='*60}")
-                
-                # Extract symbols
-                symbols = [item['symbol'] for item in shortlist][:500]  # Max 500
-                self.current_alpaca_symbols = symbols
-                
-                # Close existing WebSocket if any
-                if self.alpaca_ws:
-                    self.alpaca_ws.close()
-                    time.sleep(1)
-                
-                # Reset validation data
-                self.alpaca_validated_data = {}
-                
-                # Create WebSocket connection
-                ws_url = "wss://stream.data.alpaca.markets/v2/iex"
-                self.alpaca_ws = websocket.WebSocketApp(
-                    ws_url,
-                    on_open=on_open,
-                    on_message=on_message,
-                    on_error=on_error,
-                    on_close=on_close
-                )
+                # Wait briefly for Tier 1 batches, then drain whatever else is already queued
+                batches = []
+                try:
+                    batches.append(self.tier1_shortlist_queue.get(timeout=TIER2_FORWARD_INTERVAL))
+                    while True:
+                        batches.append(self.tier1_shortlist_queue.get_nowait())
+                except queue.Empty:
+                    pass
                 
-                # Run WebSocket in separate thread
-                ws_thread = threading.Thread(
-                    target=self.alpaca_ws.run_forever,
-                    kwargs={"sslopt": {"cert_reqs": ssl.CERT_NONE}},
-                    daemon=True
-                )
-                ws_thread.start()
+                removed = []
+                if batches:
+                    added, removed = self._merge_tier1_batches(batches)
+                    if added or removed:
+                        scanner_logger.info(f"[TIER2] Merged {len(batches)} Tier1 batches: +{len(added)} -{len(removed)} "
+                                            f"({len(self.tier2_live)} live)")
+                        print(f"[TIER2] +{len(added)} / -{len(removed)} tickers from Tier 1 ({len(self.tier2_live)} live)")
+                        self.current_alpaca_symbols = list(self.tier2_live)
+                        # One long-lived connection: only subscription deltas go over the wire
+                        self.alpaca_stream.set_symbols(self.current_alpaca_symbols)
+                        self.alpaca_stream.start()
+                    for symbol in removed:
+                        self.tier2_pending.pop(symbol, None)
+                    if added:
+                        # New validation wave - short deadline for news/enriched
+                        priority_only = all(isinstance(b, dict) and b.get('priority') for b in batches)
+                        now = time.time()
+                        wave_seq += 1
+                        waves[wave_seq] = {
+                            'pending': set(added),
+                            'total': len(added),
+                            'quoted': 0,
+                            'started': now,
+                            'deadline': now + (TIER2_PRIORITY_VALIDATION_DEADLINE if priority_only else TIER2_VALIDATION_DEADLINE)
+                        }
+                        for symbol in added:
+                            self.tier2_pending[symbol] = wave_seq
+                            if 'alpaca_price' in self.alpaca_validated_data.get(symbol, {}):
+                                self.tier2_arrivals.put(symbol)  # quote state survived a re-add
                 
-                # Wait for validation to complete (30 seconds max)
-                print("[TIER2] Waiting for validation data...")
-                time.sleep(30)
+                # Symbols that quoted since the last tick go straight to Tier 3
+                release = []
+                while True:
+                    try:
+                        symbol = self.tier2_arrivals.get_nowait()
+                    except queue.Empty:
+                        break
+                    wave_id = self.tier2_pending.pop(symbol, None)
+                    if wave_id is None or wave_id not in waves:
+                        continue
+                    waves[wave_id]['pending'].discard(symbol)
+                    waves[wave_id]['quoted'] += 1
+                    release.append(symbol)
                 
-                # Merge Alpaca validation with original Tier 1 data
-                validated_list = []
-                for item in shortlist:
-                    symbol = item['symbol']
-                    
-                    # Add Alpaca real-time data if available
-                    if symbol in self.alpaca_validated_data:
-                        item.update(self.alpaca_validated_data[symbol])
-                    
-                    # Calculate price variance if we have both prices
-                    if 'alpaca_price' in item and 'current_price' in item:
-                        yf_price = item['current_price']
-                        alpaca_price = item['alpaca_price']
-                        variance = abs(alpaca_price - yf_price) / yf_price * 100
-                        item['price_variance'] = variance
-                        
-                        if variance > 2.0:
-                            print(f"[TIER2] ⚠ {symbol} variance: {variance:.2f}% (yf: ${yf_price:.2f}, alpaca: ${alpaca_price:.2f})")
-                    
-                    validated_list.append(item)
+                # Coverage reached or deadline passed: the rest of the wave goes on unvalidated
+                now = time.time()
+                for wave_id, wave in list(waves.items()):
+                    if wave['pending'] and (wave['quoted'] >= wave['total'] * TIER2_VALIDATION_COVERAGE or now >= wave['deadline']):
+                        for symbol in wave['pending']:
+                            self.tier2_pending.pop(symbol, None)
+                        release.extend(wave['pending'])
+                        wave['pending'] = set()
+                    if not wave['pending']:
+                        print(f"[TIER2] ✓ Wave {wave_id}: {wave['quoted']}/{wave['total']} quoted in {now - wave['started']:.1f}s")
+                        scanner_logger.info(f"[TIER2] Wave {wave_id} complete: {wave['quoted']}/{wave['total']} quoted "
+                                            f"in {now - wave['started']:.1f}s")
+                        del waves[wave_id]
                 
-                print(f"[TIER2] ✓ Validated {len(self.alpaca_validated_data)}/{len(symbols)} symbols with live data")
-                print(f"[TIER2] → Passing {len(validated_list)} tickers to Tier 3 queue")
+                removed = [s for s in removed if s in forwarded]
+                forwarded.difference_update(removed)
+                # Tier 3 holds TIER3_MAX_SYMBOLS: the rest wait (un-forwarded) until removals free a slot
+                release = [s for s in dict.fromkeys(deferred + release) if s in self.tier2_live and s not in forwarded]
+                room = max(TIER3_MAX_SYMBOLS - len(forwarded), 0)
+                newly_deferred = [s for s in release[room:] if s not in deferred]
+                release, deferred = release[:room], release[room:]
+                if newly_deferred:
+                    self.tier3_overflow += len(newly_deferred)
+                    scanner_logger.warning(f"[TIER2] Tier 3 full ({TIER3_MAX_SYMBOLS}) - holding {len(deferred)} validated "
+                                           f"symbols until a slot frees ({self.tier3_overflow} deferred so far)")
+                if not release and not removed:
+                    continue
+                forwarded.update(release)
+                self.tier2_validated_queue.put({'items': [self._tier2_validated_item(s) for s in release], 'removed': removed})
 
-                import json
                 with open('alpaca_validated.json', 'w') as f:
-                    json.dump(validated_list, f, indent=2)
-                print(f"[FILE] Saved {len(validated_list)} Alpaca-validated symbols for Tradier.")
-
-                # Pass to Tier 3
-                self.tier2_validated_queue.put(validated_list)
+                    json.dump([self._tier2_validated_item(s, warn=False) for s in forwarded if s in self.tier2_live], f, indent=2)
                 
             except Exception as e:
                 print(f"[TIER2] ✗ Error: {e}")
@@ -2641,26 +4524,121 @@ class MarketDataManager:
                 traceback.print_exc()
                 time.sleep(10)
 
-    def _alpaca_subscribe(self, ws, symbols):
-        """Helper method to subscribe to Alpaca symbols"""
-        try:
-            subscribe_msg = {
-                "action": "subscribe",
-                "quotes": symbols,
-                "trades": symbols
-            }
-            ws.send(json.dumps(subscribe_msg))
-            print(f"[TIER2] Subscribed to {len(symbols)} symbols for quotes and trades")
-        except Exception as e:
-            print(f"[TIER2] Subscribe error: {e}")
-            scanner_logger.info(f"[TIER2] Subscribe error: {e}")
+    def _tier2_validated_item(self, symbol, warn=True):
+        """Tier 1 item merged with Alpaca real-time data and yfinance/Alpaca price variance"""
+        item = dict(self.tier2_live[symbol])
+        
+        # Add Alpaca real-time data if available
+        if symbol in self.alpaca_validated_data:
+            item.update(self.alpaca_validated_data[symbol])
+        
+        # Calculate price variance if we have both prices
+        if 'alpaca_price' in item and item.get('current_price'):
+            yf_price = item['current_price']
+            alpaca_price = item['alpaca_price']
+            variance = abs(alpaca_price - yf_price) / yf_price * 100
+            item['price_variance'] = variance
+            
+            if warn and variance > 2.0:
+                print(f"[TIER2] ⚠ {symbol} variance: {variance:.2f}% (yf: ${yf_price:.2f}, alpaca: ${alpaca_price:.2f})")
+        return item
+
+    def _merge_tier1_batches(self, batches):
+        """
+        Merge Tier 1 queue items into self.tier2_live.
+        Items are {'pass_id', 'candidates', 'final'[, 'symbols', 'priority']} batches; a bare list
+        (prefiltered_candidates.json at startup) is treated as one non-final batch.
+        Priority batches (news/enriched) are admitted past the subscription cap, up to
+        TIER2_PRIORITY_MAX_SYMBOLS pinned symbols. A pin is set once per trigger class:
+        re-pushes of the same class (the periodic enriched refresh) keep the original
+        pinned_until, so pins expire; a new class (news on an enriched symbol) may extend it.
+        A final batch prunes live symbols that did not qualify in that pass, except
+        items still pinned by the priority scheduler.
+        Returns (added, removed) symbol lists.
+        """
+        before = set(self.tier2_live)
+        now = time.time()
+        pinned = sum(1 for item in self.tier2_live.values() if item.get('pinned_until', 0) > now)
+        overflow = []
+        for batch in batches:
+            if isinstance(batch, list):
+                batch = {'pass_id': None, 'candidates': batch, 'final': False}
+            for item in batch['candidates']:
+                symbol = item['symbol']
+                if symbol in self.tier2_live:
+                    live = self.tier2_live[symbol]
+                    pin, classes = live.get('pinned_until'), live.get('pin_classes', set())
+                    live.update(item)
+                    if 'pinned_until' in item:
+                        cls = item.get('source')
+                        if cls not in classes:
+                            classes = classes | {cls}
+                            if pin is not None:
+                                live['pinned_until'] = max(pin, item['pinned_until'])
+                        else:
+                            live['pinned_until'] = pin
+                        live['pin_classes'] = classes
+                elif batch.get('priority'):
+                    if pinned < TIER2_PRIORITY_MAX_SYMBOLS:
+                        item['pin_classes'] = {item.get('source')}
+                        self.tier2_live[symbol] = item
+                        pinned += 1
+                    else:
+                        overflow.append(symbol)
+                elif len(self.tier2_live) < TIER2_MAX_SYMBOLS:
+                    self.tier2_live[symbol] = item
+            if batch['final']:
+                keep = set(batch['symbols'])
+                for symbol in [s for s, item in self.tier2_live.items()
+                               if s not in keep and item.get('pinned_until', 0) <= now]:
+                    del self.tier2_live[symbol]
+                    self.alpaca_validated_data.pop(symbol, None)
+        if overflow:
+            self.tier2_priority_overflow += len(overflow)
+            scanner_logger.warning(f"[TIER2] Priority cap ({TIER2_PRIORITY_MAX_SYMBOLS} pinned) reached - "
+                                   f"{len(overflow)} priority symbols not admitted: {', '.join(overflow[:10])}")
+        # Diff against the set we started with so churn inside one drain cancels out
+        added = [s for s in self.tier2_live if s not in before]
+        removed = [s for s in before if s not in self.tier2_live]
+        return added, removed
+
+    def _on_alpaca_data(self, msg):
+        """Tier 2 quote/trade handler for the persistent Alpaca stream"""
+        msg_type = msg.get("T")
+        symbol = msg.get("S")
+        
+        # Quote data (real-time price updates)
+        if msg_type == "q":
+            ask_price = msg.get("ap")
+            if symbol and ask_price:
+                if symbol in self.tier2_pending and 'alpaca_price' not in self.alpaca_validated_data.get(symbol, {}):
+                    self.tier2_arrivals.put(symbol)
+                # Store validated price data (merged so last trade fields survive)
+                self.alpaca_validated_data.setdefault(symbol, {}).update({
+                    "symbol": symbol,
+                    "alpaca_price": ask_price,
+                    "bid_price": msg.get("bp"),
+                    "ask_size": msg.get("as"),
+                    "bid_size": msg.get("bs"),
+                    "timestamp": stream_timestamp(msg.get("t")),
+                    "validated": True
+                })
+        
+        # Trade data
+        elif msg_type == "t":
+            price = msg.get("p")
+            if symbol and price:
+                self.alpaca_validated_data.setdefault(symbol, {}).update({
+                    "last_trade_price": price,
+                    "last_trade_size": msg.get("s")
+                })
     
     def _tier3_tradier_websocket_manager(self):
         """
         Tier 3: Tradier WebSocket
-        - Receives validated tickers from Alpaca
+        - Merges rolling validated batches from Alpaca into one live subscription
         - Tick-by-tick price updates (sub-second)
-        - Primary categorization engine - runs categorize_stock() on every update
+        - Feeds the categorization engine (CategorizationEngine worker) on every update
         - Detects quick moves (5% in 5min, 10% in 10min)
         - Triggers sound alerts
         - Keeps ALL data up-to-date for GUI
@@ -2671,11 +4649,13 @@ class MarketDataManager:
         # Store current subscription and WebSocket connection
         self.current_tradier_symbols = []
         self.tradier_ws = None
+        self.tradier_ws_thread = None
+        self.tradier_connected = False
         self.tradier_session_id = None
-        self.tradier_price_history = {}  # Track price movements for quick move detection
         
         def on_open(ws):
             print("[TIER3] Tradier WebSocket connected, subscribing...")
+            self.tradier_connected = True
             if self.current_tradier_symbols and self.tradier_session_id:
                 self._tradier_subscribe(ws, self.current_tradier_symbols, self.tradier_session_id)
         
@@ -2735,22 +4715,8 @@ class MarketDataManager:
                     "tier3_active": True
                 })
                 
-                # Track price history for quick move detection
-                now = time.time()
-                if symbol not in self.tradier_price_history:
-                    self.tradier_price_history[symbol] = []
-                
-                self.tradier_price_history[symbol].append({
-                    "price": float(last_price), 
-                    "timestamp": now
-                })
-                
-                # Keep only last 10 minutes of data
-                cutoff = now - 600
-                self.tradier_price_history[symbol] = [
-                    p for p in self.tradier_price_history[symbol] 
-                    if p["timestamp"] > cutoff
-                ]
+                # Track price windows for quick move detection
+                self.quick_moves.record(symbol, last_price)
                 
                 # Detect quick moves
                 self._detect_quick_moves(symbol, last_price)
@@ -2768,6 +4734,7 @@ class MarketDataManager:
             scanner_logger.error(f"[TIER3] WebSocket error: {error}")
 
         def on_close(ws, *args):
+            self.tradier_connected = False
             print("[TIER3] Tradier WebSocket closed")
         
         # Load existing validated list on startup (BEFORE the while loop)
@@ -2781,27 +4748,61 @@ class MarketDataManager:
         except:
             pass
         
+        waiting = {}  # validated symbols over TIER3_MAX_SYMBOLS, admitted as slots free (insertion order)
         while self.running:
             try:
-                validated_list = self.tier2_validated_queue.get()
-                print(f"\n{'='*60}")
-                print(f"[TIER3] Received {len(validated_list)} validated tickers from Tier 2")
-                scanner_logger.info(f"[TIER3] Received {len(validated_list)} validated tickers from Tier 2")
-                print(f"{'='*60}")
+                batches = [self.tier2_validated_queue.get()]
+                while True:
+                    try:
+                        batches.append(self.tier2_validated_queue.get_nowait())
+                    except queue.Empty:
+                        break
                 
-                # Extract symbols (max 375 for Tradier)
-                symbols = [item['symbol'] for item in validated_list][:375]
-                self.current_tradier_symbols = symbols
+                added, removed = [], []
+                for batch in batches:
+                    if isinstance(batch, list):
+                        batch = {'items': batch, 'removed': []}  # alpaca_validated.json at startup
+                    for symbol in batch['removed']:
+                        waiting.pop(symbol, None)
+                        if symbol in self.current_tradier_symbols:
+                            self.current_tradier_symbols.remove(symbol)
+                            self.quick_moves.discard(symbol)
+                            self.quick_move_alerts.discard(symbol)
+                            self.categorizer.discard(symbol)
+                            removed.append(symbol)
+                    for item in batch['items']:
+                        symbol = item['symbol']
+                        # Store validated data in stock_data (live Tier 3 fields win over Tier 2 snapshots)
+                        if self.stock_data.get(symbol, {}).get('tier3_active'):
+                            self.stock_data[symbol] = {**item, **self.stock_data[symbol]}
+                        else:
+                            self.stock_data[symbol] = item
+                        if symbol not in self.current_tradier_symbols:
+                            waiting[symbol] = True
+                # Fill free slots oldest-first; anything left waits for the next removal
+                while waiting and len(self.current_tradier_symbols) < TIER3_MAX_SYMBOLS:
+                    symbol = next(iter(waiting))
+                    del waiting[symbol]
+                    self.current_tradier_symbols.append(symbol)
+                    added.append(symbol)
+                if waiting:
+                    scanner_logger.warning(f"[TIER3] At {TIER3_MAX_SYMBOLS} symbols - {len(waiting)} waiting for a slot")
                 
-                # Store validated data in stock_data
-                for item in validated_list:
-                    symbol = item['symbol']
-                    self.stock_data[symbol] = item
+                if not added and not removed:
+                    continue
+                print(f"[TIER3] +{len(added)} / -{len(removed)} validated tickers from Tier 2 ({len(self.current_tradier_symbols)} live)")
+                scanner_logger.info(f"[TIER3] +{len(added)} / -{len(removed)} validated tickers from Tier 2 "
+                                    f"({len(self.current_tradier_symbols)} live)")
 
-                import json
                 with open('tradier_final.json', 'w') as f:
                     json.dump(self.stock_data, f, indent=2)
-                print(f"[FILE] Saved latest Tradier/GUI symbols for maintenance.")
+                
+                if self.tradier_ws and self.tradier_connected:
+                    # Same connection: a new payload replaces the subscription
+                    self._tradier_subscribe(self.tradier_ws, self.current_tradier_symbols, self.tradier_session_id)
+                    continue
+                if self.tradier_ws_thread and self.tradier_ws_thread.is_alive():
+                    continue  # still connecting - on_open subscribes to the current list
 
                 # Get Tradier session ID
                 print("[TIER3] Requesting Tradier session ID...")
@@ -2816,11 +4817,6 @@ class MarketDataManager:
                 print(f"[TIER3] ✓ Session ID obtained")
                 scanner_logger.info(f"[TIER3] Session ID obtained: {self.tradier_session_id[:10]}...")
                 
-                # Close existing WebSocket if any
-                if self.tradier_ws:
-                    self.tradier_ws.close()
-                    time.sleep(1)
-                
                 # Create WebSocket connection
                 ws_url = "wss://ws.tradier.com/v1/markets/events"
                 self.tradier_ws = websocket.WebSocketApp(
@@ -2832,22 +4828,18 @@ class MarketDataManager:
                 )
                 
                 # Run WebSocket in separate thread
-                ws_thread = threading.Thread(
+                self.tradier_ws_thread = threading.Thread(
                     target=self.tradier_ws.run_forever,
                     kwargs={"sslopt": {"cert_reqs": ssl.CERT_NONE}},
                     daemon=True
                 )
-                ws_thread.start()
+                self.tradier_ws_thread.start()
                 
-                print(f"[TIER3] ✓ WebSocket streaming {len(symbols)} symbols")
-                scanner_logger.info(f"[TIER3] WebSocket streaming {len(symbols)} symbols")
+                print(f"[TIER3] ✓ WebSocket streaming {len(self.current_tradier_symbols)} symbols")
+                scanner_logger.info(f"[TIER3] WebSocket streaming {len(self.current_tradier_symbols)} symbols")
                 print("[TIER3] Categorization engine active - monitoring for quick moves...")
                 scanner_logger.info("[TIER3] Categorization engine active - monitoring for quick moves...")
                 
-                # Keep WebSocket running until new Tier 2 data arrives
-                while self.tier2_validated_queue.empty():
-                    time.sleep(5)
-                
             except Exception as e:
                 print(f"[TIER3] ✗ Error: {e}")
                 scanner_logger.error(f"[TIER3] Error: {e}")
@@ -2878,7 +4870,7 @@ class MarketDataManager:
                 "Authorization": f"Bearer {TRADIER_ACCESS_TOKEN}",
                 "Accept": "application/json"
             }
-            response = requests.post(url, headers=headers, timeout=10)
+            response = http_client.post(url, provider='tradier', headers=headers)
             
             if response.status_code == 200:
                 data = response.json()
@@ -2897,40 +4889,23 @@ class MarketDataManager:
     def _detect_quick_moves(self, symbol, current_price):
         """Detect 5% in 5min or 10% in 10min moves"""
         try:
-            if symbol not in self.tradier_price_history:
-                return
-            
-            history = self.tradier_price_history[symbol]
-            if len(history) < 2:
-                return
-            
             now = time.time()
             current_price = float(current_price)
 
-            # Check 5% in 5 minutes
-            five_min_ago = now - 300
-            five_min_prices = [p["price"] for p in history if p["timestamp"] >= five_min_ago]
-            if five_min_prices:
-                min_5min = min(five_min_prices)
-                max_5min = max(five_min_prices)
-                move_5min = abs(current_price - min_5min) / min_5min * 100 if min_5min > 0 else 0
-                
-                if move_5min >= 5.0:
-                    print(f"[TIER3] 🚀 {symbol} QUICK MOVE: {move_5min:.1f}% in 5min")
-                    self._trigger_quick_move_alert(symbol, move_5min, "5min")
+            alerts = self.quick_move_alerts
+            
+            # Check 5% in 5 minutes - alert only on the armed -> fired transition
+            move_5min = self.quick_moves.move_pct(symbol, current_price, 300, now)
+            if alerts.update(symbol, "5min", move_5min >= 5.0, current_price, now) == alerts.FIRED:
+                print(f"[TIER3] 🚀 {symbol} QUICK MOVE: {move_5min:.1f}% in 5min")
+                self._trigger_quick_move_alert(symbol, move_5min, "5min")
             
             # Check 10% in 10 minutes
-            ten_min_ago = now - 600
-            ten_min_prices = [p["price"] for p in history if p["timestamp"] >= ten_min_ago]
-            if ten_min_prices:
-                min_10min = min(ten_min_prices)
-                max_10min = max(ten_min_prices)
-                move_10min = abs(current_price - min_10min) / min_10min * 100 if min_10min > 0 else 0
-                
-                if move_10min >= 10.0:
-                    print(f"[TIER3] 🚀🚀 {symbol} BIG MOVE: {move_10min:.1f}% in 10min")
-                    scanner_logger.info(f"[TIER3] 🚀🚀 {symbol} BIG MOVE: {move_10min:.1f}% in 10min")
-                    self._trigger_quick_move_alert(symbol, move_10min, "10min")
+            move_10min = self.quick_moves.move_pct(symbol, current_price, 600, now)
+            if alerts.update(symbol, "10min", move_10min >= 10.0, current_price, now) == alerts.FIRED:
+                print(f"[TIER3] 🚀🚀 {symbol} BIG MOVE: {move_10min:.1f}% in 10min")
+                scanner_logger.info(f"[TIER3] 🚀🚀 {symbol} BIG MOVE: {move_10min:.1f}% in 10min")
+                self._trigger_quick_move_alert(symbol, move_10min, "10min")
                     
         except Exception as e:
             print(f"[TIER3] Quick move detection error: {e}")
@@ -2949,14 +4924,14 @@ class MarketDataManager:
             
             # Trigger callback to update GUI
             if self.callback:
-                Clock.schedule_once(lambda dt, s=symbol: self.callback(s, self.stock_data[symbol]), 0)
+                ui_bus.post(('stock', symbol), self.callback, symbol, self.stock_data[symbol])
             
         except Exception as e:
             print(f"[TIER3] Alert trigger error: {e}")
             scanner_logger.error(f"[TIER3] Alert trigger error: {e}")
 
     def _run_categorization(self, symbol):
-        """Run categorization engine on updated ticker data"""
+        """Hand a snapshot of the updated ticker to the categorizer worker (never blocks the tick thread)"""
         try:
             if symbol not in self.stock_data:
                 return
@@ -2967,89 +4942,60 @@ class MarketDataManager:
             change_pct = data.get('change_pct', 0)
             rvol = data.get('rvol', 0)
             float_shares = data.get('float', 0)
-            is_new_hod = data.get('is_new_hod', False)
-        
-            # Format as stock_data tuple for categorize_stock
-            formatted = [
-                symbol, 
-                get_timestamp_display(symbol), 
-                f"${current_price:.2f}", 
-                f"{change_pct:+.1f}%",
-                self.format_volume(data.get('cbvol', 0)),
-                self.format_volume(volume), 
-                f"{float_shares:.1f}M",
-                f"{rvol:.2f}x",
-                "NEWS"
-            ]
-        
-            # Call the REAL categorization function from SignalScanApp
-            app = App.get_running_app()
-            if hasattr(app, 'root'):
-                app.root.categorize_stock(
-                    formatted, 
-                    change_pct, 
-                    volume, 
-                    rvol, 
-                    float_shares, 
-                    current_price, 
-                    is_new_hod, 
-                    False  # is_52wk_high
-                )
-
-                # If no channel assigned by categorization, skip GUI update
-                if not channel:
-                    return
         
-            # Pass to GUI with channel assignment
-            if channel and self.callback:
-                # Format data as GUI list
-                gui_data = [
-                    symbol,
-                    datetime.datetime.now(NY_TZ).strftime('%I:%M %p'),
-                    "Tradier Real-Time",
-                    f"${data.get('current_price', 0):.2f}",
-                    "0.00%",  # Calculate % change if you have previous price
-                    data.get('volume', 0),
-                    "N/A",
-                    "N/A"
-                ]
-                Clock.schedule_once(lambda dt, s=symbol, d=gui_data: self.callback(s, d), 0)
-
-                scanner_logger.info(f"[TIER3] {symbol} assigned to {channel} channel")
+            row = ChannelRow(symbol, current_price, change_pct, data.get('cbvol', 0), volume, float_shares, rvol)
+            self.categorizer.submit({
+                'symbol': symbol,
+                'price': current_price,
+                'change_pct': change_pct,
+                'volume': volume,
+                'rvol': rvol,
+                'float': float_shares,
+                'is_new_hod': data.get('is_new_hod', False),
+                'row': row,
+            })
                 
         except Exception as e:
             print(f"[TIER3] Categorization error: {e}")
             scanner_logger.error(f"[TIER3] Categorization error: {e}")
 
+    def refresh_minute_bars(self, symbols):
+        """Delta-fetch today's 1m bars for symbols into self.minute_bars (inline, chunked)"""
+        self.minute_bars.roll()
+        for i in range(0, len(symbols), TIER1_CHUNK_SIZE):
+            chunk = symbols[i:i + TIER1_CHUNK_SIZE]
+            self.tier1_rate_limiter.acquire()
+            result = tier1_fetch_chunk(chunk, self.minute_bars.delta_start(chunk))
+            if result['error'] and result['error'] != 'empty':
+                print(f"[SCAN] Bar fetch error: {result['error']}")
+                self.tier1_rate_limiter.penalize(TIER1_ERROR_BACKOFF)
+                continue
+            self.minute_bars.merge(result['bars'])
+            self.minute_bars.mark_fetched(chunk, result['fetched_at'])
+
     def batch_scan_tickers(self, ticker_list):
         try:
             processed = 0
+            self.refresh_minute_bars(list(ticker_list))
             for symbol in ticker_list:
                 try:
-                    t = yf.Ticker(symbol)
-                    hist = t.history(period="1d", interval="1m")
-                    if hist is None or hist.empty:
+                    bars = self.minute_bars.summary(symbol)
+                    if bars is None:
                         continue
                     
-                    current_price = float(hist['Close'].iloc[-1])
-                    current_volume = int(hist['Volume'].sum())
-                    cbvol = int(hist['Volume'].iloc[-1])  # current bar volume
-                    day_high = float(hist['High'].max())
+                    current_price = bars['current_price']
+                    current_volume = bars['volume']
+                    cbvol = bars['cbvol']  # current bar volume
+                    day_high = bars['day_high']
 
                     # Upfront price filter: $0 <= price <= $10
                     if current_price > 10.0 or current_price < 1.0:
                         scanner_logger.debug(f"[SCAN] {symbol} rejected: price=${current_price:.2f} (need $1-$10)")
                         continue
 
-                    # Upfront volume filter: current volume > 0
-                    info = {}
-                    try:
-                        info = t.info or {}
-                    except:
-                        pass
-
-                    # Get average volume (use int, not float)
-                    avg_volume = int(info.get('averageVolume', 0))
+                    # Fundamentals come from the persistent store (no per-ticker .info round-trip)
+                    fundamentals = self.maintenance_engine.fundamentals
+                    avg_volume = int(fundamentals.get(symbol, 'avg_volume', 0))
 
                     # FILTER: Average volume must be >= 2M
                     if avg_volume < 2000000:
@@ -3058,13 +5004,13 @@ class MarketDataManager:
 
                     scanner_logger.info(f"[SCAN] ✓ {symbol} PASSED: ${current_price:.2f}, avgvol={avg_volume/1e6:.1f}M")
 
-                    prev_close = float(info.get('previousClose', info.get('regularMarketPreviousClose', current_price)))
+                    prev_close = current_price
                     if symbol in self.yesterday_prices and self.yesterday_prices[symbol] > 0:
                         prev_close = self.yesterday_prices[symbol]
 
-                    shares_outstanding = float(info.get('sharesOutstanding', 0))
+                    shares_outstanding = float(fundamentals.get(symbol, 'shares_outstanding', 0))
                     float_shares = (shares_outstanding / 1_000_000) if shares_outstanding else 0.0
-                    week52_high = float(info.get('fiftyTwoWeekHigh', 0))
+                    week52_high = float(fundamentals.get(symbol, 'week52_high', 0))
                     change_pct = ((current_price - prev_close) / prev_close) * 100 if prev_close > 0 else 0.0
                     rvol = self.calculate_rvol(current_volume, avg_volume)
 
@@ -3094,7 +5040,7 @@ class MarketDataManager:
                         )
 
                     if self.callback:
-                        Clock.schedule_once(lambda dt, s=symbol, d=self.stock_data[symbol]: self.callback(s, d), 0)
+                        ui_bus.post(('stock', symbol), self.callback, symbol, self.stock_data[symbol])
 
                     processed += 1
 
@@ -3129,6 +5075,10 @@ class MarketDataManager:
 
     def stop(self):
         self.running = False
+        self._reset_tier1_pool()
+        self.categorizer.stop()
+        if self.alpaca_stream:
+            self.alpaca_stream.stop()
         self.save_all_caches()
         print(f"[SCANNER] Stopped, caches saved")
 
@@ -3206,7 +5156,7 @@ Format: Brief bullet points. If no significant news, state "No breaking catalyst
                 "temperature": 0.2   # More factual, less creative
             }
             
-            response = requests.post(url, headers=headers, json=payload, timeout=10)
+            response = http_client.post(url, provider='perplexity', headers=headers, json=payload)
             
             if response.status_code == 200:
                 data = response.json()
@@ -3251,6 +5201,246 @@ Format: Brief bullet points. If no significant news, state "No breaking catalyst
             'percent_used': (self.monthly_spend / self.monthly_limit) * 100
         }
 
+class ChannelRow:
+    """
+    Numeric channel row. row[col] returns the raw number behind table column col
+    (row[2] price, row[3] change %, row[7] RVOL), so sorting and coloring never
+    parse display strings; SignalScanApp.format_channel_cell formats only the
+    visible rows at render time. row[0] is the symbol, like the Halts list rows.
+    """
+    __slots__ = ('symbol', 'updated', 'price', 'change_pct', 'cbvol', 'volume', 'float_shares', 'rvol')
+    COLUMNS = __slots__
+
+    def __init__(self, symbol, price=0.0, change_pct=0.0, cbvol=0, volume=0, float_shares=0.0, rvol=0.0, updated=None):
+        self.symbol = symbol
+        self.updated = updated or time.time()
+        self.price = float(price or 0)
+        self.change_pct = float(change_pct or 0)
+        self.cbvol = int(cbvol or 0)
+        self.volume = int(volume or 0)
+        self.float_shares = float(float_shares or 0)
+        self.rvol = float(rvol or 0)
+
+    def __getitem__(self, col):
+        return getattr(self, self.COLUMNS[col])
+
+    def __len__(self):
+        return len(self.COLUMNS)
+
+    def __repr__(self):
+        return f"ChannelRow({self.symbol} ${self.price:.2f} {self.change_pct:+.1f}% rvol={self.rvol:.2f})"
+
+class ChannelIndex:
+    """
+    Rows of one channel: a symbol -> row hash map plus a bisect-ordered list of
+    (sort_key, symbol). upsert() and remove() locate a symbol with a binary search
+    instead of rebuilding or re-sorting the whole channel, and rendering reads
+    ordered slices. key(row) must return a number; reverse sorts descending.
+    Iterating, len() and slicing behave like the ordered list of rows.
+    """
+    def __init__(self, key=None, reverse=False):
+        self.rows = {}
+        self.keys = {}
+        self.order = []
+        self.key = key
+        self.reverse = reverse
+        self.seq = 0
+
+    def _sort_key(self, row):
+        if self.key is None:
+            self.seq += 1  # insertion order
+            return self.seq
+        try:
+            k = float(self.key(row))
+        except (TypeError, ValueError):
+            k = 0.0
+        return -k if self.reverse else k
+
+    def upsert(self, symbol, row):
+        """Insert or replace symbol's row; returns True if the symbol is new to the channel"""
+        is_new = symbol not in self.rows
+        if not is_new:
+            self._unlink(symbol)
+        k = self._sort_key(row)
+        self.rows[symbol] = row
+        self.keys[symbol] = k
+        bisect.insort(self.order, (k, symbol))
+        return is_new
+
+    def remove(self, symbol):
+        if symbol not in self.rows:
+            return False
+        self._unlink(symbol)
+        del self.rows[symbol]
+        del self.keys[symbol]
+        return True
+
+    def _unlink(self, symbol):
+        entry = (self.keys[symbol], symbol)
+        i = bisect.bisect_left(self.order, entry)
+        if i < len(self.order) and self.order[i] == entry:
+            del self.order[i]
+
+    def set_order(self, key=None, reverse=False):
+        """Change the sort column (user header click); rebuilds the ordering once"""
+        self.key = key
+        self.reverse = reverse
+        ordered = [(s, self.rows[s]) for _, s in self.order]
+        self.order = []
+        for symbol, row in ordered:
+            k = self._sort_key(row)
+            self.keys[symbol] = k
+            self.order.append((k, symbol))
+        self.order.sort()
+
+    def position(self, symbol):
+        """Display index of symbol, or None"""
+        if symbol not in self.rows:
+            return None
+        return bisect.bisect_left(self.order, (self.keys[symbol], symbol))
+
+    def symbols(self):
+        return [s for _, s in self.order]
+
+    def clear(self):
+        self.rows.clear()
+        self.keys.clear()
+        self.order = []
+
+    def __contains__(self, symbol):
+        return symbol in self.rows
+
+    def __len__(self):
+        return len(self.order)
+
+    def __iter__(self):
+        # Snapshot: news threads iterate channels while the front end updates them
+        rows = self.rows
+        return iter([rows[s] for _, s in list(self.order) if s in rows])
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.rows[s] for _, s in self.order[index]]
+        return self.rows[self.order[index][1]]
+
+class _RecycledRowView(RecycleDataViewBehavior, BoxLayout):
+    """
+    Base for the data table's recycled rows. Widgets and canvas instructions are
+    built once per view; refresh_view_attrs() re-binds them to a data item
+    {'owner': SignalScanApp, 'row': ...} when RecycleView scrolls or the data changes.
+    """
+    def __init__(self, **kwargs):
+        super().__init__(orientation="horizontal", **kwargs)
+        self.owner = None
+        self.ticker = ""
+        with self.canvas.before:
+            self.bg_color = Color(0, 0, 0, 0)
+            self.bg_rect = Rectangle(pos=self.pos, size=self.size)
+        self.bind(pos=self._sync_bg, size=self._sync_bg)
+
+    def _sync_bg(self, *args):
+        self.bg_rect.pos = self.pos
+        self.bg_rect.size = self.size
+
+    def _style_news_button(self, btn, labels):
+        text, bg, fg = self.owner.news_button_style(self.ticker, labels)
+        btn.text = text
+        btn.background_color = bg
+        btn.color = fg
+
+    def _show_news(self, *args):
+        if self.owner:
+            title = self.owner.stock_news.get(self.ticker, {}).get('title', 'No news available')
+            self.owner.show_news_popup(self.ticker, title)
+
+class ChannelRowView(_RecycledRowView):
+    """Stock row: eight text cells and the NEWS button; formats its ChannelRow only while visible"""
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.cells = [Label(font_size=14) for _ in range(8)]
+        for cell in self.cells:
+            self.add_widget(cell)
+        self.news_btn = Button(font_size=12, size_hint=(1, 1), background_normal='', bold=True)
+        self.news_btn.bind(on_release=self._show_news)
+        self.add_widget(self.news_btn)
+
+    def refresh_view_attrs(self, rv, index, data):
+        self.owner = owner = data['owner']
+        row = data['row']
+        self.ticker = row.symbol
+        self.bg_color.rgba = row_background_color(row.symbol)
+        text_color = (0, 1, 0, 1) if row.change_pct >= 0 else (1, 0, 0, 1)
+        for i, cell in enumerate(self.cells):
+            cell.text = owner.format_channel_cell(row, i)
+            cell.color = text_color
+        self._style_news_button(self.news_btn, ("BREAKING", "NEWS", "NO NEWS"))
+        return super().refresh_view_attrs(rv, index, {})
+
+class HaltRowView(_RecycledRowView):
+    """Halt row: symbol, time, reason, price, %, NEWS and the resumption ALERT toggle"""
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.reason = "N/A"
+        self.cells = [Label(font_size=12, size_hint=(0.10, 1)) for _ in range(5)]
+        for cell in self.cells:
+            self.add_widget(cell)
+        self.news_btn = Button(font_size=11, size_hint=(0.10, 1), background_normal='', bold=True)
+        self.news_btn.bind(on_release=self._show_news)
+        self.add_widget(self.news_btn)
+        self.alert_btn = Button(font_size=11, size_hint=(0.10, 1), background_normal='', bold=True)
+        self.alert_btn.bind(on_release=self._toggle_alert)
+        self.add_widget(self.alert_btn)
+
+    def refresh_view_attrs(self, rv, index, data):
+        self.owner = data['owner']
+        halt_data = data['row']
+        self.ticker = halt_data[0]
+        self.reason = halt_data[2] if len(halt_data) > 2 else "N/A"
+        self.bg_color.rgba = get_timestamp_color(self.ticker)
+        texts = [str(halt_data[0]), str(halt_data[1]), str(halt_data[2]), 'N/A', 'N/A']
+        for i, cell in enumerate(self.cells):
+            cell.text = texts[i]
+            cell.color = (1, 0.3, 0.3, 1) if i == 0 else (0.9, 0.9, 0.9, 1)
+        self._style_news_button(self.news_btn, ("BREAK", "NEWS", "NONE"))
+        if f"{self.ticker}:{self.reason}" in halt_resumption_alerts:
+            self.alert_btn.text = 'ON'
+            self.alert_btn.background_color = (0, 1, 0, 1)
+            self.alert_btn.color = (0, 0, 0, 1)
+        else:
+            self.alert_btn.text = 'NONE'
+            self.alert_btn.background_color = (0, 0, 0, 1)
+            self.alert_btn.color = (1, 1, 1, 1)
+        return super().refresh_view_attrs(rv, index, {})
+
+    def _toggle_alert(self, *args):
+        if self.owner:
+            self.owner.toggle_halt_alert(self.ticker, self.reason)
+
+if GUI_ENABLED:
+    Factory.register('ChannelRowView', cls=ChannelRowView)
+    Factory.register('HaltRowView', cls=HaltRowView)
+
+def build_data_table():
+    """
+    Virtualized data table: only the visible rows have widgets, recycled as the data
+    changes. Each data item names its row view under 'viewclass' (see refresh_data_table).
+    """
+    table = RecycleView(size_hint=(1, 1))
+    rows_layout = RecycleBoxLayout(orientation="vertical", size_hint_y=None, spacing=2,
+                                   default_size=(None, 40), default_size_hint=(1, None))
+    rows_layout.bind(minimum_height=rows_layout.setter('height'))
+    table.add_widget(rows_layout)
+    # viewclass/key_viewclass are stored on the layout manager - set them once it is attached
+    table.viewclass = 'ChannelRowView'
+    table.key_viewclass = 'viewclass'
+    return table
+
+def row_background_color(symbol):
+    """Breaking-news flash or the timestamp age color for a row"""
+    if has_breaking_news_flash(symbol):
+        return (0, 1, 0, 0.3) if int(time.time() * 2) % 2 == 0 else (0, 0.1, 0.3, 0.3)
+    return get_timestamp_color(symbol)
+
 class SignalScanApp(BoxLayout):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -3262,14 +5452,17 @@ class SignalScanApp(BoxLayout):
             self.bg_rect = Rectangle(size=self.size, pos=self.pos)
         self.bind(size=self._update_bg, pos=self._update_bg)
         
-        self.live_data = {k: [] for k in ["PreGap", "HOD", "RunUp", "P-HOD", "P-RunUp", "Rvsl", "Halts", "BKG-News"]}
+        self.current_sort_column = None
+        self.current_sort_ascending = True
+        # Category channels are indexed (symbol -> row, ordered by the sort column); Halts is rebuilt wholesale
+        key, reverse = self.channel_sort_key()
+        self.live_data = {k: ([] if k == "Halts" else ChannelIndex(key, reverse))
+                          for k in ["PreGap", "HOD", "RunUp", "P-HOD", "P-RunUp", "Rvsl", "Halts", "BKG-News"]}
+        self.table_rows = {}
         self.stock_news = {}
-        self.price_snapshots = {}
         self.current_channel = "RunUp"
         self.nasdaq_last = self.nasdaq_pct = 0.0
         self.sp_last = self.sp_pct = 0.0
-        self.current_sort_column = None
-        self.current_sort_ascending = True
         self.is_kiosk_mode = False
         
         self.sound_manager = SoundManager()
@@ -3281,6 +5474,11 @@ class SignalScanApp(BoxLayout):
             news_manager_ref=None,
             enrichment_manager_ref=self.enrichment_manager
         )
+        self.candidate_alerted = set()
+        categorizer = self.market_data.categorizer
+        categorizer.on_diff = self.apply_channel_diff
+        categorizer.news_lookup = lambda s: self.stock_news.get(s)
+        categorizer.news_fetcher = self.fetch_channel_news
         self.halt_manager = HaltManager(callback=self.on_halt_update)
         
         self.build_header()
@@ -3292,16 +5490,15 @@ class SignalScanApp(BoxLayout):
         main_content.add_widget(self.data_container)
         self.add_widget(main_content)
         
+        event_sink.start()
         Clock.schedule_interval(self.update_times, 1)
         Clock.schedule_interval(self.check_halt_resumptions, 10)  # Check every 10 seconds
         Clock.schedule_interval(self.check_midnight_reset, 60)  # Check every minute
-        Clock.schedule_interval(self.refresh_data_table, 2)
         Clock.schedule_once(self.start_market_data, 2)
         Clock.schedule_once(self.start_news_feed, 10)
         Clock.schedule_once(self.start_halt_monitor, 4)
         Clock.schedule_once(self.update_indices, 5)
-        Clock.schedule_interval(self.refresh_timestamp_colors, 60)
-        Clock.schedule_interval(self.flash_breaking_news_tabs, 0.5)
+        render_scheduler.start(self)
         
         Window.bind(on_request_close=self.on_window_close)
 
@@ -3404,21 +5601,20 @@ class SignalScanApp(BoxLayout):
         self.stock_news[symbol]['tier'] = 2 if is_breaking else 3
         if is_breaking:
             register_breaking_news(symbol)
+        render_scheduler.mark_symbol(symbol)
         
 
-    def flash_breaking_news_tabs(self, dt):
-        flash_on = int(time.time() * 2) % 2 == 0
-        for channel_name, btn in self.channel_buttons.items():
-            has_breaking = any(has_breaking_news_flash(stock[0]) for stock in self.live_data.get(channel_name, []))
-            if has_breaking and channel_name != self.current_channel:
-                if flash_on:
-                    btn.background_color = (0, 0.5, 1, 1)
-                else:
-                    btn.background_color = (0.15, 0.15, 0.4, 1)
-            elif channel_name == self.current_channel:
-                btn.background_color = (0, 0.8, 0, 1)
-            else:
-                btn.background_color = (0.25, 0.25, 0.25, 1)
+    def style_channel_tab(self, channel_name, flash_on):
+        """Tab color: current, flashing (breaking news in the channel) or idle"""
+        btn = self.channel_buttons.get(channel_name)
+        if btn is None:
+            return
+        if channel_name == self.current_channel:
+            btn.background_color = (0, 0.8, 0, 1)
+        elif render_scheduler.breaking_count(channel_name):
+            btn.background_color = (0, 0.5, 1, 1) if flash_on else (0.15, 0.15, 0.4, 1)
+        else:
+            btn.background_color = (0.25, 0.25, 0.25, 1)
 
     def on_halt_update(self, halt_data):
         print(f"[HALT-UPDATE] Received halt  {halt_data}")  # ADD THIS LINE
@@ -3448,6 +5644,7 @@ class SignalScanApp(BoxLayout):
                     (symbol, get_timestamp_display(symbol), halt_info['reason'][:20],
                      price_str, pct_str, news_text, alert_indicator)
                 )
+        render_scheduler.mark_channel('Halts')
 
     def toggle_halt_alert(self, symbol, reason):
         """Toggle alert for halt resumption"""
@@ -3623,212 +5820,64 @@ class SignalScanApp(BoxLayout):
             float_shares = data.get('float', 0)
             rvol = data.get('rvol', 0)
             is_new_hod = data.get('is_new_hod', False)
-            is_52wk_high = data.get('is_52wk_high', False)
             
             if price == 0:
                 return
             
-            if float_shares > 0:
-                if float_shares <= 20:
-                    float_str = f"{float_shares:.1f}M [LOW]"
-                elif float_shares <= 100:
-                    float_str = f"{float_shares:.1f}M [MED]"
-                elif float_shares >= 1000:
-                    float_str = f"{float_shares/1000:.1f}B"
-                else:
-                    float_str = f"{float_shares:.1f}M"
-            else:
-                float_str = "N/A"
-            
-            rvol_str = f"{rvol:.2f}x" if rvol > 0 else "0.00x"
-            
             register_ticker_timestamp(symbol)
 
-            # Track price history for quick move detection
-            now = datetime.datetime.now(NY_TZ)
-            if symbol not in self.price_snapshots:
-                self.price_snapshots[symbol] = []
-            
-            self.price_snapshots[symbol].append((now, price))
-            
-            # Keep only last 15 minutes of data
-            cutoff = now - datetime.timedelta(minutes=15)
-            self.price_snapshots[symbol] = [(ts, p) for ts, p in self.price_snapshots[symbol] if ts >= cutoff]
-
-            # Get current bar volume from data
-            cbvol = data.get('cbvol', 0)
-            cbvolstr = self.format_volume(cbvol) if cbvol > 0 else "N/A"
-
-            formatted = [symbol, get_timestamp_display(symbol), f"${price:.2f}", f"{change_pct:+.1f}%",
-                         cbvolstr, self.format_volume(volume), float_str, rvol_str,"NEWS"]
+            # Track price windows for quick move detection (shared with Tier 3)
+            self.market_data.quick_moves.record(symbol, price)
 
-            self.categorize_stock(formatted, change_pct, volume, rvol, float_shares, price, is_new_hod, is_52wk_high)
+            row = ChannelRow(symbol, price, change_pct, data.get('cbvol', 0), volume, float_shares, rvol)
+            self.market_data.categorizer.submit({
+                'symbol': symbol, 'price': price, 'change_pct': change_pct, 'volume': volume,
+                'rvol': rvol, 'float': float_shares, 'is_new_hod': is_new_hod, 'row': row,
+            })
         except Exception as e:
             print(f"Error processing {symbol}: {e}")
 
-    def check_quick_move(self, symbol, current_price):
-        """
-        Check if stock meets quick move criteria:
-        - 5% gain in last 5 minutes, OR
-        - 10% gain in last 10 minutes
-        """
-        if symbol not in self.price_snapshots or len(self.price_snapshots[symbol]) < 2:
-            return False
-        
-        now_est = datetime.datetime.now(NY_TZ)
-        snapshots = self.price_snapshots[symbol]
-        
-        # Check 5% in 5 minutes
-        five_min_ago = now_est - datetime.timedelta(minutes=5)
-        five_min_prices = [p for ts, p in snapshots if ts >= five_min_ago]
-        if five_min_prices:
-            min_price_5m = min(five_min_prices)
-            if min_price_5m > 0:
-                gain_5m = ((current_price - min_price_5m) / min_price_5m) * 100
-                if gain_5m >= 5.0:
-                    print(f"[QUICK-MOVE] {symbol}: 5min gain {gain_5m:.2f}% detected")
-                    return True
-        
-        # Check 10% in 10 minutes
-        ten_min_ago = now_est - datetime.timedelta(minutes=10)
-        ten_min_prices = [p for ts, p in snapshots if ts >= ten_min_ago]
-        if ten_min_prices:
-            min_price_10m = min(ten_min_prices)
-            if min_price_10m > 0:
-                gain_10m = ((current_price - min_price_10m) / min_price_10m) * 100
-                if gain_10m >= 10.0:
-                    print(f"[QUICK-MOVE] {symbol}: 10min gain {gain_10m:.2f}% detected")
-                    return True
-        
-        print(f"[QUICK-MOVE] {symbol}: No quick move detected")
-        return False
-
-    def categorize_stock(self, stock_data, change_pct, volume, rvol, float_shares, price, is_new_hod, is_52wk_high):
-        ticker = stock_data[0]
-        scanner_logger.debug(f"[CATEGORIZE] Processing {ticker}")
-        was_in_hod = any(s[0] == ticker for s in self.live_data["HOD"])
-        
-        # Remove from all channels except Halts
-        for ch in ["PreGap", "HOD", "RunUp", "P-HOD", "P-RunUp", "Rvsl"]:
-            self.live_data[ch] = [s for s in self.live_data[ch] if s[0] != ticker]
-        
-        now_est = datetime.datetime.now(NY_TZ)
-        is_premarket = now_est.hour < 9 or (now_est.hour == 9 and now_est.minute < 30)
-        
-        hod_candidate_added = False
-
-        # PreGap: <= $15, premarket, >=10% change, >=500K volume, <=100M float
-        if (is_premarket and price <= 15.0 and abs(change_pct) >= 10.0 and 
-            volume >= 500000 and float_shares <= 100000000):
-            self.live_data['PreGap'].append(stock_data)
-            self.ticker_timestamp_registry[ticker] = datetime.now()
-            self.enrichment_manager.record_channel_hit(ticker, "PreGap")
-            if self.news_manager and ticker not in self.stock_news:
-                self.news_manager.fetch_news_pair(ticker)
-                time.sleep(0.1)
-                self.news_manager.fetch_yfinance_news(ticker)
-
-        # HOD: $1-$15, new HOD, >=5.0x RVOL, <=100M float, >=+10% gain
-        if (1.0 <= price <= 15.0 and is_new_hod and rvol >= 5.0 and 
-            float_shares <= 100000000 and change_pct >= 10.0):
-            self.live_data['HOD'].append(stock_data)
-            scanner_logger.info(f"[CATEGORIZE] {ticker} assigned to {channel}")
-            self.ticker_timestamp_registry[ticker] = datetime.now()
-            hod_candidate_added = True
-            self.enrichment_manager.record_channel_hit(ticker, "HOD")
-            if self.news_manager and ticker not in self.stock_news:
-                self.news_manager.fetch_news_pair(ticker)
-                time.sleep(0.1)
-                self.news_manager.fetch_yfinance_news(ticker)
-        
-        # RunUp: $1-$15, gap>=10%, >=5x RVOL, float<10M, quick move (5% in 5min or 10% in 10min)
-        runup_added = False
-        if (1.0 <= price <= 15.0 and change_pct >= 10.0 and 
-            rvol >= 5.0 and float_shares < 10 and self.check_quick_move(ticker, price)):
-            self.live_data['RunUp'].append(stock_data)
-            scanner_logger.info(f"[CATEGORIZE] {ticker} assigned to {channel}")
-            self.ticker_timestamp_registry[ticker] = datetime.now()
-            runup_added = True
-            print(f"[RUNUP-QUALIFIED] {ticker}: ${price:.2f}, Gap {change_pct:.1f}%, RVol {rvol:.2f}x, Float {float_shares:.1f}M")           
-            self.enrichment_manager.record_channel_hit(ticker, "RunUp")
-            if self.news_manager and ticker not in self.stock_news:
-                self.news_manager.fetch_news_pair(ticker)
-                time.sleep(0.1)
-                self.news_manager.fetch_yfinance_news(ticker)
-        
-        # Sound alert for new RunUp candidates (once per session)
-        if runup_added and ticker not in self.candidate_alerted:
-            self.candidate_alerted.add(ticker)
-            print(f"[ALERT-FIRED] RunUp alert for {ticker}")
-            self.sound_manager.play_candidate_alert()
-
-        # P-HOD: <= $1, new HOD, >=5.0x RVOL, <=100M float, >=+10% gain
-        if (price <= 1.0 and is_new_hod and rvol >= 5.0 and 
-            float_shares <= 100000000 and change_pct >= 10.0):
-            self.live_data['P-HOD'].append(stock_data)
-            scanner_logger.info(f"[CATEGORIZE] {ticker} assigned to {channel}")
-            self.ticker_timestamp_registry[ticker] = datetime.now()
-            self.enrichment_manager.record_channel_hit(ticker, "P-HOD")
-            if self.news_manager and ticker not in self.stock_news:
-                self.news_manager.fetch_news_pair(ticker)
-                time.sleep(0.1)
-                self.news_manager.fetch_yfinance_news(ticker)
-        
-        # P-RunUp: <= $1, gap>=10%, >=7x RVOL, float<10M, quick move (5% in 5min or 10% in 10min)
-        prunup_added = False       
-        if (price <= 1.0 and change_pct >= 10.0 and 
-            rvol >= 7.0 and float_shares < 10 and self.check_quick_move(ticker, price)):
-            self.live_data['P-RunUp'].append(stock_data)
-            scanner_logger.info(f"[CATEGORIZE] {ticker} assigned to {channel}")
-            self.ticker_timestamp_registry[ticker] = datetime.now()
-            prunup_added = True
-            print(f"[P-RUNUP-QUALIFIED] {ticker}: ${price:.2f}, Gap {change_pct:.1f}%, RVol {rvol:.2f}x, Float {float_shares:.1f}M")          
-            self.enrichment_manager.record_channel_hit(ticker, "P-RunUp")
-            if self.news_manager and ticker not in self.stock_news:
-                self.news_manager.fetch_news_pair(ticker)
-                time.sleep(0.1)
-                self.news_manager.fetch_yfinance_news(ticker)
-        
-        # Sound alert for new P-RunUp candidates (once per session)
-        if prunup_added and ticker not in self.candidate_alerted:
-            self.candidate_alerted.add(ticker)
-            print(f"[ALERT-FIRED] P-RunUp alert for {ticker}")
-            self.sound_manager.play_candidate_alert()
-
-        # Rvsl: <=$15, >=8.0x RVOL, >=8% change
-        if (price <= 15.0 and rvol >= 8.0 and abs(change_pct) >= 8.0):
-            self.live_data['Rvsl'].append(stock_data)
-            scanner_logger.info(f"[CATEGORIZE] {ticker} assigned to {channel}")
-            self.ticker_timestamp_registry[ticker] = datetime.now()
-            self.enrichment_manager.record_channel_hit(ticker, "Rvsl")
-            if self.news_manager and ticker not in self.stock_news:
-                self.news_manager.fetch_news_pair(ticker)
-                time.sleep(0.1)
-                self.news_manager.fetch_yfinance_news(ticker)
-        
-        # Breaking News Channel: Has breaking news regardless of technical criteria
-        news_data = self.stock_news.get(ticker, {})
-        if news_data.get('is_breaking', False):
-            # Check if news age is still within breaking window (2 hours)
-            news_age = news_data.get('age_hours', 999)
-            if news_age <= 2.0:
-                self.live_data['BKG-News'].append(stock_data)
-                self.enrichment_manager.record_channel_hit(ticker, "BKG-News")
+    def apply_channel_diff(self, diff):
+        """Apply a CategorizationEngine membership diff to live_data (Kivy thread, via ui_bus)"""
+        ticker = diff['symbol']
+        row = diff['row']
+        entered = []
+        for ch in CATEGORY_CHANNELS:
+            index = self.live_data[ch]
+            if ch in diff['channels']:
+                before = index.position(ticker)
+                if index.upsert(ticker, row):
+                    entered.append(ch)
+                if before is None or before != index.position(ticker):
+                    render_scheduler.mark_channel(ch)
+                else:
+                    render_scheduler.mark_row(ch, ticker)
+            elif index.remove(ticker):
+                render_scheduler.mark_channel(ch)
+
+        for ch in entered:
+            scanner_logger.info(f"[CATEGORIZE] {ticker} assigned to {ch}")
+            register_ticker_timestamp(ticker)
+            self.enrichment_manager.record_channel_hit(ticker, ch)
+            if ch in ("RunUp", "P-RunUp"):
+                print(f"[{ch.upper()}-QUALIFIED] {ticker}: ${row.price:.2f}, Gap {row.change_pct:.1f}%, RVol {row.rvol:.2f}x, Float {row.float_shares:.1f}M")
+                # Sound alert for new RunUp / P-RunUp candidates (once per session)
+                if ticker not in self.candidate_alerted:
+                    self.candidate_alerted.add(ticker)
+                    print(f"[ALERT-FIRED] {ch} alert for {ticker}")
+                    self.sound_manager.play_candidate_alert()
+            elif ch == "BKG-News":
                 register_breaking_news(ticker)
-                # Play breaking news sound alert
                 if self.sound_manager:
                     self.sound_manager.play_news_alert()
 
-        # Sort channels by RVOL
-        if self.current_sort_column is None:
-            for ch in ["PreGap", "HOD", "RunUp", "P-HOD", "P-RunUp", "Rvsl"]:
-                try:
-                    self.live_data[ch].sort(key=lambda x: float(str(x[6]).replace('x', '')), reverse=True)
-                except:
-                    pass
-        else:
-            self.apply_current_sort()
-        
+    def fetch_channel_news(self, symbol):
+        """News for a newly categorized ticker (runs on the categorizer news thread)"""
+        if self.news_manager and symbol not in self.stock_news:
+            self.news_manager.fetch_news_pair(symbol)
+            time.sleep(0.1)
+            self.news_manager.fetch_yfinance_news(symbol)
+
     def update_indices(self, dt=None):
         self.nasdaq_last, self.nasdaq_pct = self.market_data.get_index_data(".IXIC")
         self.sp_last, self.sp_pct = self.market_data.get_index_data(".SPX")
@@ -3859,20 +5908,20 @@ class SignalScanApp(BoxLayout):
         max_age = datetime.timedelta(hours=8)
         removed = 0
     
-        for channel in list(self.live_data.keys()):
-            original_count = len(self.live_data[channel])
-
-            self.live_data[channel] = [
-                stock for stock in self.live_data[channel]
-                if stock[0] not in self.ticker_timestamp_registry or
-                (current_time - self.ticker_timestamp_registry[stock[0]]['datetime']) <= max_age
-            ]
-
-            removed += (original_count - len(self.live_data[channel]))
+        for channel, stocks in self.live_data.items():
+            expired = [stock[0] for stock in stocks
+                       if stock[0] in ticker_timestamp_registry and
+                       (current_time - ticker_timestamp_registry[stock[0]]['datetime']) > max_age]
+            if isinstance(stocks, ChannelIndex):
+                for symbol in expired:
+                    stocks.remove(symbol)
+            else:
+                self.live_data[channel] = [stock for stock in stocks if stock[0] not in expired]
+            removed += len(expired)
     
         if removed > 0:
             print(f"[CLEANUP] Removed {removed} expired tickers")
-            self.update_display()
+            render_scheduler.mark_all()
 
     def clear_all_tickers_daily(self, dt=None):
         """Clear all tickers at 2 AM EST daily"""
@@ -3884,8 +5933,9 @@ class SignalScanApp(BoxLayout):
             ticker_timestamp_registry.clear()
             
             # Clear all live_data channels
-            for channel in self.live_data.keys():
-                self.live_data[channel] = []
+            for channel in self.live_data.values():
+                channel.clear()
+            render_scheduler.mark_all()
             
             # Clear stock news cache
             self.stock_news = {}
@@ -4016,12 +6066,15 @@ class SignalScanApp(BoxLayout):
             print(f"MANUAL: Fetching news for {len(symbols)} tickers...")
             start_time = time.time()
             
+            # Alpaca takes ticker lists - one batched pass for all symbols
+            if self.news_manager:
+                self.news_manager.fetch_alpaca_news_batch(symbols)
+            
             # Fetch news for each ticker
             for i, symbol in enumerate(symbols, 1):
                 if self.news_manager:
-                    # Fetch from all 3 providers (no delays between providers)
+                    # Per-ticker providers (no delays between providers)
                     self.news_manager.fetch_gdelt_news(symbol)
-                    self.news_manager.fetch_alpaca_news(symbol)
                     self.news_manager.fetch_finnhub_news(symbol)
 
                     # Log progress every 10 tickers
@@ -4044,17 +6097,20 @@ class SignalScanApp(BoxLayout):
         """Background thread for manual news fetching"""
         while self.running:
             try:
-                app = App.get_running_app()
-                if not hasattr(app.root, 'live_data'):
+                live_data = event_sink.live_channels()
+                if live_data is None:
                     time.sleep(5)
                     continue
                 
                 # Get active tickers from GUI
                 active_tickers = set()
-                for channel_name, channel_stocks in app.root.live_data.items():
+                for channel_name, channel_stocks in live_data.items():
                     for stock in channel_stocks:
                         active_tickers.add(stock[0])  # stock[0] is symbol
                 
+                # Alpaca takes ticker lists - one batched pass for all symbols
+                self.news_manager.fetch_alpaca_news_batch(sorted(active_tickers))
+                
                 # Fetch news for each active ticker
                 for symbol in active_tickers:
                     if not self.running:
@@ -4066,10 +6122,6 @@ class SignalScanApp(BoxLayout):
                         self.news_manager.gdelt_manual_uses += 1
                         time.sleep(0.5)
                     
-                    # Alpaca
-                    self.news_manager.fetch_alpaca_news(symbol)
-                    time.sleep(0.5)
-                    
                     # yFinance
                     self.news_manager.fetch_yfinance_news(symbol)
                     time.sleep(0.5)
@@ -4153,13 +6205,8 @@ class SignalScanApp(BoxLayout):
             self.current_sort_column = column_index
             self.current_sort_ascending = True
         
-        stocks = self.live_data.get(self.current_channel, [])
         try:
-            if column_index == 1:
-                stocks.sort(key=lambda x: ticker_timestamp_registry.get(x[0], {}).get('datetime', datetime.datetime.min), reverse=not self.current_sort_ascending)
-            else:
-                stocks.sort(key=lambda x: self.parse_sort_value(x[column_index] if column_index < len(x) else "", column_index), reverse=not self.current_sort_ascending)
-            self.live_data[self.current_channel] = stocks
+            self.apply_current_sort()
             self.refresh_data_table()
         except Exception as e:
             print(f"Sort error: {e}")
@@ -4299,6 +6346,10 @@ class SignalScanApp(BoxLayout):
             
             print(f"[MANUAL] Fetching news for {len(symbols)} tickers...")
             
+            # Alpaca takes ticker lists - one batched pass for all symbols
+            if self.news_manager:
+                self.news_manager.fetch_alpaca_news_batch(symbols)
+            
             for i, symbol in enumerate(symbols, 1):
                 if self.news_manager:
                     self.news_manager.fetch_news_pair(symbol)
@@ -4312,9 +6363,6 @@ class SignalScanApp(BoxLayout):
                         self.news_manager.gdelt_manual_uses += 1
                         time.sleep(0.5)
                         print(f"[MANUAL] Fetched {symbol} GDELT")
-                    
-                    self.news_manager.fetch_alpaca_news(symbol)
-                    time.sleep(0.5)
         
         threading.Thread(target=manual_fetch_thread, daemon=True).start()
 
@@ -4382,11 +6430,8 @@ class SignalScanApp(BoxLayout):
         self.update_header_labels()
         data_section.add_widget(self.header_layout)
         
-        self.scroll_view = ScrollView(size_hint=(1, 1))
-        self.rows_container = BoxLayout(orientation="vertical", size_hint_y=None, spacing=2)
-        self.rows_container.bind(minimum_height=self.rows_container.setter('height'))
-        self.scroll_view.add_widget(self.rows_container)
-        data_section.add_widget(self.scroll_view)
+        self.data_table = build_data_table()
+        data_section.add_widget(self.data_table)
         
         return data_section
 
@@ -4409,13 +6454,8 @@ class SignalScanApp(BoxLayout):
             self.current_sort_column = column_index
             self.current_sort_ascending = True
         
-        stocks = self.live_data.get(self.current_channel, [])
         try:
-            if column_index == 1:
-                stocks.sort(key=lambda x: ticker_timestamp_registry.get(x[0], {}).get('datetime', datetime.datetime.min), reverse=not self.current_sort_ascending)
-            else:
-                stocks.sort(key=lambda x: self.parse_sort_value(x[column_index] if column_index < len(x) else "", column_index), reverse=not self.current_sort_ascending)
-            self.live_data[self.current_channel] = stocks
+            self.apply_current_sort()
             self.refresh_data_table()
         except Exception as e:
             print(f"Sort error: {e}")
@@ -4447,158 +6487,80 @@ class SignalScanApp(BoxLayout):
         except:
             return 0
 
+    def channel_sort_key(self):
+        """(key, reverse) for ChannelIndex ordering: RVOL descending until a column header is clicked"""
+        col = self.current_sort_column
+        if col is None:
+            return (lambda x: x.rvol), True
+        if col == 1:
+            def key(x):
+                ts = ticker_timestamp_registry.get(x[0], {}).get('datetime')
+                return ts.timestamp() if ts else 0
+            return key, not self.current_sort_ascending
+        return (lambda x: x[col] if 0 < col < len(x) else 0), not self.current_sort_ascending
+
     def apply_current_sort(self):
-        if self.current_sort_column is not None:
-            stocks = self.live_data.get(self.current_channel, [])
+        key, reverse = self.channel_sort_key()
+        col = self.current_sort_column
+        for channel, stocks in self.live_data.items():
             try:
-                if self.current_sort_column == 1:
-                    stocks.sort(key=lambda x: ticker_timestamp_registry.get(x[0], {}).get('datetime', datetime.datetime.min))
-                else:
-                    stocks.sort(key=lambda x: self.parse_sort_value(x[self.current_sort_column] if self.current_sort_column < len(x) else "", self.current_sort_column), reverse=not self.current_sort_ascending)
-                self.live_data[self.current_channel] = stocks
+                if isinstance(stocks, ChannelIndex):
+                    stocks.set_order(key, reverse)
+                elif channel == self.current_channel and col is not None:
+                    # Halts rows are display strings
+                    stocks.sort(key=key if col == 1 else (lambda x: self.parse_sort_value(x[col] if col < len(x) else "", col)),
+                                reverse=reverse)
             except Exception as e:
                 print(f"Apply sort error: {e}")
 
-    def refresh_data_table(self, dt=None):
-        self.rows_container.clear_widgets()
-        stocks = self.live_data.get(self.current_channel, [])
-        
-        for stock_data in stocks[:50]:
-            if self.current_channel == "Halts":
-                row = self.create_halt_row(stock_data)
-            else:
-                row = self.create_stock_row(stock_data)
-            if row:
-                self.rows_container.add_widget(row)
-
-    def refresh_timestamp_colors(self, dt):
-        self.refresh_data_table()
+    def format_channel_cell(self, row, col):
+        """Display text for one column of a ChannelRow (render time only)"""
+        if col == 0:
+            return row.symbol
+        if col == 1:
+            return get_timestamp_display(row.symbol)
+        if col == 2:
+            return f"${row.price:.2f}"
+        if col == 3:
+            return f"{row.change_pct:+.1f}%"
+        if col == 4:
+            return self.format_volume(row.cbvol) if row.cbvol > 0 else "N/A"
+        if col == 5:
+            return self.format_volume(row.volume)
+        if col == 6:
+            f = row.float_shares
+            if f <= 0:
+                return "N/A"
+            if f <= 20:
+                return f"{f:.1f}M [LOW]"
+            if f <= 100:
+                return f"{f:.1f}M [MED]"
+            if f >= 1000:
+                return f"{f/1000:.1f}B"
+            return f"{f:.1f}M"
+        if col == 7:
+            return f"{row.rvol:.2f}x"
+        return ""
 
-    def create_halt_row(self, halt_data):
-        row = BoxLayout(orientation="horizontal", size_hint=(1, None), height=40)
-        ticker = halt_data[0]
-        
-        bg_color = get_timestamp_color(ticker)
-        with row.canvas.before:
-            Color(bg_color[0], bg_color[1], bg_color[2], bg_color[3])
-            rect = Rectangle(pos=row.pos, size=row.size)
-        row.bind(pos=lambda instance, value, r=rect: setattr(r, 'pos', value))
-        row.bind(size=lambda instance, value, r=rect: setattr(r, 'size', value))
-        
-        # Column 1: SYMBOL (width 0.12)
-        row.add_widget(Label(text=str(halt_data[0]), font_size=12, color=(1, 0.3, 0.3, 1), size_hint=(0.10, 1)))
-        
-        # Column 2: TIME (width 0.18)
-        row.add_widget(Label(text=str(halt_data[1]), font_size=12, color=(0.9, 0.9, 0.9, 1), size_hint=(0.10, 1)))
-        
-        # Column 3: REASON (width 0.25)
-        row.add_widget(Label(text=str(halt_data[2]), font_size=12, color=(0.9, 0.9, 0.9, 1), size_hint=(0.10, 1)))
-        
-        # Column 4: PRICE (width 0.12)
-        row.add_widget(Label(text='N/A', font_size=12, color=(0.9, 0.9, 0.9, 1), size_hint=(0.10, 1)))
-        
-        # Column 5: % (width 0.08)
-        row.add_widget(Label(text='N/A', font_size=12, color=(0.9, 0.9, 0.9, 1), size_hint=(0.10, 1)))
-        
-        # Column 6: NEWS (width 0.15)
-        if ticker in self.stock_news:
-            tier = self.stock_news[ticker].get('tier', 3)
-            if tier == 2:
-                btn_color = (0, 0, 0.5, 1)
-                btn_text = "BREAK"
-                btn_text_color = (1, 1, 1, 1)
-            else:
-                btn_color = (1, 1, 0, 1)
-                btn_text = "NEWS"
-                btn_text_color = (0, 0, 0, 1)
-        else:
-            btn_color = (0, 0, 0, 1)
-            btn_text = "NONE"
-            btn_text_color = (1, 1, 1, 1)
-        
-        btn = Button(text=btn_text, font_size=11, size_hint=(0.10, 1), background_color=btn_color, 
-                     background_normal='', bold=True, color=btn_text_color)
-        news_content = self.stock_news.get(ticker, {}).get('title', 'No news available')
-        btn.bind(on_release=lambda x, t=ticker, n=news_content: self.show_news_popup(t, n))
-        row.add_widget(btn)
-        
-        # Column 7: ALERT button (width 0.10)
-        # ALERT button (Column 7) - Toggle resumption alerts
-        reason = halt_data[2] if len(halt_data) > 2 else "N/A"
-        alert_key = f"{ticker}:{reason}"
-        
-        if alert_key in halt_resumption_alerts:
-            alert_btn = Button(
-                text='ON',
-                font_size=11,
-                size_hint=(0.10, 1),
-                background_color=(0, 1, 0, 1),
-                background_normal='',
-                bold=True,
-                color=(0, 0, 0, 1)
-            )
-        else:
-            alert_btn = Button(
-                text='NONE',
-                font_size=11,
-                size_hint=(0.10, 1),
-                background_color=(0, 0, 0, 1),
-                background_normal='',
-                bold=True,
-                color=(1, 1, 1, 1)
-            )
-        
-        alert_btn.bind(on_release=lambda x, t=ticker, r=reason: self.toggle_halt_alert(t, r))
-        row.add_widget(alert_btn)
-        
-        return row
 
-    def create_stock_row(self, stock_data):
-        row = BoxLayout(orientation="horizontal", size_hint=(1, None), height=40)
-        ticker = stock_data[0]
-        
-        if has_breaking_news_flash(ticker):
-            flash_on = int(time.time() * 2) % 2 == 0
-            if flash_on:
-                bg_color = (0, 1, 0, 0.3)
-            else:
-                bg_color = (0, 0.1, 0.3, 0.3)
-        else:
-            bg_color = get_timestamp_color(ticker)
-        
-        with row.canvas.before:
-            Color(bg_color[0], bg_color[1], bg_color[2], bg_color[3])
-            rect = Rectangle(pos=row.pos, size=row.size)
-        row.bind(pos=lambda instance, value, r=rect: setattr(r, 'pos', value))
-        row.bind(size=lambda instance, value, r=rect: setattr(r, 'size', value))
-        
-        try:
-            change_str = stock_data[3].replace('%', '').replace('+', '')
-            change_pct = float(change_str)
-            text_color = (0, 1, 0, 1) if change_pct >= 0 else (1, 0, 0, 1)
-        except:
-            text_color = (0.9, 0.9, 0.9, 1)
-        
-        for i, value in enumerate(stock_data):
-            if i == 8:
-                if ticker in self.stock_news:
-                    tier = self.stock_news[ticker].get('tier', 3)
-                    if tier == 2:
-                        btn_color = (0, 0, 0.5, 1); btn_text = "BREAKING"; btn_text_color = (1, 1, 1, 1)
-                    else:
-                        btn_color = (1, 1, 0, 1); btn_text = "NEWS"; btn_text_color = (0, 0, 0, 1)
-                else:
-                    btn_color = (0, 0, 0, 1); btn_text = "NO NEWS"; btn_text_color = (1, 1, 1, 1)
-                
-                btn = Button(text=btn_text, font_size=12, size_hint=(1, 1), background_color=btn_color, background_normal='', bold=True, color=btn_text_color)
-                news_content = self.stock_news.get(ticker, {}).get('title', 'No news available')
-                btn.bind(on_release=lambda x, t=ticker, n=news_content: self.show_news_popup(t, n))
-                row.add_widget(btn)
-            else:
-                row.add_widget(Label(text=str(value), font_size=14, color=text_color))
-                row.add_widget(btn)
-        
-                return row
+    def refresh_data_table(self, dt=None):
+        stocks = self.live_data.get(self.current_channel, [])
+        viewclass = 'HaltRowView' if self.current_channel == "Halts" else 'ChannelRowView'
+        # Plain data items; RecycleView re-binds its existing row views instead of rebuilding widgets
+        self.data_table.data = [{'viewclass': viewclass, 'owner': self, 'row': stock_data} for stock_data in stocks]
+        self.table_rows = {}
+        for i, stock_data in enumerate(stocks):
+            self.table_rows.setdefault(stock_data[0], []).append(i)
+
+    def refresh_table_rows(self, symbols):
+        """Re-bind only the given symbols' rows of the current table (values changed, order did not)"""
+        stocks = self.live_data.get(self.current_channel, [])
+        data = self.data_table.data
+        for symbol in symbols:
+            for i in self.table_rows.get(symbol, ()):
+                if i < len(data):
+                    row = stocks.rows.get(symbol, data[i]['row']) if isinstance(stocks, ChannelIndex) else data[i]['row']
+                    data[i] = dict(data[i], row=row)
 
     def select_channel(self, channel_name):
         self.current_channel = channel_name
@@ -4614,11 +6576,16 @@ class SignalScanApp(BoxLayout):
                 btn.color = (0.7, 0.7, 0.7, 1)
         
         self.update_header_labels()
+        self.apply_current_sort()
         self.refresh_data_table()
+        render_scheduler.mark_tabs()
 
     def show_news_popup(self, ticker, news_text):
         clear_breaking_news_flash(ticker)
-        news_data = self.stock_news.get(ticker, {})
+        news_data = self.stock_news.get(ticker)
+        if not news_data and self.news_manager:
+            news_data = self.news_manager.latest_vault_news(ticker)
+        news_data = news_data or {}
         timestamp = news_data.get('timestamp')
         age_display = news_data.get('age_display', 'Unknown')
         age_hours = news_data.get('age_hours', 0)
@@ -4817,8 +6784,9 @@ class SignalScanApp(BoxLayout):
             ticker_timestamp_registry.clear()
             
             # Clear all live data tabs
-            for channel in self.root.live_data:
-                self.root.live_data[channel] = []
+            for channel in self.root.live_data.values():
+                channel.clear()
+            render_scheduler.mark_all()
             
             # Refresh display
             self.refresh_data_table()
@@ -4827,66 +6795,32 @@ class SignalScanApp(BoxLayout):
             print(f"[RESET] Midnight EST reset complete - {alerted_count} candidate alerts cleared, all ticker rows cleared")
 
     def refresh_data_table(self, dt=None):
-        self.rows_container.clear_widgets()
         stocks = self.live_data.get(self.current_channel, [])
-        
-        for stock_data in stocks[:50]:
-            if self.current_channel == "Halts":
-                row = self.create_halt_row(stock_data)
-            else:
-                row = self.create_stock_row(stock_data)
-            if row:
-                self.rows_container.add_widget(row)
-
-    def refresh_timestamp_colors(self, dt):
-        self.refresh_data_table()
-
+        viewclass = 'HaltRowView' if self.current_channel == "Halts" else 'ChannelRowView'
+        # Plain data items; RecycleView re-binds its existing row views instead of rebuilding widgets
+        self.data_table.data = [{'viewclass': viewclass, 'owner': self, 'row': stock_data} for stock_data in stocks]
+        self.table_rows = {}
+        for i, stock_data in enumerate(stocks):
+            self.table_rows.setdefault(stock_data[0], []).append(i)
+
+    def refresh_table_rows(self, symbols):
+        """Re-bind only the given symbols' rows of the current table (values changed, order did not)"""
+        stocks = self.live_data.get(self.current_channel, [])
+        data = self.data_table.data
+        for symbol in symbols:
+            for i in self.table_rows.get(symbol, ()):
+                if i < len(data):
+                    row = stocks.rows.get(symbol, data[i]['row']) if isinstance(stocks, ChannelIndex) else data[i]['row']
+                    data[i] = dict(data[i], row=row)
+
+    def news_button_style(self, ticker, labels):
+        """(text, background, text color) of a row's NEWS button; labels = (breaking, news, none)"""
+        if ticker in self.stock_news:
+            if self.stock_news[ticker].get('tier', 3) == 2:
+                return labels[0], (0, 0, 0.5, 1), (1, 1, 1, 1)
+            return labels[1], (1, 1, 0, 1), (0, 0, 0, 1)
+        return labels[2], (0, 0, 0, 1), (1, 1, 1, 1)
 
-    def create_stock_row(self, stock_data):
-        row = BoxLayout(orientation="horizontal", size_hint=(1, None), height=40)
-        ticker = stock_data[0]
-        
-        if has_breaking_news_flash(ticker):
-            flash_on = int(time.time() * 2) % 2 == 0
-            if flash_on:
-                bg_color = (0, 1, 0, 0.3)
-            else:
-                bg_color = (0, 0.1, 0.3, 0.3)
-        else:
-            bg_color = get_timestamp_color(ticker)
-        
-        with row.canvas.before:
-            Color(bg_color[0], bg_color[1], bg_color[2], bg_color[3])
-            rect = Rectangle(pos=row.pos, size=row.size)
-        row.bind(pos=lambda instance, value, r=rect: setattr(r, 'pos', value))
-        row.bind(size=lambda instance, value, r=rect: setattr(r, 'size', value))
-        
-        try:
-            change_str = stock_data[3].replace('%', '').replace('+', '')
-            change_pct = float(change_str)
-            text_color = (0, 1, 0, 1) if change_pct >= 0 else (1, 0, 0, 1)
-        except:
-            text_color = (0.9, 0.9, 0.9, 1)
-        
-        for i, value in enumerate(stock_data):
-            if i == 8:
-                if ticker in self.stock_news:
-                    tier = self.stock_news[ticker].get('tier', 3)
-                    if tier == 2:
-                        btn_color = (0, 0, 0.5, 1); btn_text = "BREAKING"; btn_text_color = (1, 1, 1, 1)
-                    else:
-                        btn_color = (1, 1, 0, 1); btn_text = "NEWS"; btn_text_color = (0, 0, 0, 1)
-                else:
-                    btn_color = (0, 0, 0, 1); btn_text = "NO NEWS"; btn_text_color = (1, 1, 1, 1)
-                
-                btn = Button(text=btn_text, font_size=12, size_hint=(1, 1), background_color=btn_color, background_normal='', bold=True, color=btn_text_color)
-                news_content = self.stock_news.get(ticker, {}).get('title', 'No news available')
-                btn.bind(on_release=lambda x, t=ticker, n=news_content: self.show_news_popup(t, n))
-                row.add_widget(btn)
-            else:
-                row.add_widget(Label(text=str(value), font_size=14, color=text_color))
-        
-        return row
 
     def select_channel(self, channel_name):
         self.current_channel = channel_name
@@ -4902,11 +6836,16 @@ class SignalScanApp(BoxLayout):
                 btn.color = (0.7, 0.7, 0.7, 1)
         
         self.update_header_labels()
+        self.apply_current_sort()
         self.refresh_data_table()
+        render_scheduler.mark_tabs()
 
     def show_news_popup(self, ticker, news_text):
         clear_breaking_news_flash(ticker)
-        news_data = self.stock_news.get(ticker, {})
+        news_data = self.stock_news.get(ticker)
+        if not news_data and self.news_manager:
+            news_data = self.news_manager.latest_vault_news(ticker)
+        news_data = news_data or {}
         timestamp = news_data.get('timestamp')
         age_display = news_data.get('age_display', 'Unknown')
         age_hours = news_data.get('age_hours', 0)
@@ -5016,11 +6955,138 @@ class SignalScanApp(BoxLayout):
         return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
 
 
+class HeadlessEngine:
+    """
+    The scanner without a display or audio: three tiers, categorization, news and
+    halts. Channel membership is kept in ChannelIndex exactly like the GUI so the
+    news loops see the same active tickers; channel entries and news are logged.
+    """
+    def __init__(self):
+        self.live_data = {k: ([] if k == "Halts" else ChannelIndex(lambda r: r.rvol, True))
+                          for k in ["PreGap", "HOD", "RunUp", "P-HOD", "P-RunUp", "Rvsl", "Halts", "BKG-News"]}
+        self.stock_news = {}
+        self.enrichment_manager = EnrichmentManager()
+        self.news_manager = None
+        self.market_data = MarketDataManager(
+            callback=self.on_data_update,
+            news_manager_ref=None,
+            enrichment_manager_ref=self.enrichment_manager
+        )
+        categorizer = self.market_data.categorizer
+        categorizer.on_diff = self.apply_channel_diff
+        categorizer.news_lookup = lambda s: self.stock_news.get(s)
+        categorizer.news_fetcher = self.fetch_channel_news
+        self.halt_manager = HaltManager(callback=self.on_halt_update)
+
+    def start(self):
+        self.market_data.start_bulk_scanner()
+        self.halt_manager.start_halt_monitor()
+        try:
+            with open("alpaca_validated.json", 'r') as f:
+                news_watchlist = [item['symbol'] for item in json.load(f)]
+        except Exception:
+            news_watchlist = []
+        self.news_manager = NewsManager(
+            callback=self.on_news_update,
+            sound_manager_ref=None,
+            watchlist=news_watchlist,
+            news_trigger_callback=self.market_data.add_news_trigger
+        )
+        self.market_data.news_manager_ref = self.news_manager
+        self.news_manager.start_news_stream()
+        print(f"[HEADLESS] News feed started with {len(news_watchlist)} tickers")
+
+    def stop(self):
+        self.market_data.stop()
+        if self.news_manager:
+            self.news_manager.stop()
+        self.halt_manager.stop()
+
+    def on_data_update(self, symbol, data):
+        scanner_logger.debug(f"[HEADLESS] {symbol} update: {data.get('current_price', 0)}")
+
+    def apply_channel_diff(self, diff):
+        ticker = diff['symbol']
+        for ch in CATEGORY_CHANNELS:
+            if ch in diff['channels']:
+                if self.live_data[ch].upsert(ticker, diff['row']):
+                    register_ticker_timestamp(ticker)
+                    self.enrichment_manager.record_channel_hit(ticker, ch)
+                    if ch == "BKG-News":
+                        register_breaking_news(ticker)
+                    print(f"[CATEGORIZE] {ticker} assigned to {ch} ({diff['row']})")
+                    scanner_logger.info(f"[CATEGORIZE] {ticker} assigned to {ch}")
+            else:
+                self.live_data[ch].remove(ticker)
+
+    def fetch_channel_news(self, symbol):
+        if self.news_manager and symbol not in self.stock_news:
+            self.news_manager.fetch_news_pair(symbol)
+            time.sleep(0.1)
+            self.news_manager.fetch_yfinance_news(symbol)
+
+    def on_news_update(self, news_data):
+        symbol = news_data.get('symbol', '')
+        is_breaking = news_data.get('is_breaking', False)
+        entry = self.stock_news.setdefault(symbol, {})
+        entry.update({
+            'title': news_data.get('title', ''),
+            'is_breaking': is_breaking,
+            'timestamp': news_data.get('timestamp'),
+            'age_hours': news_data.get('age_hours', 0),
+            'age_display': news_data.get('age_display', 'Unknown'),
+            'url': news_data.get('url', ''),
+            'tier': 2 if is_breaking else 3
+        })
+        if is_breaking:
+            register_breaking_news(symbol)
+        news_logger.info(f"[HEADLESS] News for {symbol}: {entry['title'][:80]}")
+
+    def on_halt_update(self, halt_data):
+        self.live_data['Halts'] = [
+            (symbol, get_timestamp_display(symbol), halt_info['reason'][:20])
+            for symbol, halt_list in halt_data.items() for halt_info in halt_list
+        ]
+        halt_logger.info(f"[HEADLESS] {len(halt_data)} halted symbols")
+
+def run_headless():
+    """Entry point for python 193.py --headless"""
+    setup_logging()
+    engine = HeadlessEngine()
+    set_event_sink(HeadlessEventSink(engine))
+    event_sink.start()
+    ready_ms = (time.perf_counter() - _STARTUP_T0) * 1000
+    print(f"[STARTUP] Headless engine ready in {ready_ms:.0f} ms (imports {IMPORT_SECONDS * 1000:.0f} ms) - starting network")
+    scanner_logger.info(f"[STARTUP] Headless engine ready in {ready_ms:.0f} ms (imports {IMPORT_SECONDS * 1000:.0f} ms)")
+    engine.start()
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        print("[HEADLESS] Stopping...")
+    finally:
+        engine.stop()
+        event_sink.stop()
+
 class SignalScanEnhancedApp(App):
     def build(self):
         return SignalScanApp()
 
+if __name__ == '__main__' and '--bench' in sys.argv:
+    # Kivy consumes unknown options - pass app options after "--": python 193.py -- --bench
+    bench_stream_decoders()
+    bench_quick_move_detector()
+    bench_keyword_matcher()
+    sys.exit(0)
+
+if __name__ == '__main__' and HEADLESS:
+    run_headless()
+    sys.exit(0)
+
 if __name__ == '__main__':
+    setup_logging()
+    configure_window()
+    print(f"[STARTUP] Imports {IMPORT_SECONDS * 1000:.0f} ms, GUI starting")
     # Create crash logger
     crash_logger = logging.getLogger('crash_log')
     crash_logger.setLevel(logging.ERROR)
@@ -38,6 +38,29 @@ Config.write()
 
 print("DEBUG MODE: Window should appear on main screen")
 
+# Coalescing mailbox: worker threads post by key, the Kivy thread drains once per frame.
+# A later post for the same key replaces the pending one, so bursts cost one callback.
+_pending_updates = {}
+_pending_lock = threading.Lock()
+
+
+def post_update(key, callback, *args):
+    """Queue callback(*args) for the next frame, replacing any pending update for key."""
+    with _pending_lock:
+        _pending_updates[key] = (callback, args)
+
+
+def drain_updates(dt):
+    """Run every pending update on the Kivy thread."""
+    global _pending_updates
+    with _pending_lock:
+        pending, _pending_updates = _pending_updates, {}
+    for callback, args in pending.values():
+        try:
+            callback(*args)
+        except Exception as e:
+            print(f"UI update error: {e}")
+
 
 class NewsManager:
     """Manages breaking news: Finnhub ONLY (24/7 unlimited) - SMART ON-DEMAND"""
@@ -169,7 +192,7 @@ class NewsManager:
                             'is_breaking': True,
                             'timestamp': timestamp
                         }
-                        Clock.schedule_once(lambda dt, nd=news_data: self.callback(nd), 0)
+                        post_update(('news', symbol, news_data['title']), self.callback, news_data)
                     print(f"[DEBUG] Crypto breaking news broadcast to top 3 stocks")
                 return
 
@@ -184,7 +207,7 @@ class NewsManager:
                     'is_breaking': is_breaking,
                     'timestamp': timestamp
                 }
-                Clock.schedule_once(lambda dt, nd=news_data: self.callback(nd), 0)
+                post_update(('news', symbol, title), self.callback, news_data)
 
                 if is_breaking:
                     print(f"[BREAKING] {symbol}: {title[:60]}...")
@@ -371,10 +394,7 @@ class MarketDataManager:
                         self.stock_data[symbol]['timestamp'] = timestamp
 
                         if self.callback:
-                            Clock.schedule_once(
-                                lambda dt, s=symbol, d=self.stock_data[symbol]: self.callback(s, d),
-                                0
-                            )
+                            post_update(('stock', symbol), self.callback, symbol, self.stock_data[symbol])
             except Exception as e:
                 print(f"WebSocket message error: {e}")
 
@@ -541,6 +561,7 @@ class SignalScanApp(BoxLayout):
         main_content.add_widget(self.data_container)
         self.add_widget(main_content)
 
+        Clock.schedule_interval(drain_updates, 0)
         Clock.schedule_interval(self.update_times, 1)
         Clock.schedule_once(self.start_market_data, 2)
         Clock.schedule_once(self.start_news_feed, 3)
@@ -0,0 +1,30 @@
+import importlib.util
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope='session')
+def headless(tmp_path_factory):
+    """193.py imported with SIGNALSCAN_HEADLESS=1 (no Kivy, pygame or tkinter)."""
+    cwd = os.getcwd()
+    os.chdir(tmp_path_factory.mktemp('headless'))  # 193.py creates cache/ in the working directory
+    argv = sys.argv
+    sys.argv = [argv[0]]
+    previous = os.environ.get('SIGNALSCAN_HEADLESS')
+    os.environ['SIGNALSCAN_HEADLESS'] = '1'
+    try:
+        spec = importlib.util.spec_from_file_location('signalscan_193_headless', os.path.join(ROOT, '193.py'))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    finally:
+        if previous is None:
+            os.environ.pop('SIGNALSCAN_HEADLESS', None)
+        else:
+            os.environ['SIGNALSCAN_HEADLESS'] = previous
+        sys.argv = argv
+        os.chdir(cwd)
+    yield module
@@ -0,0 +1,46 @@
+"""Quick-move alert hysteresis: one alert per move, cooldown, re-arm and re-fire."""
+import pytest
+
+
+@pytest.fixture
+def machine(headless):
+    return headless.AlertStateMachine(cooldown=120, rearm_pct=2.0)
+
+
+def fired(machine, triggered, price, now):
+    return machine.update('AAA', 60, triggered, price, now) == machine.FIRED
+
+
+def test_fires_once_while_condition_holds(machine):
+    assert fired(machine, True, 10.0, 0)
+    assert not any(fired(machine, True, 10.0, t) for t in range(1, 120))
+    assert machine.suppressed == 119
+
+
+def test_quiet_through_cooldown_even_on_new_highs(machine):
+    assert fired(machine, True, 10.0, 0)
+    assert machine.update('AAA', 60, False, 9.0, 60) is None
+    assert not fired(machine, True, 11.0, 119)
+    assert machine.state[('AAA', 60)][0] == machine.FIRED
+
+
+def test_rearms_after_move_fades(machine):
+    assert fired(machine, True, 10.0, 0)
+    assert machine.update('AAA', 60, False, 10.0, 120) == machine.ARMED
+    assert fired(machine, True, 10.1, 130)
+
+
+def test_refires_on_new_high_beyond_rearm_pct(machine):
+    assert fired(machine, True, 10.0, 0)
+    assert not fired(machine, True, 10.15, 121)  # +1.5% is inside rearm_pct
+    assert machine.state[('AAA', 60)][0] == machine.COOLDOWN
+    assert fired(machine, True, 10.21, 122)
+    assert machine.state[('AAA', 60)][1] == 10.21
+
+
+def test_timeframes_and_symbols_are_independent(machine):
+    assert fired(machine, True, 10.0, 0)
+    assert machine.update('AAA', 300, True, 10.0, 1) == machine.FIRED
+    assert machine.update('BBB', 60, True, 5.0, 1) == machine.FIRED
+    machine.discard('AAA')
+    assert fired(machine, True, 10.0, 2)
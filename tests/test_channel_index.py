@@ -0,0 +1,59 @@
+"""ChannelIndex keeps iteration, position() and len() in step through updates."""
+
+
+def assert_consistent(index, expected):
+    assert index.symbols() == expected
+    assert [row['symbol'] for row in index] == expected
+    assert [row['symbol'] for row in index[:]] == expected
+    assert len(index) == len(expected)
+    assert [index.position(s) for s in expected] == list(range(len(expected)))
+
+
+def row(symbol, change, volume):
+    return {'symbol': symbol, 'change': change, 'volume': volume}
+
+
+def test_reorder_remove_and_resort(headless):
+    index = headless.ChannelIndex(key=lambda r: r['change'], reverse=True)
+    assert index.upsert('AAA', row('AAA', 5.0, 300)) is True
+    assert index.upsert('BBB', row('BBB', 3.0, 100)) is True
+    assert index.upsert('CCC', row('CCC', 1.0, 200)) is True
+    assert_consistent(index, ['AAA', 'BBB', 'CCC'])
+
+    assert index.upsert('CCC', row('CCC', 9.0, 200)) is False  # sort key changed
+    assert_consistent(index, ['CCC', 'AAA', 'BBB'])
+    assert index[0]['change'] == 9.0
+
+    assert index.remove('AAA') is True
+    assert index.remove('AAA') is False
+    assert 'AAA' not in index
+    assert index.position('AAA') is None
+    assert_consistent(index, ['CCC', 'BBB'])
+
+    index.upsert('DDD', row('DDD', 4.0, 50))
+    index.set_order(key=lambda r: r['volume'])  # header click: volume, ascending
+    assert_consistent(index, ['DDD', 'BBB', 'CCC'])
+
+    index.upsert('BBB', row('BBB', 3.0, 500))
+    assert_consistent(index, ['DDD', 'CCC', 'BBB'])
+
+
+def test_equal_keys_and_unsortable_values(headless):
+    index = headless.ChannelIndex(key=lambda r: r['change'])
+    index.upsert('BBB', row('BBB', 1.0, 0))
+    index.upsert('AAA', row('AAA', 1.0, 0))
+    index.upsert('CCC', row('CCC', None, 0))  # non-numeric keys sort as 0
+    assert_consistent(index, ['CCC', 'AAA', 'BBB'])
+    index.remove('AAA')
+    assert_consistent(index, ['CCC', 'BBB'])
+
+
+def test_insertion_order_without_key(headless):
+    index = headless.ChannelIndex()
+    for symbol in ('XXX', 'AAA', 'MMM'):
+        index.upsert(symbol, row(symbol, 0, 0))
+    assert_consistent(index, ['XXX', 'AAA', 'MMM'])
+    index.set_order(key=None)
+    assert_consistent(index, ['XXX', 'AAA', 'MMM'])
+    index.clear()
+    assert_consistent(index, [])
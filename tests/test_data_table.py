@@ -0,0 +1,73 @@
+"""Data table (RecycleView) view selection, built without opening the app window."""
+import importlib.util
+import os
+import sys
+import types
+
+import pytest
+
+pytest.importorskip('kivy')
+pytest.importorskip('pygame')
+pytest.importorskip('tkinter')
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope='module')
+def scan(tmp_path_factory):
+    os.environ.setdefault('KIVY_NO_ARGS', '1')
+    os.environ.setdefault('KIVY_NO_CONSOLELOG', '1')
+    os.environ.setdefault('KIVY_NO_FILELOG', '1')
+    cwd = os.getcwd()
+    os.chdir(tmp_path_factory.mktemp('scan'))  # 193.py creates cache/ in the working directory
+    argv = sys.argv
+    sys.argv = [argv[0]]
+    try:
+        spec = importlib.util.spec_from_file_location('signalscan_193', os.path.join(ROOT, '193.py'))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        yield module
+    finally:
+        sys.argv = argv
+        os.chdir(cwd)
+
+
+def fake_app(scan, channel):
+    return types.SimpleNamespace(
+        live_data={
+            'RunUp': [scan.ChannelRow('AAA', 2.5, 12.0, 1000, 50000, 1e6, 3.0),
+                      scan.ChannelRow('BBB', 4.1, -3.0, 500, 20000, 2e6, 1.5)],
+            'Halts': [['HLT', '09:31:05', 'LUDP'], ['HLT2', '10:02:00', 'T1']],
+        },
+        current_channel=channel,
+        data_table=scan.build_data_table(),
+        table_rows={},
+        stock_news={},
+        format_channel_cell=lambda row, col: str(row[col]),
+        news_button_style=lambda ticker, labels: (labels[2], (0, 0, 0, 1), (1, 1, 1, 1)),
+    )
+
+
+def rendered_views(scan, app):
+    scan.SignalScanApp.refresh_data_table(app)
+    table = app.data_table
+    table.size = (1000, 600)
+    table.refresh_views()
+    return sorted((index, type(view).__name__) for index, view in table.view_adapter.views.items())
+
+
+def test_table_viewclass_settings_survive_construction(scan):
+    table = scan.build_data_table()
+    assert table.viewclass is scan.ChannelRowView
+    assert table.key_viewclass == 'viewclass'
+
+
+def test_channel_rows_use_channel_row_view(scan):
+    app = fake_app(scan, 'RunUp')
+    assert rendered_views(scan, app) == [(0, 'ChannelRowView'), (1, 'ChannelRowView')]
+    assert app.table_rows == {'AAA': [0], 'BBB': [1]}
+
+
+def test_halt_rows_use_halt_row_view(scan):
+    app = fake_app(scan, 'Halts')
+    assert rendered_views(scan, app) == [(0, 'HaltRowView'), (1, 'HaltRowView')]
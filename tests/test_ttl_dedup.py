@@ -0,0 +1,50 @@
+"""TTLDedup expiry and generation rotation against a fake clock."""
+import pytest
+
+
+@pytest.fixture
+def clock(headless, monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(headless.time, 'time', lambda: now[0])
+    return now
+
+
+def test_check_and_add_is_true_only_after_first_sighting(headless, clock):
+    dedup = headless.TTLDedup(600, generations=6)
+    assert dedup.check_and_add('https://example.com/a') is False
+    assert dedup.check_and_add('https://example.com/a') is True
+    assert dedup.check_and_add('https://example.com/a') is True
+    assert dedup.check_and_add('https://example.com/b') is False
+    assert len(dedup) == 2
+
+
+def test_generations_rotate_at_ttl_over_generations(headless, clock):
+    dedup = headless.TTLDedup(600, generations=6)
+    dedup.add('a')
+    clock[0] += 99
+    dedup.add('b')
+    assert len(dedup.ring) == 1
+    clock[0] += 1  # 100s = 600 / 6
+    dedup.add('c')
+    assert len(dedup.ring) == 2
+    assert [len(keys) for _, keys, _ in dedup.ring] == [2, 1]
+
+
+def test_keys_expire_after_one_ttl_idle(headless, clock):
+    dedup = headless.TTLDedup(600, generations=6)
+    dedup.add('a')
+    clock[0] += 599
+    assert 'a' in dedup
+    clock[0] += 2
+    assert 'a' not in dedup
+    assert dedup.check_and_add('a') is False
+    assert dedup.stats['expired'] == 1
+
+
+def test_bloom_filter_keeps_answers_exact(headless, clock):
+    dedup = headless.TTLDedup(600, generations=6, bloom_bits=1024)
+    for i in range(50):
+        assert dedup.check_and_add(f"k{i}") is False
+        clock[0] += 10
+    assert all(f"k{i}" in dedup for i in range(45, 50))
+    assert 'missing' not in dedup